@@ -1,12 +1,19 @@
 """User authorization functionality for the Telegram bot."""
 
 import logging
+import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+def _allow_all(user_id: int) -> bool:
+    """Membership check used when no restrictions apply."""
+    return True
+
+
 class AuthorizationMode(Enum):
     """Authorization modes for the bot.
 
@@ -21,6 +28,63 @@ class AuthorizationMode(Enum):
     ADMIN_ONLY = "admin_only"
 
 
+_MODE_LOOKUP = {m.value: m for m in AuthorizationMode}
+
+# User-facing authorization messages
+OPEN_AUTHORIZATION_MESSAGE = "This bot is open to all users."
+
+AUTHORIZATION_MESSAGES = {
+    AuthorizationMode.ADMIN_ONLY: (
+        "⚠️ This bot is in admin-only mode.\n"
+        "Only authorized administrators can use this bot."
+    ),
+    AuthorizationMode.WHITELIST: (
+        "⚠️ This bot is in whitelist mode.\n"
+        "Only whitelisted users can use this bot.\n"
+        "Contact the administrator for access."
+    ),
+}
+
+DEFAULT_UNAUTHORIZED_MESSAGE = (
+    "🚫 *Access Denied*\n\n"
+    "You are not authorized to use this bot."
+)
+
+UNAUTHORIZED_MESSAGES = {
+    AuthorizationMode.ADMIN_ONLY: (
+        "🚫 *Access Denied*\n\n"
+        "This bot is in admin-only mode.\n"
+        "You are not authorized to use this bot."
+    ),
+    AuthorizationMode.WHITELIST: (
+        "🚫 *Access Denied*\n\n"
+        "This bot is in whitelist mode.\n"
+        "You are not on the authorized users list.\n"
+        "Please contact the administrator for access."
+    ),
+}
+
+# Matches a comma-separated item consisting solely of digits (surrounding
+# whitespace allowed), so entries like "-1" or "abc" are skipped.
+_ID_RE = re.compile(r"(?:^|,)\s*(\d+)\s*(?=,|$)")
+
+
+def _parse_user_ids(ids_str: str | None) -> set[int]:
+    """Parse a comma-separated string of positive Telegram user IDs.
+
+    Args:
+        ids_str: Comma-separated user IDs. Invalid entries are ignored.
+
+    Returns:
+        Set of parsed user IDs.
+    """
+    if not ids_str:
+        return set()
+    ids = set(map(int, _ID_RE.findall(ids_str)))
+    ids.discard(0)
+    return ids
+
+
 @dataclass
 class AuthorizationConfig:
     """Configuration for user authorization.
@@ -54,30 +118,9 @@ class AuthorizationConfig:
         Returns:
             AuthorizationConfig instance.
         """
-        # Parse mode
-        mode = AuthorizationMode.OPEN
-        if mode_str:
-            mode_str_lower = mode_str.lower().strip()
-            for m in AuthorizationMode:
-                if m.value == mode_str_lower:
-                    mode = m
-                    break
-
-        # Parse admin IDs
-        admin_ids: set[int] = set()
-        if admin_ids_str:
-            for id_str in admin_ids_str.split(","):
-                id_str = id_str.strip()
-                if id_str.isdigit() and int(id_str) > 0:
-                    admin_ids.add(int(id_str))
-
-        # Parse whitelist IDs
-        whitelist_ids: set[int] = set()
-        if whitelist_ids_str:
-            for id_str in whitelist_ids_str.split(","):
-                id_str = id_str.strip()
-                if id_str.isdigit() and int(id_str) > 0:
-                    whitelist_ids.add(int(id_str))
+        mode = _MODE_LOOKUP.get((mode_str or "").lower().strip(), AuthorizationMode.OPEN)
+        admin_ids = _parse_user_ids(admin_ids_str)
+        whitelist_ids = _parse_user_ids(whitelist_ids_str)
 
         # Enable authorization if not in OPEN mode
         enabled = mode != AuthorizationMode.OPEN
@@ -105,43 +148,63 @@ class UserAuthorization:
         """
         self.config = config or AuthorizationConfig()
 
+        # Snapshot the config so the per-message check avoids attribute chains
+        self._mode = self.config.mode
+        self._enabled = self.config.enabled
+        self._admins = self.config.admin_user_ids
+        self._whitelist = self.config.whitelisted_user_ids
+        self._restricted = self._enabled and self._mode is not AuthorizationMode.OPEN
+        # Whitelisted users and admins merged so WHITELIST mode needs one probe
+        self._allowed = self._whitelist | self._admins
+        self._auth_cache: dict[int, bool] = {}
+        self._check: Callable[[int], bool] = self._build_check()
+
+    @property
+    def is_restricted(self) -> bool:
+        """Whether access checks can deny any user."""
+        return self._restricted
+
     def is_authorized(self, user_id: int) -> bool:
         """Check if a user is authorized to use the bot.
 
+        Decisions are cached per user and invalidated whenever the
+        admin or whitelist sets change.
+
         Args:
             user_id: The Telegram user ID to check.
 
         Returns:
             True if the user is authorized, False otherwise.
         """
-        if not self.config.enabled:
+        if not self._restricted:
             return True
 
-        if self.config.mode == AuthorizationMode.OPEN:
-            return True
+        authorized = self._auth_cache.get(user_id)
+        if authorized is None:
+            authorized = self._check(user_id)
+            self._auth_cache[user_id] = authorized
 
-        if self.config.mode == AuthorizationMode.ADMIN_ONLY:
-            is_admin = user_id in self.config.admin_user_ids
-            if not is_admin:
-                logger.warning(
-                    "Unauthorized user (admin_only mode) user_id=%d",
-                    user_id,
-                )
-            return is_admin
-
-        if self.config.mode == AuthorizationMode.WHITELIST:
-            is_whitelisted = (
-                user_id in self.config.whitelisted_user_ids
-                or user_id in self.config.admin_user_ids
+        if not authorized:
+            logger.warning(
+                "Unauthorized user (%s mode) user_id=%d",
+                self._mode.value,
+                user_id,
             )
-            if not is_whitelisted:
-                logger.warning(
-                    "Unauthorized user (whitelist mode) user_id=%d",
-                    user_id,
-                )
-            return is_whitelisted
+        return authorized
+
+    def _build_check(self) -> Callable[[int], bool]:
+        """Build the membership check for the configured mode.
+
+        Returns:
+            A callable returning True if the given user ID is allowed.
+        """
+        if self._mode is AuthorizationMode.ADMIN_ONLY:
+            return self._admins.__contains__
+
+        if self._mode is AuthorizationMode.WHITELIST:
+            return self._allowed.__contains__
 
-        return True
+        return _allow_all
 
     def is_admin(self, user_id: int) -> bool:
         """Check if a user is an admin.
@@ -152,7 +215,7 @@ class UserAuthorization:
         Returns:
             True if the user is an admin, False otherwise.
         """
-        return user_id in self.config.admin_user_ids
+        return user_id in self._admins
 
     def add_to_whitelist(self, user_id: int) -> None:
         """Add a user to the whitelist.
@@ -160,7 +223,9 @@ class UserAuthorization:
         Args:
             user_id: The Telegram user ID to add.
         """
-        self.config.whitelisted_user_ids.add(user_id)
+        self._whitelist.add(user_id)
+        self._allowed.add(user_id)
+        self._auth_cache.clear()
         logger.info("Added user to whitelist user_id=%d", user_id)
 
     def remove_from_whitelist(self, user_id: int) -> None:
@@ -169,7 +234,10 @@ class UserAuthorization:
         Args:
             user_id: The Telegram user ID to remove.
         """
-        self.config.whitelisted_user_ids.discard(user_id)
+        self._whitelist.discard(user_id)
+        if user_id not in self._admins:
+            self._allowed.discard(user_id)
+        self._auth_cache.clear()
         logger.info("Removed user from whitelist user_id=%d", user_id)
 
     def add_admin(self, user_id: int) -> None:
@@ -178,7 +246,9 @@ class UserAuthorization:
         Args:
             user_id: The Telegram user ID to add as admin.
         """
-        self.config.admin_user_ids.add(user_id)
+        self._admins.add(user_id)
+        self._allowed.add(user_id)
+        self._auth_cache.clear()
         logger.info("Added admin user user_id=%d", user_id)
 
     def remove_admin(self, user_id: int) -> None:
@@ -187,7 +257,10 @@ class UserAuthorization:
         Args:
             user_id: The Telegram user ID to remove from admins.
         """
-        self.config.admin_user_ids.discard(user_id)
+        self._admins.discard(user_id)
+        if user_id not in self._whitelist:
+            self._allowed.discard(user_id)
+        self._auth_cache.clear()
         logger.info("Removed admin user user_id=%d", user_id)
 
     def get_authorization_message(self) -> str:
@@ -196,23 +269,10 @@ class UserAuthorization:
         Returns:
             A user-friendly message about authorization.
         """
-        if not self.config.enabled or self.config.mode == AuthorizationMode.OPEN:
-            return "This bot is open to all users."
-
-        if self.config.mode == AuthorizationMode.ADMIN_ONLY:
-            return (
-                "⚠️ This bot is in admin-only mode.\n"
-                "Only authorized administrators can use this bot."
-            )
-
-        if self.config.mode == AuthorizationMode.WHITELIST:
-            return (
-                "⚠️ This bot is in whitelist mode.\n"
-                "Only whitelisted users can use this bot.\n"
-                "Contact the administrator for access."
-            )
+        if not self._restricted:
+            return OPEN_AUTHORIZATION_MESSAGE
 
-        return "Authorization is configured."
+        return AUTHORIZATION_MESSAGES.get(self._mode, "Authorization is configured.")
 
     def get_unauthorized_message(self) -> str:
         """Get a message to show unauthorized users.
@@ -220,22 +280,4 @@ class UserAuthorization:
         Returns:
             A message explaining that the user is not authorized.
         """
-        if self.config.mode == AuthorizationMode.ADMIN_ONLY:
-            return (
-                "🚫 *Access Denied*\n\n"
-                "This bot is in admin-only mode.\n"
-                "You are not authorized to use this bot."
-            )
-
-        if self.config.mode == AuthorizationMode.WHITELIST:
-            return (
-                "🚫 *Access Denied*\n\n"
-                "This bot is in whitelist mode.\n"
-                "You are not on the authorized users list.\n"
-                "Please contact the administrator for access."
-            )
-
-        return (
-            "🚫 *Access Denied*\n\n"
-            "You are not authorized to use this bot."
-        )
+        return UNAUTHORIZED_MESSAGES.get(self._mode, DEFAULT_UNAUTHORIZED_MESSAGE)
@@ -1,10 +1,15 @@
 """Telegram bot handlers."""
 
+import asyncio
+import contextlib
 import csv
+import functools
 import hashlib
 import io
 import os
+import tempfile
 import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
 
 from telegram import InputFile, Update
@@ -18,12 +23,12 @@ from telegram.ext import (
 
 from .authorization import UserAuthorization
 from .config import Config
-from .database import DatabaseManager
+from .database import DatabaseManager, Transaction
 from .health import HealthCheckServer, HealthStatus
 from .logging_config import get_logger
 from .pdf_parser import MercadoPagoPDFParser
 from .rate_limiter import RateLimiter
-from .sheets import GoogleSheetsManager
+from .sheets import SHEET_HEADERS, GoogleSheetsManager
 
 logger = get_logger(__name__)
 
@@ -33,11 +38,165 @@ WEBHOOK_HOST = "0.0.0.0"
 # PDF validation constants
 MAX_PDF_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB max file size
 PDF_MAGIC_BYTES = b"%PDF"  # PDF files start with this signature
+MAX_PDF_SIZE_MB = MAX_PDF_SIZE_BYTES // (1024 * 1024)
+
+# PDF validation messages
+NOT_PDF_MESSAGE = "⚠️ Please send a PDF file. I can only process PDF documents."
+FILE_TOO_LARGE_MESSAGE = f"⚠️ File too large. Maximum allowed size is {MAX_PDF_SIZE_MB} MB."
+INVALID_PDF_MESSAGE = (
+    "⚠️ Invalid PDF file. The file does not appear to be a valid PDF document."
+)
+DUPLICATE_TRANSACTION_MESSAGE = "⚠️ This transaction has already been processed."
+
+# Seconds to wait for a free connection in the httpx pool that
+# python-telegram-bot shares between API calls and file downloads
+TELEGRAM_POOL_TIMEOUT_SECONDS = 10.0
+
+# PDF processing progress messages; the analyzing notice is only sent when
+# parsing takes longer than ANALYZING_NOTICE_DELAY_SECONDS
+DOWNLOADING_MESSAGE = "📥 Downloading PDF..."
+ANALYZING_MESSAGE = "🔍 Analyzing transaction..."
+ANALYZING_NOTICE_DELAY_SECONDS = 2.0
+
+# Google Sheets write batching: flush once this many rows are queued, or once
+# the oldest queued row has waited this long
+SHEETS_BATCH_SIZE = 50
+SHEETS_FLUSH_INTERVAL_SECONDS = 2.0
+
+# Attempts per Sheets batch before its rows are dropped, and the delay before
+# the first retry (doubled for each further retry)
+SHEETS_MAX_ATTEMPTS = 3
+SHEETS_RETRY_DELAY_SECONDS = 1.0
+
+# Column of the transaction ID in rows built by GoogleSheetsManager.build_row
+SHEETS_TRANSACTION_ID_COLUMN = SHEET_HEADERS.index("Transaction ID")
+
+# /report periods: argument -> (lookback window or None for all time, label)
+REPORT_PERIODS: dict[str, tuple[timedelta | None, str]] = {
+    "week": (timedelta(days=7), "last 7 days"),
+    "month": (timedelta(days=30), "last 30 days"),
+    "year": (timedelta(days=365), "last year"),
+    "all": (None, "all time"),
+}
+DEFAULT_REPORT_PERIOD = REPORT_PERIODS["month"]
+
+# Static bot messages
+WELCOME_MESSAGE = (
+    "🌿 *Welcome to Treecko Finance Bot!*\n\n"
+    "I'm your personal finance assistant. Here's what I can do:\n\n"
+    "📄 *Process MercadoPago PDFs*\n"
+    "Send me a PDF receipt from MercadoPago and I'll:\n"
+    "• Extract the transaction details\n"
+    "• Store it in the database\n"
+    "• Add it to your Google Sheets report\n\n"
+    "📊 *Commands*\n"
+    "/start - Show this welcome message\n"
+    "/help - Get help\n"
+    "/status - Check bot status\n"
+    "/report - View transaction summary\n"
+    "/export - Download transactions as CSV\n"
+    "/categories - Manage custom categories\n\n"
+    "Just send me a PDF to get started! 📤"
+)
+
+HELP_TEXT = (
+    "🌿 *Treecko Finance Bot Help*\n\n"
+    "*How to use:*\n"
+    "1. Download your transaction receipt from MercadoPago as PDF\n"
+    "2. Send the PDF to this chat\n"
+    "3. I'll process it and store the transaction\n\n"
+    "*Commands:*\n"
+    "/start - Welcome message\n"
+    "/help - This help message\n"
+    "/status - Check configuration status\n"
+    "/report - View transaction summary\n"
+    "/export - Download transactions as CSV\n"
+    "/categories - List all categories\n"
+    "/addcategory - Add a new category\n"
+    "/setcategory - Set category for a transaction\n"
+    "/deletecategory - Delete a category\n\n"
+    "*Report Options:*\n"
+    "`/report week` - Last 7 days\n"
+    "`/report month` - Last 30 days (default)\n"
+    "`/report year` - Last 365 days\n"
+    "`/report all` - All time\n\n"
+    "*Tips:*\n"
+    "• Make sure the PDF is readable\n"
+    "• One PDF per message works best\n"
+    "• Transactions are automatically categorized"
+)
+
+STATUS_TEMPLATE = (
+    "🌿 *Treecko Bot Status*\n\n"
+    "📦 *Database:* {db}\n"
+    "📊 *Google Sheets:* {sheets}\n"
+)
+
+# /status replies pre-rendered for each Google Sheets state; the database is
+# always configured once the bot is constructed
+STATUS_MESSAGES: dict[bool, str] = {
+    True: STATUS_TEMPLATE.format(db="✅ Connected", sheets="✅ Configured"),
+    False: STATUS_TEMPLATE.format(db="✅ Connected", sheets="⚠️ Not configured"),
+}
+
+
+def _format_timestamp(value: datetime | None) -> str:
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS' for CSV export.
+
+    Uses ``isoformat`` rather than ``strftime`` since it skips format-string
+    parsing, which adds up on large exports.
+
+    Args:
+        value: Datetime to format, or None.
+
+    Returns:
+        Formatted timestamp, or an empty string if value is None.
+    """
+    return value.isoformat(sep=" ", timespec="seconds") if value else ""
+
+
+Handler = Callable[["TreeckoBot", Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]
+
+
+def _requires_access(handler: Handler) -> Handler:
+    """Decorate a handler so it only runs if the update passes access checks.
+
+    Args:
+        handler: The bot handler method to wrap.
+
+    Returns:
+        The wrapped handler.
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(
+        self: "TreeckoBot", update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> None:
+        if not await self._check_access(update, context):
+            return
+        await handler(self, update, context)
+
+    return wrapper
 
 
 class TreeckoBot:
     """Telegram bot for personal finance management."""
 
+    __slots__ = (
+        "config",
+        "db",
+        "pdf_parser",
+        "sheets",
+        "rate_limiter",
+        "authorization",
+        "_auth_required",
+        "_health_server",
+        "_webhook_token_hash",
+        "_sheets_ready",
+        "_sheets_queue",
+        "_sheets_worker",
+    )
+
     def __init__(self, config: Config) -> None:
         """Initialize the bot.
 
@@ -51,17 +210,154 @@ class TreeckoBot:
         self._health_server: HealthCheckServer | None = None
         self.rate_limiter = RateLimiter(config.rate_limit_config)
         self.authorization = UserAuthorization(config.auth_config)
+        # Open mode never denies anyone, so skip the check on the hot path
+        self._auth_required = self.authorization.is_restricted
+
+        # Short digest of the token used as the webhook path, so the full
+        # token never appears in server logs
+        self._webhook_token_hash = hashlib.blake2b(
+            config.telegram_token.encode(), digest_size=8
+        ).hexdigest()
 
         if config.google_sheet_id and config.google_credentials_path:
-            if os.path.exists(config.google_credentials_path):
+            if config.google_credentials_exists:
                 self.sheets = GoogleSheetsManager(
                     config.google_credentials_path, config.google_sheet_id
                 )
             else:
                 logger.warning(
-                    f"Google credentials file not found: {config.google_credentials_path}"
+                    "Google credentials file not found: %s", config.google_credentials_path
                 )
 
+        self._sheets_ready = False
+        self.refresh_sheets_status()
+
+        # Rows waiting to be appended to Google Sheets; ``None`` stops the worker
+        self._sheets_queue: asyncio.Queue[list | None] = asyncio.Queue()
+        self._sheets_worker: asyncio.Task | None = None
+
+    def refresh_sheets_status(self) -> None:
+        """Recompute whether Google Sheets is ready to receive transactions.
+
+        The result is cached since the configuration does not change at
+        runtime; call this again after replacing or reconfiguring ``sheets``.
+        """
+        self._sheets_ready = self.sheets is not None and self.sheets.is_configured()
+
+    async def _append_sheets_batch(self, rows: list[list]) -> bool:
+        """Append one batch of rows to Google Sheets, retrying on failure.
+
+        A batch still failing after ``SHEETS_MAX_ATTEMPTS`` is dropped and its
+        transaction IDs are logged at error level.
+
+        Args:
+            rows: At most ``SHEETS_BATCH_SIZE`` rows.
+
+        Returns:
+            True if the rows were written, False if they were dropped.
+        """
+        delay = SHEETS_RETRY_DELAY_SECONDS
+        for attempt in range(1, SHEETS_MAX_ATTEMPTS + 1):
+            try:
+                if await asyncio.to_thread(self.sheets.append_rows, rows):
+                    return True
+            except Exception as e:
+                logger.warning("Google Sheets append raised: %s", e)
+            if attempt < SHEETS_MAX_ATTEMPTS:
+                await asyncio.sleep(delay)
+                delay *= 2
+
+        logger.error(
+            "Dropped %d rows after %d failed Google Sheets appends",
+            len(rows),
+            SHEETS_MAX_ATTEMPTS,
+            transaction_ids=[row[SHEETS_TRANSACTION_ID_COLUMN] for row in rows],
+        )
+        return False
+
+    async def _write_sheets_rows(self, rows: list[list]) -> int:
+        """Append rows to Google Sheets in batches, each in a worker thread.
+
+        Args:
+            rows: Rows built with ``GoogleSheetsManager.build_row``.
+
+        Returns:
+            Number of rows written; failed batches are logged and dropped.
+        """
+        written = 0
+        for start in range(0, len(rows), SHEETS_BATCH_SIZE):
+            batch = rows[start : start + SHEETS_BATCH_SIZE]
+            if await self._append_sheets_batch(batch):
+                written += len(batch)
+        return written
+
+    async def flush_sheets_queue(self) -> int:
+        """Write every row currently queued for Google Sheets.
+
+        Returns:
+            Number of rows written.
+        """
+        rows = []
+        while not self._sheets_queue.empty():
+            row = self._sheets_queue.get_nowait()
+            if row is not None:
+                rows.append(row)
+
+        if not rows:
+            return 0
+        return await self._write_sheets_rows(rows)
+
+    async def _run_sheets_worker(self) -> None:
+        """Drain the Sheets queue in batches until a ``None`` sentinel arrives."""
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self._sheets_queue.get()
+            if row is None:
+                return
+
+            rows = [row]
+            stopping = False
+            deadline = loop.time() + SHEETS_FLUSH_INTERVAL_SECONDS
+            while len(rows) < SHEETS_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._sheets_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                rows.append(row)
+
+            await self._write_sheets_rows(rows)
+
+            if stopping:
+                return
+
+    async def _start_sheets_worker(self, application: Application) -> None:
+        """Start the background Sheets writer (``post_init`` hook).
+
+        Args:
+            application: The Telegram Application instance.
+        """
+        if self._sheets_ready and self._sheets_worker is None:
+            self._sheets_worker = asyncio.create_task(self._run_sheets_worker())
+
+    async def _stop_sheets_worker(self, application: Application) -> None:
+        """Stop the Sheets writer and flush anything still queued (``post_stop`` hook).
+
+        Args:
+            application: The Telegram Application instance.
+        """
+        if self._sheets_worker is not None:
+            self._sheets_queue.put_nowait(None)
+            await self._sheets_worker
+            self._sheets_worker = None
+        if self._sheets_ready:
+            await self.flush_sheets_queue()
+
     def _get_health_status(self) -> HealthStatus:
         """Get current health status for health check endpoint.
 
@@ -72,7 +368,7 @@ class TreeckoBot:
             status="healthy",
             timestamp=time.time(),
             database_connected=self.db is not None,
-            sheets_configured=self.sheets is not None and self.sheets.is_configured(),
+            sheets_configured=self._sheets_ready,
         )
 
     async def _check_access(
@@ -87,13 +383,14 @@ class TreeckoBot:
         Returns:
             True if access is granted, False otherwise.
         """
-        if not update.effective_user:
+        user = update.effective_user
+        if not user:
             return False
 
-        user_id = update.effective_user.id
+        user_id = user.id
 
-        # Check authorization
-        if not self.authorization.is_authorized(user_id):
+        # Check authorization (decisions are cached per user by UserAuthorization)
+        if self._auth_required and not self.authorization.is_authorized(user_id):
             message = self.authorization.get_unauthorized_message()
             if update.message:
                 await update.message.reply_text(message, parse_mode="Markdown")
@@ -114,6 +411,7 @@ class TreeckoBot:
 
         return True
 
+    @_requires_access
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle the /start command.
 
@@ -121,28 +419,9 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
-        welcome_message = (
-            "🌿 *Welcome to Treecko Finance Bot!*\n\n"
-            "I'm your personal finance assistant. Here's what I can do:\n\n"
-            "📄 *Process MercadoPago PDFs*\n"
-            "Send me a PDF receipt from MercadoPago and I'll:\n"
-            "• Extract the transaction details\n"
-            "• Store it in the database\n"
-            "• Add it to your Google Sheets report\n\n"
-            "📊 *Commands*\n"
-            "/start - Show this welcome message\n"
-            "/help - Get help\n"
-            "/status - Check bot status\n"
-            "/report - View transaction summary\n"
-            "/export - Download transactions as CSV\n"
-            "/categories - Manage custom categories\n\n"
-            "Just send me a PDF to get started! 📤"
-        )
-        await update.message.reply_text(welcome_message, parse_mode="Markdown")
+        await update.message.reply_text(WELCOME_MESSAGE, parse_mode="Markdown")
 
+    @_requires_access
     async def help_command(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -152,37 +431,9 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
-        help_text = (
-            "🌿 *Treecko Finance Bot Help*\n\n"
-            "*How to use:*\n"
-            "1. Download your transaction receipt from MercadoPago as PDF\n"
-            "2. Send the PDF to this chat\n"
-            "3. I'll process it and store the transaction\n\n"
-            "*Commands:*\n"
-            "/start - Welcome message\n"
-            "/help - This help message\n"
-            "/status - Check configuration status\n"
-            "/report - View transaction summary\n"
-            "/export - Download transactions as CSV\n"
-            "/categories - List all categories\n"
-            "/addcategory - Add a new category\n"
-            "/setcategory - Set category for a transaction\n"
-            "/deletecategory - Delete a category\n\n"
-            "*Report Options:*\n"
-            "`/report week` - Last 7 days\n"
-            "`/report month` - Last 30 days (default)\n"
-            "`/report year` - Last 365 days\n"
-            "`/report all` - All time\n\n"
-            "*Tips:*\n"
-            "• Make sure the PDF is readable\n"
-            "• One PDF per message works best\n"
-            "• Transactions are automatically categorized"
-        )
-        await update.message.reply_text(help_text, parse_mode="Markdown")
+        await update.message.reply_text(HELP_TEXT, parse_mode="Markdown")
 
+    @_requires_access
     async def status(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle the /status command.
 
@@ -190,21 +441,11 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
-        db_status = "✅ Connected" if self.db else "❌ Not configured"
-        sheets_status = (
-            "✅ Configured" if self.sheets and self.sheets.is_configured() else "⚠️ Not configured"
+        await update.message.reply_text(
+            STATUS_MESSAGES[self._sheets_ready], parse_mode="Markdown"
         )
 
-        status_text = (
-            "🌿 *Treecko Bot Status*\n\n"
-            f"📦 *Database:* {db_status}\n"
-            f"📊 *Google Sheets:* {sheets_status}\n"
-        )
-        await update.message.reply_text(status_text, parse_mode="Markdown")
-
+    @_requires_access
     async def report(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle the /report command for transaction summaries.
 
@@ -212,29 +453,19 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
         # Parse optional date range from arguments
-        args = context.args or []
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=30)  # Default: last 30 days
-        period_text = "last 30 days"
-
-        if args:
-            period = args[0].lower()
-            if period == "week":
-                start_date = end_date - timedelta(days=7)
-                period_text = "last 7 days"
-            elif period == "month":
-                start_date = end_date - timedelta(days=30)
-                period_text = "last 30 days"
-            elif period == "year":
-                start_date = end_date - timedelta(days=365)
-                period_text = "last year"
-            elif period == "all":
-                start_date = None
-                period_text = "all time"
+        args = context.args
+        delta, period_text = (
+            REPORT_PERIODS.get(args[0].lower(), DEFAULT_REPORT_PERIOD)
+            if args
+            else DEFAULT_REPORT_PERIOD
+        )
+        if delta is None:
+            # Unbounded, so the summary can be served from the monthly rollup
+            start_date = end_date = None
+        else:
+            end_date = datetime.now()
+            start_date = end_date - delta
 
         summary = self.db.get_transaction_summary(start_date, end_date)
 
@@ -255,6 +486,7 @@ class TreeckoBot:
         )
         await update.message.reply_text(report_text, parse_mode="Markdown")
 
+    @_requires_access
     async def export(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         """Handle the /export command to download transactions as CSV.
 
@@ -262,21 +494,12 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
-        transactions = self.db.get_all_transactions()
-
-        if not transactions:
-            await update.message.reply_text(
-                "📭 No transactions to export.\n"
-                "Send me a MercadoPago PDF to get started!"
-            )
-            return
-
-        # Create CSV in memory
-        output = io.StringIO()
-        writer = csv.writer(output)
+        # Encode the CSV straight into a single bytes buffer
+        csv_file = io.BytesIO()
+        text_stream = io.TextIOWrapper(
+            csv_file, encoding="utf-8", newline="", write_through=True
+        )
+        writer = csv.writer(text_stream)
 
         # Write header
         writer.writerow([
@@ -290,30 +513,60 @@ class TreeckoBot:
             "Created At",
         ])
 
-        # Write transactions
-        for tx in transactions:
+        # Write transactions as they are streamed from the database
+        count = 0
+        rows = self.db.iter_transaction_rows(
+            Transaction.date,
+            Transaction.description,
+            Transaction.amount,
+            Transaction.transaction_type,
+            Transaction.category,
+            Transaction.merchant,
+            Transaction.transaction_id,
+            Transaction.created_at,
+        )
+        for (
+            date,
+            description,
+            amount,
+            transaction_type,
+            category,
+            merchant,
+            transaction_id,
+            created_at,
+        ) in rows:
+            count += 1
             writer.writerow([
-                tx.date.strftime("%Y-%m-%d %H:%M:%S") if tx.date else "",
-                tx.description or "",
-                tx.amount,
-                tx.transaction_type or "",
-                tx.category or "",
-                tx.merchant or "",
-                tx.transaction_id or "",
-                tx.created_at.strftime("%Y-%m-%d %H:%M:%S") if tx.created_at else "",
+                _format_timestamp(date),
+                description or "",
+                amount,
+                transaction_type or "",
+                category or "",
+                merchant or "",
+                transaction_id or "",
+                _format_timestamp(created_at),
             ])
 
-        # Send as file
-        csv_bytes = output.getvalue().encode("utf-8")
-        csv_file = io.BytesIO(csv_bytes)
+        # Detach so the wrapper doesn't close the buffer when collected
+        text_stream.detach()
+
+        if not count:
+            await update.message.reply_text(
+                "📭 No transactions to export.\n"
+                "Send me a MercadoPago PDF to get started!"
+            )
+            return
+
+        csv_file.seek(0)
         csv_file.name = f"transactions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
         await update.message.reply_document(
             document=InputFile(csv_file, filename=csv_file.name),
-            caption=f"📥 *Exported {len(transactions)} transactions*",
+            caption=f"📥 *Exported {count} transactions*",
             parse_mode="Markdown",
         )
 
+    @_requires_access
     async def categories(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -323,9 +576,6 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
         categories = self.db.get_all_categories()
 
         if not categories:
@@ -345,6 +595,7 @@ class TreeckoBot:
         )
         await update.message.reply_text(response, parse_mode="Markdown")
 
+    @_requires_access
     async def addcategory(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -354,9 +605,6 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "⚠️ Please provide a category name.\n\n"
@@ -380,12 +628,13 @@ class TreeckoBot:
                 parse_mode="Markdown",
             )
         except Exception as e:
-            logger.error(f"Error creating category: {e}", exc_info=True)
+            logger.error("Error creating category: %s", e, exc_info=True)
             await update.message.reply_text(
                 f"❌ Error creating category: {str(e)}",
                 parse_mode="Markdown",
             )
 
+    @_requires_access
     async def setcategory(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -395,9 +644,6 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
         if not context.args or len(context.args) < 2:
             await update.message.reply_text(
                 "⚠️ Please provide transaction ID and category name.\n\n"
@@ -443,6 +689,7 @@ class TreeckoBot:
                 parse_mode="Markdown",
             )
 
+    @_requires_access
     async def deletecategory(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -452,9 +699,6 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
         if not context.args:
             await update.message.reply_text(
                 "⚠️ Please provide a category name.\n\n"
@@ -481,6 +725,7 @@ class TreeckoBot:
                 parse_mode="Markdown",
             )
 
+    @_requires_access
     async def handle_document(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -490,51 +735,58 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
         document = update.message.document
 
         if not document.file_name.lower().endswith(".pdf"):
-            await update.message.reply_text(
-                "⚠️ Please send a PDF file. I can only process PDF documents."
-            )
+            await update.message.reply_text(NOT_PDF_MESSAGE)
             return
 
         # Validate file size before downloading
-        if document.file_size and document.file_size > MAX_PDF_SIZE_BYTES:
-            max_size_mb = MAX_PDF_SIZE_BYTES / (1024 * 1024)
-            await update.message.reply_text(
-                f"⚠️ File too large. Maximum allowed size is {max_size_mb:.0f} MB."
-            )
+        if (document.file_size or 0) > MAX_PDF_SIZE_BYTES:
+            await update.message.reply_text(FILE_TOO_LARGE_MESSAGE)
             return
 
-        await update.message.reply_text("📥 Downloading PDF...")
-
+        pdf_path: str | None = None
         try:
-            file = await context.bot.get_file(document.file_id)
-            pdf_bytes = await file.download_as_bytearray()
+            # Resolve the file while the progress message is in flight
+            _, file = await asyncio.gather(
+                update.message.reply_text(DOWNLOADING_MESSAGE),
+                context.bot.get_file(document.file_id),
+            )
+
+            # Download to disk so the PDF isn't held in memory while parsing;
+            # PDFium reads the file on demand
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
+                pdf_path = tmp_file.name
+            await file.download_to_drive(custom_path=pdf_path)
 
             # Validate PDF content (magic bytes check)
-            if not bytes(pdf_bytes[:4]).startswith(PDF_MAGIC_BYTES):
-                await update.message.reply_text(
-                    "⚠️ Invalid PDF file. The file does not appear to be a valid PDF document."
-                )
+            with open(pdf_path, "rb") as pdf_file:
+                header = pdf_file.read(len(PDF_MAGIC_BYTES))
+            if header != PDF_MAGIC_BYTES:
+                await update.message.reply_text(INVALID_PDF_MESSAGE)
                 return
 
-            await update.message.reply_text("🔍 Analyzing transaction...")
-
-            transaction = self.pdf_parser.parse_from_bytes(bytes(pdf_bytes))
+            # Parsing is CPU-bound and the lookup hits SQLite; run both off the
+            # event loop so other updates keep being served
+            parse_task = asyncio.ensure_future(
+                asyncio.to_thread(self.pdf_parser.parse, pdf_path)
+            )
+            done, _ = await asyncio.wait(
+                {parse_task}, timeout=ANALYZING_NOTICE_DELAY_SECONDS
+            )
+            if not done:
+                await update.message.reply_text(ANALYZING_MESSAGE)
+            transaction = await parse_task
 
-            if transaction.transaction_id and self.db.transaction_exists(
-                transaction.transaction_id
+            if transaction.transaction_id and await asyncio.to_thread(
+                self.db.transaction_exists, transaction.transaction_id
             ):
-                await update.message.reply_text(
-                    "⚠️ This transaction has already been processed."
-                )
+                await update.message.reply_text(DUPLICATE_TRANSACTION_MESSAGE)
                 return
 
-            db_transaction = self.db.add_transaction(
+            db_transaction = await asyncio.to_thread(
+                self.db.add_transaction,
                 date=transaction.date,
                 description=transaction.description,
                 amount=transaction.amount,
@@ -544,52 +796,54 @@ class TreeckoBot:
                 raw_text=transaction.raw_text,
             )
 
-            sheets_status = ""
-            if self.sheets and self.sheets.is_configured():
-                success = self.sheets.add_transaction(
-                    date=transaction.date,
-                    description=transaction.description,
-                    amount=transaction.amount,
-                    transaction_type=transaction.transaction_type,
-                    merchant=transaction.merchant,
-                    transaction_id=transaction.transaction_id,
+            if self._sheets_ready:
+                # Appended in batches by the background Sheets worker
+                self._sheets_queue.put_nowait(
+                    self.sheets.build_row(
+                        date=transaction.date,
+                        description=transaction.description,
+                        amount=transaction.amount,
+                        transaction_type=transaction.transaction_type,
+                        merchant=transaction.merchant,
+                        transaction_id=transaction.transaction_id,
+                    )
                 )
-                if success:
-                    sheets_status = "✅ Added to Google Sheets"
-                else:
-                    sheets_status = "⚠️ Failed to add to Google Sheets"
+                sheets_status = "⏳ Queued for Google Sheets"
             else:
                 sheets_status = "⚠️ Google Sheets not configured"
 
             amount_sign = "+" if transaction.transaction_type == "income" else "-"
             emoji = "💰" if transaction.transaction_type == "income" else "💸"
 
-            response = (
-                f"{emoji} *Transaction Processed!*\n\n"
-                f"📅 *Date:* {transaction.date.strftime('%Y-%m-%d')}\n"
-                f"📝 *Description:* {transaction.description}\n"
-                f"💵 *Amount:* {amount_sign}${transaction.amount:,.2f}\n"
-                f"🏷️ *Type:* {transaction.transaction_type.capitalize()}\n"
-            )
-
+            parts = [
+                f"{emoji} *Transaction Processed!*\n",
+                f"📅 *Date:* {transaction.date.strftime('%Y-%m-%d')}",
+                f"📝 *Description:* {transaction.description}",
+                f"💵 *Amount:* {amount_sign}${transaction.amount:,.2f}",
+                f"🏷️ *Type:* {transaction.transaction_type.capitalize()}",
+            ]
             if transaction.merchant:
-                response += f"🏪 *Merchant:* {transaction.merchant}\n"
-
+                parts.append(f"🏪 *Merchant:* {transaction.merchant}")
             if transaction.transaction_id:
-                response += f"🔢 *ID:* {transaction.transaction_id}\n"
-
-            response += f"\n📦 *Database:* ✅ Stored (ID: {db_transaction.id})\n"
-            response += f"📊 *Sheets:* {sheets_status}"
+                parts.append(f"🔢 *ID:* {transaction.transaction_id}")
+            parts.append(f"\n📦 *Database:* ✅ Stored (ID: {db_transaction.id})")
+            parts.append(f"📊 *Sheets:* {sheets_status}")
+            response = "\n".join(parts)
 
             await update.message.reply_text(response, parse_mode="Markdown")
 
         except Exception as e:
-            logger.error(f"Error processing PDF: {e}", exc_info=True)
+            logger.error("Error processing PDF: %s", e, exc_info=True)
             await update.message.reply_text(
                 f"❌ Error processing PDF: {str(e)}\n\n"
                 "Please make sure this is a valid MercadoPago receipt."
             )
+        finally:
+            if pdf_path:
+                with contextlib.suppress(OSError):
+                    os.unlink(pdf_path)
 
+    @_requires_access
     async def handle_text(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ) -> None:
@@ -599,9 +853,6 @@ class TreeckoBot:
             update: Telegram update object.
             context: Telegram context object.
         """
-        if not await self._check_access(update, context):
-            return
-
         text = update.message.text
         response = (
             f"📝 Recibí tu mensaje: \"{text}\"\n\n"
@@ -616,7 +867,15 @@ class TreeckoBot:
         Returns:
             Configured Application instance.
         """
-        application = Application.builder().token(self.config.telegram_token).build()
+        application = (
+            Application.builder()
+            .token(self.config.telegram_token)
+            .pool_timeout(TELEGRAM_POOL_TIMEOUT_SECONDS)
+            .get_updates_pool_timeout(TELEGRAM_POOL_TIMEOUT_SECONDS)
+            .post_init(self._on_startup)
+            .post_stop(self._on_shutdown)
+            .build()
+        )
 
         # Command handlers
         application.add_handler(CommandHandler("start", self.start))
@@ -641,27 +900,42 @@ class TreeckoBot:
 
         return application
 
-    def _start_health_server(self) -> None:
-        """Start the health check server."""
+    async def _on_startup(self, application: Application) -> None:
+        """Start the health server and Sheets writer (``post_init`` hook).
+
+        Args:
+            application: The Telegram Application instance.
+        """
+        await self._start_health_server()
+        await self._start_sheets_worker(application)
+
+    async def _on_shutdown(self, application: Application) -> None:
+        """Stop the Sheets writer and health server (``post_stop`` hook).
+
+        Args:
+            application: The Telegram Application instance.
+        """
+        await self._stop_sheets_worker(application)
+        await self._stop_health_server()
+
+    async def _start_health_server(self) -> None:
+        """Start the health check server on the application's event loop."""
         self._health_server = HealthCheckServer(
             port=self.config.health_check_port,
             health_callback=self._get_health_status,
         )
-        self._health_server.start()
+        await self._health_server.start_async()
 
-    def _stop_health_server(self) -> None:
+    async def _stop_health_server(self) -> None:
         """Stop the health check server."""
         if self._health_server:
-            self._health_server.stop()
+            await self._health_server.stop_async()
             self._health_server = None
 
     def run(self) -> None:
         """Run the bot using webhook mode (if WEBHOOK_BASE_URL is set) or polling mode."""
         logger.info("Starting Treecko Finance Bot...")
 
-        # Start health check server
-        self._start_health_server()
-
         try:
             application = self.create_application()
 
@@ -670,7 +944,7 @@ class TreeckoBot:
             else:
                 self._run_polling(application)
         finally:
-            self._stop_health_server()
+            self.db.close()
 
     def _run_polling(self, application: Application) -> None:
         """Run the bot using long polling (for local development without tunnel).
@@ -687,14 +961,11 @@ class TreeckoBot:
         Args:
             application: The Telegram Application instance.
         """
-        # Build webhook URL using a hash of the token for security
-        # This prevents the full token from appearing in server logs
-        token_hash = hashlib.sha256(self.config.telegram_token.encode()).hexdigest()[:16]
-        webhook_path = f"/webhook/{token_hash}"
+        webhook_path = f"/webhook/{self._webhook_token_hash}"
         webhook_url = f"{self.config.webhook_base_url}{webhook_path}"
 
-        logger.info(f"Running bot in webhook mode on port {self.config.port}...")
-        logger.info(f"Webhook path: /webhook/{token_hash}")
+        logger.info("Running bot in webhook mode on port %d...", self.config.port)
+        logger.info("Webhook path: %s", webhook_path)
 
         application.run_webhook(
             listen=WEBHOOK_HOST,
@@ -1,8 +1,11 @@
 """Configuration settings for the Treecko Bot."""
 
+import functools
 import os
 import re
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from pathlib import Path
 from urllib.parse import urlparse
 
 from dotenv import load_dotenv
@@ -17,14 +20,25 @@ MIN_PORT = 1
 MAX_PORT = 65535
 VALID_DATABASE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
 
+# Values (lowercased) that enable a boolean environment flag
+TRUTHY_ENV_VALUES = frozenset({"true", "1", "yes"})
+
+# Telegram tokens have format: <bot_id>:<hash>
+# bot_id is numeric, hash is alphanumeric with underscores and dashes
+TELEGRAM_TOKEN_PATTERN = re.compile(r"\A\d+:[A-Za-z0-9_-]+\Z")
+
 # Default rate limiting values
 DEFAULT_RATE_LIMIT_MAX_REQUESTS = 10
 DEFAULT_RATE_LIMIT_WINDOW_SECONDS = 60
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Bot configuration."""
+    """Bot configuration.
+
+    Instances are immutable; use ``dataclasses.replace`` to derive a
+    modified copy.
+    """
 
     telegram_token: str
     google_credentials_path: str
@@ -35,23 +49,35 @@ class Config:
     health_check_port: int
     rate_limit_config: RateLimitConfig = field(default_factory=RateLimitConfig)
     auth_config: AuthorizationConfig = field(default_factory=AuthorizationConfig)
+    # Whether google_credentials_path pointed at a file when the config was
+    # built; derived from the path, including for copies made with replace()
+    google_credentials_exists: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Check once whether the Google credentials file exists."""
+        object.__setattr__(
+            self,
+            "google_credentials_exists",
+            Path(self.google_credentials_path).is_file(),
+        )
 
     @classmethod
     def from_env(cls) -> "Config":
         """Load configuration from environment variables."""
-        telegram_token = os.getenv("TELEGRAM_BOT_TOKEN")
+        env = os.environ
+        telegram_token = env.get("TELEGRAM_BOT_TOKEN")
         if not telegram_token:
             raise ValueError("TELEGRAM_BOT_TOKEN environment variable is required")
 
         # Validate token format (basic check for non-empty alphanumeric with colons)
         cls._validate_telegram_token(telegram_token)
 
-        google_credentials_path = os.getenv(
+        google_credentials_path = env.get(
             "GOOGLE_CREDENTIALS_PATH", "credentials.json"
         )
-        google_sheet_id = os.getenv("GOOGLE_SHEET_ID", "")
-        database_path = os.getenv("DATABASE_PATH", "transactions.db")
-        webhook_base_url = os.getenv("WEBHOOK_BASE_URL", "")
+        google_sheet_id = env.get("GOOGLE_SHEET_ID", "")
+        database_path = env.get("DATABASE_PATH", "transactions.db")
+        webhook_base_url = env.get("WEBHOOK_BASE_URL", "")
 
         # Validate webhook URL if provided
         if webhook_base_url:
@@ -60,7 +86,7 @@ class Config:
         # Validate database path
         cls._validate_database_path(database_path)
 
-        port_str = os.getenv("PORT", "8080")
+        port_str = env.get("PORT", "8080")
         try:
             port = int(port_str)
         except ValueError as e:
@@ -70,7 +96,7 @@ class Config:
         cls._validate_port(port)
 
         # Health check port (defaults to 8081)
-        health_check_port_str = os.getenv("HEALTH_CHECK_PORT", "8081")
+        health_check_port_str = env.get("HEALTH_CHECK_PORT", "8081")
         try:
             health_check_port = int(health_check_port_str)
         except ValueError as e:
@@ -82,10 +108,10 @@ class Config:
         cls._validate_port(health_check_port, "HEALTH_CHECK_PORT")
 
         # Rate limiting configuration
-        rate_limit_config = cls._load_rate_limit_config()
+        rate_limit_config = cls._load_rate_limit_config(env)
 
         # Authorization configuration
-        auth_config = cls._load_auth_config()
+        auth_config = cls._load_auth_config(env)
 
         return cls(
             telegram_token=telegram_token,
@@ -100,16 +126,18 @@ class Config:
         )
 
     @classmethod
-    def _load_rate_limit_config(cls) -> RateLimitConfig:
+    def _load_rate_limit_config(cls, env: Mapping[str, str]) -> RateLimitConfig:
         """Load rate limit configuration from environment variables.
 
+        Args:
+            env: Environment mapping to read from.
+
         Returns:
             RateLimitConfig instance.
         """
-        enabled_str = os.getenv("RATE_LIMIT_ENABLED", "true").lower()
-        enabled = enabled_str in ("true", "1", "yes")
+        enabled = env.get("RATE_LIMIT_ENABLED", "true").lower() in TRUTHY_ENV_VALUES
 
-        max_requests_str = os.getenv(
+        max_requests_str = env.get(
             "RATE_LIMIT_MAX_REQUESTS", str(DEFAULT_RATE_LIMIT_MAX_REQUESTS)
         )
         try:
@@ -119,7 +147,7 @@ class Config:
         except ValueError:
             max_requests = DEFAULT_RATE_LIMIT_MAX_REQUESTS
 
-        window_seconds_str = os.getenv(
+        window_seconds_str = env.get(
             "RATE_LIMIT_WINDOW_SECONDS", str(DEFAULT_RATE_LIMIT_WINDOW_SECONDS)
         )
         try:
@@ -136,15 +164,18 @@ class Config:
         )
 
     @classmethod
-    def _load_auth_config(cls) -> AuthorizationConfig:
+    def _load_auth_config(cls, env: Mapping[str, str]) -> AuthorizationConfig:
         """Load authorization configuration from environment variables.
 
+        Args:
+            env: Environment mapping to read from.
+
         Returns:
             AuthorizationConfig instance.
         """
-        mode_str = os.getenv("AUTH_MODE", "open")
-        admin_ids_str = os.getenv("AUTH_ADMIN_IDS", "")
-        whitelist_ids_str = os.getenv("AUTH_WHITELIST_IDS", "")
+        mode_str = env.get("AUTH_MODE", "open")
+        admin_ids_str = env.get("AUTH_ADMIN_IDS", "")
+        whitelist_ids_str = env.get("AUTH_WHITELIST_IDS", "")
 
         return AuthorizationConfig.from_env_values(
             mode_str=mode_str,
@@ -162,9 +193,7 @@ class Config:
         Raises:
             ValueError: If the token format is invalid.
         """
-        # Telegram tokens have format: <bot_id>:<hash>
-        # bot_id is numeric, hash is alphanumeric with underscores
-        if not re.match(r"^\d+:[A-Za-z0-9_-]+$", token):
+        if not TELEGRAM_TOKEN_PATTERN.match(token):
             raise ValueError(
                 "TELEGRAM_BOT_TOKEN format is invalid. "
                 "Expected format: <bot_id>:<hash>"
@@ -226,6 +255,11 @@ class Config:
             )
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
-    """Get the application configuration."""
+    """Get the application configuration.
+
+    The configuration is loaded and validated once per process; call
+    ``get_config.cache_clear()`` to reload it from the environment.
+    """
     return Config.from_env()
@@ -1,27 +1,127 @@
 """SQLite database models and operations."""
 
-from datetime import datetime, timezone
-
-from sqlalchemy import Column, DateTime, Float, Integer, String, create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import Session, declarative_base, sessionmaker
+import asyncio
+import calendar
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from urllib.parse import quote
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    create_engine,
+    delete,
+    event,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine, Row
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
+# PRAGMAs applied to every SQLite connection opened by the database managers
+SQLITE_PRAGMAS: dict[str, str | int] = {
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,
+    "cache_size": -20000,  # negative means KiB, so ~20 MB of page cache
+    "temp_store": "MEMORY",
+    "mmap_size": 256 * 1024 * 1024,
+}
+
+# Number of pooled read-only connections
+READ_POOL_SIZE = os.cpu_count() or 4
+
+# Number of recently seen transaction IDs kept in memory by DatabaseManager
+SEEN_TRANSACTION_CACHE_SIZE = 4096
+
+# Pooled aiosqlite connections kept open by AsyncDatabaseManager
+ASYNC_POOL_SIZE = 5
+
+# Engines shared by every manager opened on the same database path; the
+# schema is created when a path's engines are first built
+_ENGINES: dict[str, tuple[Engine, Engine]] = {}
+_ASYNC_ENGINES: dict[str, AsyncEngine] = {}
+_ASYNC_INITIALIZED: set[str] = set()
+_ENGINES_LOCK = threading.Lock()
+
+# Rows per INSERT executemany in add_transactions_bulk
+BULK_INSERT_CHUNK_SIZE = 500
+
+# Rows fetched per batch when streaming transactions
+STREAM_BATCH_SIZE = 1000
+
+# Values per IN (...) list, well below SQLite's bound-parameter limit
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+_EPOCH = datetime(1970, 1, 1)
+
 
 def _utc_now() -> datetime:
     """Return current UTC time."""
     return datetime.now(timezone.utc)
 
 
+class EpochDateTime(TypeDecorator):
+    """Datetime stored as INTEGER seconds since the Unix epoch.
+
+    Naive datetimes are stored as-is (their wall-clock time is treated as
+    UTC) and aware ones are converted to UTC first. Values are read back as
+    naive datetimes; sub-second precision is dropped.
+    """
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value: datetime | None, dialect) -> int | None:
+        """Convert a datetime to epoch seconds."""
+        if value is None:
+            return None
+        return calendar.timegm(value.utctimetuple())
+
+    def process_result_value(self, value: int | None, dialect) -> datetime | None:
+        """Convert epoch seconds back to a naive datetime."""
+        if value is None:
+            return None
+        return _EPOCH + timedelta(seconds=value)
+
+
 class Transaction(Base):
     """Transaction model for storing MercadoPago transactions."""
 
     __tablename__ = "transactions"
 
+    __table_args__ = (
+        # Summaries filter on type within a date range
+        Index("ix_tx_type_date", "transaction_type", "date"),
+    )
+
     id = Column(Integer, primary_key=True, autoincrement=True)
     transaction_id = Column(String, unique=True, nullable=True)
-    date = Column(DateTime, nullable=False)
+    date = Column(EpochDateTime, nullable=False, index=True)
     description = Column(String, nullable=False)
     amount = Column(Float, nullable=False)
     transaction_type = Column(String, nullable=True)  # income/expense
@@ -30,6 +130,16 @@ class Transaction(Base):
     raw_text = Column(String, nullable=True)
     created_at = Column(DateTime, default=_utc_now)
 
+    # Read-only link through the category name. Lazy loading raises, so
+    # callers must eager-load it (e.g. with selectinload) instead of
+    # issuing one query per transaction.
+    category_obj = relationship(
+        "Category",
+        primaryjoin="foreign(Transaction.category) == Category.name",
+        viewonly=True,
+        lazy="raise",
+    )
+
 
 class Category(Base):
     """Category model for storing custom transaction categories."""
@@ -40,9 +150,457 @@ class Category(Base):
     name = Column(String, unique=True, nullable=False)
     created_at = Column(DateTime, default=_utc_now)
 
+    # Transactions assigned to this category; must be eager-loaded
+    transactions = relationship(
+        "Transaction",
+        primaryjoin="Category.name == foreign(Transaction.category)",
+        viewonly=True,
+        lazy="raise",
+    )
+
+
+class MonthlySummary(Base):
+    """Per-month, per-type transaction totals maintained alongside inserts.
+
+    Untyped transactions are stored under an empty ``transaction_type``.
+    """
+
+    __tablename__ = "monthly_summary"
+
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+    transaction_type = Column(String, primary_key=True)
+    total_amount = Column(Float, nullable=False)
+    count = Column(Integer, nullable=False)
+
+
+def _utc_naive(value: datetime) -> datetime:
+    """Convert an aware datetime to naive UTC, the way dates are stored.
+
+    Args:
+        value: Any datetime; naive values are already treated as UTC.
+
+    Returns:
+        The value as a naive UTC datetime.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _month_start(value: datetime) -> datetime:
+    """Return midnight on the first day of the value's month.
+
+    Args:
+        value: Any datetime.
+
+    Returns:
+        The start of that month.
+    """
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month_start(value: datetime) -> datetime:
+    """Return midnight on the first day of the month after the value's month.
+
+    Args:
+        value: Any datetime.
+
+    Returns:
+        The start of the following month.
+    """
+    return _month_start(_month_start(value) + timedelta(days=32))
+
+
+def _monthly_refresh_statements(month: datetime) -> list:
+    """Build the statements that recompute one month of ``monthly_summary``.
+
+    Args:
+        month: Any datetime within the month to recompute; aware values
+            select their UTC month.
+
+    Returns:
+        A DELETE of the month's rollup rows followed by an INSERT ... SELECT
+        aggregating that month's transactions.
+    """
+    start = _month_start(_utc_naive(month))
+    transaction_type = func.coalesce(Transaction.transaction_type, "")
+    aggregate = (
+        select(
+            literal(start.year),
+            literal(start.month),
+            transaction_type,
+            func.sum(Transaction.amount),
+            func.count(),
+        )
+        .where(Transaction.date >= start, Transaction.date < _next_month_start(start))
+        .group_by(transaction_type)
+    )
+    return [
+        delete(MonthlySummary).where(
+            MonthlySummary.year == start.year, MonthlySummary.month == start.month
+        ),
+        insert(MonthlySummary).from_select(
+            ["year", "month", "transaction_type", "total_amount", "count"],
+            aggregate,
+        ),
+    ]
+
+
+def _monthly_increment_statement(
+    date: datetime, transaction_type: str | None, amount: float
+):
+    """Build an upsert adding one transaction to its ``monthly_summary`` row.
+
+    Unlike ``_monthly_refresh_statements`` this does not re-read the month,
+    so a single insert costs the same however many rows the month holds.
+
+    Args:
+        date: The transaction date.
+        transaction_type: The transaction type, or None if untyped.
+        amount: The transaction amount.
+
+    Returns:
+        An ``INSERT ... ON CONFLICT (year, month, transaction_type) DO UPDATE``
+        statement.
+    """
+    # Stored dates are UTC, so bucket by the UTC month as a rebuild would
+    date = _utc_naive(date)
+    statement = sqlite_insert(MonthlySummary).values(
+        year=date.year,
+        month=date.month,
+        transaction_type=transaction_type or "",
+        total_amount=amount,
+        count=1,
+    )
+    return statement.on_conflict_do_update(
+        index_elements=["year", "month", "transaction_type"],
+        set_={
+            "total_amount": MonthlySummary.total_amount + statement.excluded.total_amount,
+            "count": MonthlySummary.count + 1,
+        },
+    )
+
+
+def _affected_months(dates: Iterable[datetime]) -> set[datetime]:
+    """Collapse transaction dates into the set of month starts they fall in.
+
+    Args:
+        dates: Transaction dates.
+
+    Returns:
+        Naive UTC month starts touched by the dates, matching how the dates
+        are stored.
+    """
+    return {_month_start(_utc_naive(date)) for date in dates}
+
+
+def _rebuild_monthly_summary(connection) -> None:
+    """Rebuild ``monthly_summary`` from the transactions if it is out of sync.
+
+    The rollup is stale when its per-month counts differ from the number of
+    transactions stored in each UTC month, e.g. for databases created before
+    the rollup existed, written to by a binary that did not maintain it, or
+    holding rows filed under the wrong month. Amount drift with matching
+    counts is not detected. A stale rollup is cleared and every month
+    between the oldest and newest transaction is recomputed.
+
+    Args:
+        connection: A synchronous SQLAlchemy connection.
+    """
+    month_key = func.strftime("%Y-%m", Transaction.date, "unixepoch")
+    stored = dict(
+        connection.execute(select(month_key, func.count()).group_by(month_key)).all()
+    )
+    rolled_up = {
+        f"{year:04d}-{month:02d}": count
+        for year, month, count in connection.execute(
+            select(
+                MonthlySummary.year, MonthlySummary.month, func.sum(MonthlySummary.count)
+            ).group_by(MonthlySummary.year, MonthlySummary.month)
+        )
+    }
+    if rolled_up == stored:
+        return
+
+    connection.execute(delete(MonthlySummary))
+    oldest, newest = connection.execute(
+        select(func.min(Transaction.date), func.max(Transaction.date))
+    ).one()
+    if oldest is None:
+        return
+
+    month = _month_start(oldest)
+    while month <= newest:
+        for statement in _monthly_refresh_statements(month):
+            connection.execute(statement)
+        month = _next_month_start(month)
+
+
+def _rollup_range(
+    start_date: datetime | None, end_date: datetime | None
+) -> tuple[int, int] | None:
+    """Map a whole-month date range to inclusive ``year * 12 + month`` bounds.
+
+    Args:
+        start_date: Optional inclusive start; must be a month start.
+        end_date: Optional inclusive end; must be the last microsecond of a
+            month. ``datetime.max`` is treated as no upper bound.
+
+    Returns:
+        The bounds, or None if the range does not cover whole months.
+    """
+    if start_date is None:
+        low = 0
+    elif start_date == _month_start(start_date):
+        low = start_date.year * 12 + start_date.month
+    else:
+        return None
+
+    # datetime.max has no following microsecond to check against
+    if end_date is None or end_date.replace(tzinfo=None) == datetime.max:
+        high = 10000 * 12
+    else:
+        following = end_date + timedelta(microseconds=1)
+        if following != _month_start(following):
+            return None
+        high = end_date.year * 12 + end_date.month
+
+    return (low, high)
+
+
+def _rollup_summary_query(bounds: tuple[int, int]):
+    """Build the per-type aggregation over ``monthly_summary`` rows.
+
+    Args:
+        bounds: Inclusive ``year * 12 + month`` range from ``_rollup_range``.
+
+    Returns:
+        A statement yielding ``(transaction_type, total_amount, count)`` rows.
+    """
+    return (
+        select(
+            MonthlySummary.transaction_type,
+            func.sum(MonthlySummary.total_amount),
+            func.sum(MonthlySummary.count),
+        )
+        .where((MonthlySummary.year * 12 + MonthlySummary.month).between(*bounds))
+        .group_by(MonthlySummary.transaction_type)
+    )
+
+
+def _create_schema(connection) -> None:
+    """Create missing tables, then any indexes missing from existing tables.
+
+    ``create_all`` skips tables that already exist, including their indexes,
+    so databases created before an index was added would never get it.
+    Then converts legacy text dates to epoch seconds and rebuilds the
+    monthly rollup if it is out of sync with the transactions.
+
+    Args:
+        connection: A synchronous SQLAlchemy connection.
+    """
+    Base.metadata.create_all(connection)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+    # Databases from before EpochDateTime hold ISO-8601 text dates
+    connection.exec_driver_sql(
+        "UPDATE transactions SET date = CAST(strftime('%s', date) AS INTEGER) "
+        "WHERE typeof(date) = 'text'"
+    )
+    _rebuild_monthly_summary(connection)
+
+
+def _chunked(rows: Iterable, size: int) -> Iterator[list]:
+    """Split items into lists of at most ``size`` items.
+
+    Args:
+        rows: Items to split.
+        size: Maximum number of items per chunk.
+
+    Yields:
+        Consecutive chunks of items.
+    """
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _exists_query(transaction_id: str):
+    """Build a query for whether the transaction ID is stored.
+
+    Args:
+        transaction_id: The transaction ID to look for.
+
+    Returns:
+        A ``SELECT EXISTS (...)`` statement answered from the unique index.
+    """
+    return select(exists().where(Transaction.transaction_id == transaction_id))
+
+
+def _count_query(start_date: datetime | None, end_date: datetime | None):
+    """Build a ``COUNT(*)`` over transactions in an optional date range.
+
+    Args:
+        start_date: Optional start of the range (inclusive).
+        end_date: Optional end of the range (inclusive).
+
+    Returns:
+        A ``SELECT count(*)`` statement.
+    """
+    query = select(func.count()).select_from(Transaction)
+    if start_date is not None:
+        query = query.where(Transaction.date >= start_date)
+    if end_date is not None:
+        query = query.where(Transaction.date <= end_date)
+    return query
+
+
+def _existing_ids_query(transaction_ids: list[str]):
+    """Build a query for which of the given transaction IDs are stored.
+
+    Args:
+        transaction_ids: Transaction IDs to look for.
+
+    Returns:
+        A ``SELECT transaction_id ... WHERE transaction_id IN (...)`` statement.
+    """
+    return select(Transaction.transaction_id).where(
+        Transaction.transaction_id.in_(transaction_ids)
+    )
+
+
+def _brief_query(start_date: datetime, end_date: datetime):
+    """Build the projection used to list transactions without full rows.
+
+    Args:
+        start_date: Start of the date range (inclusive).
+        end_date: End of the date range (inclusive).
+
+    Returns:
+        A ``SELECT date, amount, description, category`` statement, newest
+        first.
+    """
+    return (
+        select(
+            Transaction.date,
+            Transaction.amount,
+            Transaction.description,
+            Transaction.category,
+        )
+        .where(Transaction.date >= start_date, Transaction.date <= end_date)
+        .order_by(Transaction.date.desc())
+    )
+
+
+def _category_update(transaction_id: int, category: str | None):
+    """Build the UPDATE that sets one transaction's category.
+
+    Args:
+        transaction_id: The database ID of the transaction.
+        category: New category name (or None to clear).
+
+    Returns:
+        An ``UPDATE transactions SET category = ? WHERE id = ?`` statement.
+    """
+    return (
+        update(Transaction)
+        .where(Transaction.id == transaction_id)
+        .values(category=category)
+    )
+
+
+def _summary_query(start_date: datetime | None, end_date: datetime | None):
+    """Build the per-type amount and count aggregation for a summary.
+
+    Args:
+        start_date: Optional start date filter (inclusive).
+        end_date: Optional end date filter (inclusive).
+
+    Returns:
+        A ``SELECT transaction_type, SUM(amount), COUNT(*) ... GROUP BY``
+        statement.
+    """
+    query = select(
+        Transaction.transaction_type,
+        func.coalesce(func.sum(Transaction.amount), 0.0),
+        func.count(),
+    ).group_by(Transaction.transaction_type)
+    if start_date:
+        query = query.where(Transaction.date >= start_date)
+    if end_date:
+        query = query.where(Transaction.date <= end_date)
+    return query
+
+
+def _build_summary(rows: Iterable[tuple[str | None, float, int]]) -> dict:
+    """Assemble the summary dict from per-type aggregate rows.
+
+    Args:
+        rows: ``(transaction_type, total_amount, count)`` rows.
+
+    Returns:
+        Dictionary with summary statistics.
+    """
+    totals = {"income": 0.0, "expense": 0.0}
+    counts = {"income": 0, "expense": 0}
+    transaction_count = 0
+    for transaction_type, total, count in rows:
+        transaction_count += count
+        if transaction_type in totals:
+            totals[transaction_type] = total
+            counts[transaction_type] = count
+
+    return {
+        "total_income": totals["income"],
+        "total_expense": totals["expense"],
+        "net_balance": totals["income"] - totals["expense"],
+        "transaction_count": transaction_count,
+        "income_count": counts["income"],
+        "expense_count": counts["expense"],
+    }
+
+
+def _transaction_insert(skip_existing: bool):
+    """Build the INSERT used for bulk imports.
+
+    Args:
+        skip_existing: Whether rows with an already stored transaction ID
+            should be silently skipped.
+
+    Returns:
+        A plain ``INSERT`` or an ``INSERT ... ON CONFLICT (transaction_id)
+        DO NOTHING`` statement.
+    """
+    if not skip_existing:
+        return insert(Transaction)
+    return sqlite_insert(Transaction).on_conflict_do_nothing(
+        index_elements=["transaction_id"]
+    )
+
+
+def _apply_pragmas(dbapi_connection, pragmas: dict[str, str | int]) -> None:
+    """Execute PRAGMA statements on a freshly opened SQLite connection.
+
+    Args:
+        dbapi_connection: The raw sqlite3 connection.
+        pragmas: Mapping of PRAGMA name to value.
+    """
+    cursor = dbapi_connection.cursor()
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
 
 class DatabaseManager:
-    """Manager class for database operations."""
+    """Manager class for database operations.
+
+    Writes go through a single pooled connection that opens its transactions
+    with ``BEGIN IMMEDIATE``; reads use a separate pool of read-only
+    connections. The database runs in WAL mode so readers never block the
+    writer.
+    """
 
     def __init__(self, database_path: str) -> None:
         """Initialize the database manager.
@@ -50,14 +608,99 @@ class DatabaseManager:
         Args:
             database_path: Path to the SQLite database file.
         """
-        self.engine = create_engine(f"sqlite:///{database_path}")
-        Base.metadata.create_all(self.engine)
-        self.SessionLocal = sessionmaker(bind=self.engine)
+        self.database_path = database_path
+        with _ENGINES_LOCK:
+            engines = _ENGINES.get(database_path)
+            if engines is None:
+                engines = _ENGINES[database_path] = self._create_engines(database_path)
+        self.engine, self.read_engine = engines
+        # Objects stay loaded after commit; ids and Python-side defaults are
+        # already set by the flush, so no refresh SELECT is needed
+        self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self.ReadSessionLocal = sessionmaker(bind=self.read_engine)
+
+        # Transaction IDs known to exist, least recently used first. Stored
+        # transactions are never deleted, so entries never go stale.
+        self._seen_ids: OrderedDict[str, None] = OrderedDict()
+        self._seen_lock = threading.Lock()
+
+        # Categories ordered by name; None until loaded or after a change
+        self._category_cache: list[Category] | None = None
+        self._category_lock = threading.Lock()
+
+    @classmethod
+    def _create_engines(cls, database_path: str) -> tuple[Engine, Engine]:
+        """Create the writer and read-only engines and the schema.
+
+        Args:
+            database_path: Path to the SQLite database file.
+
+        Returns:
+            Tuple of (writer engine, read-only engine).
+        """
+        engine = create_engine(
+            f"sqlite:///{database_path}", pool_size=1, max_overflow=0
+        )
+        event.listen(engine, "connect", cls._on_write_connect)
+        event.listen(engine, "begin", cls._on_write_begin)
+        with engine.begin() as connection:
+            _create_schema(connection)
+
+        # The schema exists now, so the read-only pool can open the file.
+        # The path is percent-encoded so '?', '#' and '%' stay part of it.
+        read_engine = create_engine(
+            f"sqlite:///file:{quote(database_path)}?mode=ro&uri=true",
+            pool_size=READ_POOL_SIZE,
+            max_overflow=0,
+        )
+        event.listen(read_engine, "connect", cls._on_read_connect)
+        return engine, read_engine
+
+    @staticmethod
+    def _on_write_connect(dbapi_connection, connection_record) -> None:
+        """Configure a new writer connection."""
+        # Let the "begin" hook issue BEGIN instead of the sqlite3 module
+        dbapi_connection.isolation_level = None
+        _apply_pragmas(dbapi_connection, {"journal_mode": "WAL", **SQLITE_PRAGMAS})
+
+    @staticmethod
+    def _on_write_begin(connection) -> None:
+        """Take the write lock up front so writers queue on busy_timeout."""
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    @staticmethod
+    def _on_read_connect(dbapi_connection, connection_record) -> None:
+        """Configure a new read-only connection."""
+        _apply_pragmas(dbapi_connection, SQLITE_PRAGMAS)
 
     def get_session(self) -> Session:
-        """Get a new database session."""
+        """Get a new database session for writing."""
         return self.SessionLocal()
 
+    def get_read_session(self) -> Session:
+        """Get a new database session backed by the read-only pool."""
+        return self.ReadSessionLocal()
+
+    def _remember_transaction_id(self, transaction_id: str) -> None:
+        """Record a transaction ID as existing, evicting the oldest if full.
+
+        Args:
+            transaction_id: The transaction ID to remember.
+        """
+        with self._seen_lock:
+            self._seen_ids[transaction_id] = None
+            self._seen_ids.move_to_end(transaction_id)
+            if len(self._seen_ids) > SEEN_TRANSACTION_CACHE_SIZE:
+                self._seen_ids.popitem(last=False)
+
+    def close(self) -> None:
+        """Close all pooled connections and forget the shared engines."""
+        with _ENGINES_LOCK:
+            if _ENGINES.get(self.database_path) == (self.engine, self.read_engine):
+                del _ENGINES[self.database_path]
+        self.read_engine.dispose()
+        self.engine.dispose()
+
     def add_transaction(
         self,
         date: datetime,
@@ -96,10 +739,56 @@ class DatabaseManager:
                 raw_text=raw_text,
             )
             session.add(transaction)
+            session.flush()
+            session.execute(_monthly_increment_statement(date, transaction_type, amount))
             session.commit()
-            session.refresh(transaction)
+            if transaction_id:
+                self._remember_transaction_id(transaction_id)
             return transaction
 
+    def add_transactions_bulk(
+        self,
+        rows: Iterable[dict],
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+        skip_existing: bool = False,
+    ) -> int:
+        """Insert many transactions in a single database transaction.
+
+        Rows are inserted with Core ``INSERT`` statements, one executemany per
+        chunk, and committed together, so either all rows are stored or none
+        (apart from those skipped with ``skip_existing``).
+
+        Args:
+            rows: Transactions as dicts keyed by ``Transaction`` column names
+                (``date``, ``description`` and ``amount`` are required).
+            chunk_size: Maximum number of rows per INSERT statement.
+            skip_existing: If True, rows whose transaction ID is already
+                stored (or repeated earlier in ``rows``) are skipped by
+                SQLite via ``ON CONFLICT (transaction_id) DO NOTHING``.
+
+        Returns:
+            Number of rows inserted.
+        """
+        statement = _transaction_insert(skip_existing)
+        candidates: list[dict] = []
+        count = 0
+        with self.get_session() as session, session.begin():
+            # Core execution on the session's connection reports rowcount,
+            # which ORM bulk inserts do not
+            connection = session.connection()
+            for chunk in _chunked(rows, chunk_size):
+                count += connection.execute(statement, chunk).rowcount
+                candidates.extend(chunk)
+            for month in _affected_months(row["date"] for row in candidates):
+                for refresh in _monthly_refresh_statements(month):
+                    session.execute(refresh)
+
+        # Every candidate ID is stored now, whether inserted or skipped
+        for row in candidates:
+            if row.get("transaction_id"):
+                self._remember_transaction_id(row["transaction_id"])
+        return count
+
     def get_transaction_by_id(self, transaction_id: str) -> Transaction | None:
         """Get a transaction by its transaction ID.
 
@@ -109,21 +798,56 @@ class DatabaseManager:
         Returns:
             The Transaction if found, None otherwise.
         """
-        with self.get_session() as session:
+        with self.get_read_session() as session:
             return (
                 session.query(Transaction)
                 .filter(Transaction.transaction_id == transaction_id)
                 .first()
             )
 
+    def iter_transactions(
+        self, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[Transaction]:
+        """Stream all transactions, fetching them in batches.
+
+        The read session stays open until the iterator is exhausted or closed.
+
+        Args:
+            batch_size: Number of rows fetched from SQLite at a time.
+
+        Yields:
+            Each stored transaction.
+        """
+        query = select(Transaction).execution_options(yield_per=batch_size)
+        with self.get_read_session() as session:
+            yield from session.scalars(query)
+
+    def iter_transaction_rows(
+        self, *columns, batch_size: int = STREAM_BATCH_SIZE
+    ) -> Iterator[Row]:
+        """Stream only the given columns of every transaction.
+
+        Unlike :meth:`iter_transactions` this builds no ORM instances and
+        leaves unselected columns such as ``raw_text`` unread.
+
+        Args:
+            *columns: ``Transaction`` column attributes to select.
+            batch_size: Number of rows fetched from SQLite at a time.
+
+        Yields:
+            A row tuple per transaction, in the order of ``columns``.
+        """
+        query = select(*columns).execution_options(yield_per=batch_size)
+        with self.get_read_session() as session:
+            yield from session.execute(query)
+
     def get_all_transactions(self) -> list[Transaction]:
         """Get all transactions from the database.
 
         Returns:
             List of all transactions.
         """
-        with self.get_session() as session:
-            return session.query(Transaction).all()
+        return list(self.iter_transactions())
 
     def transaction_exists(self, transaction_id: str) -> bool:
         """Check if a transaction already exists.
@@ -134,7 +858,32 @@ class DatabaseManager:
         Returns:
             True if transaction exists, False otherwise.
         """
-        return self.get_transaction_by_id(transaction_id) is not None
+        with self._seen_lock:
+            if transaction_id in self._seen_ids:
+                self._seen_ids.move_to_end(transaction_id)
+                return True
+
+        with self.get_read_session() as session:
+            found = session.execute(_exists_query(transaction_id)).scalar()
+        if not found:
+            return False
+        self._remember_transaction_id(transaction_id)
+        return True
+
+    def existing_ids(self, transaction_ids: Iterable[str]) -> set[str]:
+        """Find which of the given transaction IDs are already stored.
+
+        Args:
+            transaction_ids: Transaction IDs to check.
+
+        Returns:
+            The subset of IDs that exist in the database.
+        """
+        found: set[str] = set()
+        with self.get_read_session() as session:
+            for chunk in _chunked(set(transaction_ids), IN_CLAUSE_CHUNK_SIZE):
+                found.update(session.scalars(_existing_ids_query(chunk)))
+        return found
 
     def get_transactions_by_date_range(
         self, start_date: datetime, end_date: datetime
@@ -148,7 +897,7 @@ class DatabaseManager:
         Returns:
             List of transactions within the date range.
         """
-        with self.get_session() as session:
+        with self.get_read_session() as session:
             return (
                 session.query(Transaction)
                 .filter(Transaction.date >= start_date)
@@ -157,11 +906,44 @@ class DatabaseManager:
                 .all()
             )
 
+    def count_transactions(
+        self, start_date: datetime | None = None, end_date: datetime | None = None
+    ) -> int:
+        """Count transactions without loading them.
+
+        Args:
+            start_date: Optional start date filter (inclusive).
+            end_date: Optional end date filter (inclusive).
+
+        Returns:
+            Number of matching transactions.
+        """
+        with self.get_read_session() as session:
+            return session.execute(_count_query(start_date, end_date)).scalar_one()
+
+    def list_transactions_brief(
+        self, start_date: datetime, end_date: datetime
+    ) -> list[tuple[datetime, float, str, str | None]]:
+        """List transactions in a date range as lightweight tuples.
+
+        Args:
+            start_date: Start of the date range (inclusive).
+            end_date: End of the date range (inclusive).
+
+        Returns:
+            ``(date, amount, description, category)`` tuples, newest first.
+        """
+        with self.get_read_session() as session:
+            return session.execute(_brief_query(start_date, end_date)).all()
+
     def get_transaction_summary(
         self, start_date: datetime | None = None, end_date: datetime | None = None
     ) -> dict:
         """Get a summary of transactions.
 
+        Ranges made of whole months (or unbounded) are answered from the
+        ``monthly_summary`` rollup; other ranges aggregate the transactions.
+
         Args:
             start_date: Optional start date filter.
             end_date: Optional end date filter.
@@ -169,36 +951,15 @@ class DatabaseManager:
         Returns:
             Dictionary with summary statistics.
         """
-        with self.get_session() as session:
-            query = session.query(Transaction)
-
-            if start_date:
-                query = query.filter(Transaction.date >= start_date)
-            if end_date:
-                query = query.filter(Transaction.date <= end_date)
-
-            transactions = query.all()
-
-            total_income = sum(
-                t.amount for t in transactions if t.transaction_type == "income"
-            )
-            total_expense = sum(
-                t.amount for t in transactions if t.transaction_type == "expense"
-            )
-            transaction_count = len(transactions)
-
-            return {
-                "total_income": total_income,
-                "total_expense": total_expense,
-                "net_balance": total_income - total_expense,
-                "transaction_count": transaction_count,
-                "income_count": sum(
-                    1 for t in transactions if t.transaction_type == "income"
-                ),
-                "expense_count": sum(
-                    1 for t in transactions if t.transaction_type == "expense"
-                ),
-            }
+        bounds = _rollup_range(start_date, end_date)
+        query = (
+            _summary_query(start_date, end_date)
+            if bounds is None
+            else _rollup_summary_query(bounds)
+        )
+        with self.get_read_session() as session:
+            rows = session.execute(query).all()
+        return _build_summary(rows)
 
     def add_category(self, name: str) -> Category:
         """Add a new category to the database.
@@ -221,17 +982,41 @@ class DatabaseManager:
             category = Category(name=name)
             session.add(category)
             session.commit()
-            session.refresh(category)
+            self._invalidate_categories()
             return category
 
+    def _invalidate_categories(self) -> None:
+        """Drop the cached categories after a committed change.
+
+        Taking the loader's lock means a load that read the pre-commit
+        snapshot finishes first, and its stale result is discarded here.
+        """
+        with self._category_lock:
+            self._category_cache = None
+
+    def _load_categories(self) -> list[Category]:
+        """Return the cached categories, querying them on a cold cache.
+
+        Returns:
+            All categories ordered by name.
+        """
+        with self._category_lock:
+            if self._category_cache is None:
+                with self.get_read_session() as session:
+                    self._category_cache = (
+                        session.query(Category).order_by(Category.name).all()
+                    )
+            return self._category_cache
+
     def get_all_categories(self) -> list[Category]:
         """Get all categories from the database.
 
+        Served from an in-process cache that add/delete invalidate.
+
         Returns:
             List of all categories.
         """
-        with self.get_session() as session:
-            return session.query(Category).order_by(Category.name).all()
+        return list(self._load_categories())
 
     def get_category_by_name(self, name: str) -> Category | None:
         """Get a category by its name.
@@ -242,8 +1027,7 @@ class DatabaseManager:
         Returns:
             The Category if found, None otherwise.
         """
-        with self.get_session() as session:
-            return session.query(Category).filter(Category.name == name).first()
+        return next((c for c in self._load_categories() if c.name == name), None)
 
     def delete_category(self, name: str) -> bool:
         """Delete a category from the database.
@@ -255,12 +1039,12 @@ class DatabaseManager:
             True if deleted, False if category not found.
         """
         with self.get_session() as session:
-            category = session.query(Category).filter(Category.name == name).first()
-            if category:
-                session.delete(category)
-                session.commit()
-                return True
-            return False
+            result = session.execute(delete(Category).where(Category.name == name))
+            session.commit()
+        if result.rowcount > 0:
+            self._invalidate_categories()
+            return True
+        return False
 
     def update_transaction_category(
         self, transaction_id: int, category: str | None
@@ -275,16 +1059,9 @@ class DatabaseManager:
             True if updated, False if transaction not found.
         """
         with self.get_session() as session:
-            transaction = (
-                session.query(Transaction)
-                .filter(Transaction.id == transaction_id)
-                .first()
-            )
-            if transaction:
-                transaction.category = category
-                session.commit()
-                return True
-            return False
+            result = session.execute(_category_update(transaction_id, category))
+            session.commit()
+            return result.rowcount > 0
 
 
 class AsyncDatabaseManager:
@@ -301,10 +1078,22 @@ class AsyncDatabaseManager:
             database_path: Path to the SQLite database file.
         """
         self.database_path = database_path
-        self.engine = create_async_engine(
-            f"sqlite+aiosqlite:///{database_path}",
-            echo=False,
-        )
+        with _ENGINES_LOCK:
+            engine = _ASYNC_ENGINES.get(database_path)
+            if engine is None:
+                # aiosqlite defaults to NullPool, which reopens the file and
+                # replays the PRAGMAs for every session
+                engine = create_async_engine(
+                    f"sqlite+aiosqlite:///{database_path}",
+                    echo=False,
+                    poolclass=AsyncAdaptedQueuePool,
+                    pool_size=ASYNC_POOL_SIZE,
+                    max_overflow=0,
+                    connect_args={"check_same_thread": False, "timeout": 30},
+                )
+                event.listen(engine.sync_engine, "connect", self._on_connect)
+                _ASYNC_ENGINES[database_path] = engine
+        self.engine = engine
         self.async_session = async_sessionmaker(
             self.engine,
             class_=AsyncSession,
@@ -312,6 +1101,15 @@ class AsyncDatabaseManager:
         )
         self._initialized = False
 
+        # Categories ordered by name; None until loaded or after a change
+        self._category_cache: list[Category] | None = None
+        self._category_lock = asyncio.Lock()
+
+    @staticmethod
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        """Configure a new connection for WAL mode and the tuned PRAGMAs."""
+        _apply_pragmas(dbapi_connection, {"journal_mode": "WAL", **SQLITE_PRAGMAS})
+
     async def initialize(self) -> None:
         """Initialize the database schema.
 
@@ -320,14 +1118,40 @@ class AsyncDatabaseManager:
         if self._initialized:
             return
 
-        async with self.engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
+        if self.database_path not in _ASYNC_INITIALIZED:
+            async with self.engine.begin() as conn:
+                await conn.run_sync(_create_schema)
+            _ASYNC_INITIALIZED.add(self.database_path)
         self._initialized = True
 
     async def get_session(self) -> AsyncSession:
         """Get a new async database session."""
         return self.async_session()
 
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[AsyncSession]:
+        """Open one session to share across several read calls.
+
+        Pass the yielded session as ``session=`` to the read methods so that
+        a handler issuing several queries checks out a single connection.
+
+        Yields:
+            An async database session, closed when the block exits.
+        """
+        async with self.async_session() as session:
+            yield session
+
+    @asynccontextmanager
+    async def _reuse_session(
+        self, session: AsyncSession | None
+    ) -> AsyncIterator[AsyncSession]:
+        """Yield the caller's session, or a fresh one closed afterwards."""
+        if session is not None:
+            yield session
+        else:
+            async with self.async_session() as owned:
+                yield owned
+
     async def add_transaction(
         self,
         date: datetime,
@@ -366,53 +1190,205 @@ class AsyncDatabaseManager:
                 raw_text=raw_text,
             )
             session.add(transaction)
+            await session.flush()
+            await session.execute(
+                _monthly_increment_statement(date, transaction_type, amount)
+            )
             await session.commit()
-            await session.refresh(transaction)
             return transaction
 
-    async def get_transaction_by_id(self, transaction_id: str) -> Transaction | None:
+    async def add_transactions_bulk(
+        self,
+        rows: Iterable[dict],
+        chunk_size: int = BULK_INSERT_CHUNK_SIZE,
+        skip_existing: bool = False,
+    ) -> int:
+        """Insert many transactions in a single database transaction asynchronously.
+
+        Args:
+            rows: Transactions as dicts keyed by ``Transaction`` column names
+                (``date``, ``description`` and ``amount`` are required).
+            chunk_size: Maximum number of rows per INSERT statement.
+            skip_existing: If True, rows whose transaction ID is already
+                stored (or repeated earlier in ``rows``) are skipped by
+                SQLite via ``ON CONFLICT (transaction_id) DO NOTHING``.
+
+        Returns:
+            Number of rows inserted.
+        """
+        statement = _transaction_insert(skip_existing)
+        months: set[datetime] = set()
+        count = 0
+        async with self.async_session() as session, session.begin():
+            connection = await session.connection()
+            for chunk in _chunked(rows, chunk_size):
+                result = await connection.execute(statement, chunk)
+                count += result.rowcount
+                months |= _affected_months(row["date"] for row in chunk)
+            for month in months:
+                for refresh in _monthly_refresh_statements(month):
+                    await session.execute(refresh)
+        return count
+
+    async def get_transaction_by_id(
+        self, transaction_id: str, session: AsyncSession | None = None
+    ) -> Transaction | None:
         """Get a transaction by its transaction ID asynchronously.
 
         Args:
             transaction_id: The transaction ID to search for.
+            session: Optional session from :meth:`session_scope` to reuse.
 
         Returns:
             The Transaction if found, None otherwise.
         """
-        from sqlalchemy import select
-
-        async with self.async_session() as session:
+        async with self._reuse_session(session) as session:
             result = await session.execute(
                 select(Transaction).filter(Transaction.transaction_id == transaction_id)
             )
             return result.scalar_one_or_none()
 
-    async def get_all_transactions(self) -> list[Transaction]:
+    async def iter_transactions(
+        self,
+        batch_size: int = STREAM_BATCH_SIZE,
+        session: AsyncSession | None = None,
+    ) -> AsyncIterator[Transaction]:
+        """Stream all transactions asynchronously, fetching them in batches.
+
+        Args:
+            batch_size: Number of rows fetched from SQLite at a time.
+            session: Optional session from :meth:`session_scope` to reuse.
+
+        Yields:
+            Each stored transaction.
+        """
+        query = select(Transaction).execution_options(yield_per=batch_size)
+        async with self._reuse_session(session) as session:
+            async for transaction in await session.stream_scalars(query):
+                yield transaction
+
+    async def get_all_transactions(
+        self, session: AsyncSession | None = None
+    ) -> list[Transaction]:
         """Get all transactions from the database asynchronously.
 
+        Args:
+            session: Optional session from :meth:`session_scope` to reuse.
+
         Returns:
             List of all transactions.
         """
-        from sqlalchemy import select
-
-        async with self.async_session() as session:
-            result = await session.execute(select(Transaction))
-            return list(result.scalars().all())
+        return [
+            transaction
+            async for transaction in self.iter_transactions(session=session)
+        ]
 
-    async def transaction_exists(self, transaction_id: str) -> bool:
+    async def transaction_exists(
+        self, transaction_id: str, session: AsyncSession | None = None
+    ) -> bool:
         """Check if a transaction already exists asynchronously.
 
         Args:
             transaction_id: The transaction ID to check.
+            session: Optional session from :meth:`session_scope` to reuse.
 
         Returns:
             True if transaction exists, False otherwise.
         """
-        transaction = await self.get_transaction_by_id(transaction_id)
-        return transaction is not None
+        async with self._reuse_session(session) as session:
+            result = await session.execute(_exists_query(transaction_id))
+            return bool(result.scalar())
+
+    async def existing_ids(
+        self, transaction_ids: Iterable[str], session: AsyncSession | None = None
+    ) -> set[str]:
+        """Find which of the given transaction IDs are already stored asynchronously.
+
+        Args:
+            transaction_ids: Transaction IDs to check.
+            session: Optional session from :meth:`session_scope` to reuse.
+
+        Returns:
+            The subset of IDs that exist in the database.
+        """
+        found: set[str] = set()
+        async with self._reuse_session(session) as session:
+            for chunk in _chunked(set(transaction_ids), IN_CLAUSE_CHUNK_SIZE):
+                found.update(await session.scalars(_existing_ids_query(chunk)))
+        return found
+
+    async def count_transactions(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        session: AsyncSession | None = None,
+    ) -> int:
+        """Count transactions without loading them asynchronously.
+
+        Args:
+            start_date: Optional start date filter (inclusive).
+            end_date: Optional end date filter (inclusive).
+            session: Optional session from :meth:`session_scope` to reuse.
+
+        Returns:
+            Number of matching transactions.
+        """
+        async with self._reuse_session(session) as session:
+            result = await session.execute(_count_query(start_date, end_date))
+            return result.scalar_one()
+
+    async def list_transactions_brief(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        session: AsyncSession | None = None,
+    ) -> list[tuple[datetime, float, str, str | None]]:
+        """List transactions in a date range as lightweight tuples asynchronously.
+
+        Args:
+            start_date: Start of the date range (inclusive).
+            end_date: End of the date range (inclusive).
+            session: Optional session from :meth:`session_scope` to reuse.
+
+        Returns:
+            ``(date, amount, description, category)`` tuples, newest first.
+        """
+        async with self._reuse_session(session) as session:
+            result = await session.execute(_brief_query(start_date, end_date))
+            return result.all()
+
+    async def get_transaction_summary(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        session: AsyncSession | None = None,
+    ) -> dict:
+        """Get a summary of transactions asynchronously.
+
+        Args:
+            start_date: Optional start date filter.
+            end_date: Optional end date filter.
+            session: Optional session from :meth:`session_scope` to reuse.
+
+        Returns:
+            Dictionary with summary statistics.
+        """
+        bounds = _rollup_range(start_date, end_date)
+        query = (
+            _summary_query(start_date, end_date)
+            if bounds is None
+            else _rollup_summary_query(bounds)
+        )
+        async with self._reuse_session(session) as session:
+            result = await session.execute(query)
+            return _build_summary(result.all())
 
     async def close(self) -> None:
         """Close the database engine and release resources."""
+        with _ENGINES_LOCK:
+            if _ASYNC_ENGINES.get(self.database_path) is self.engine:
+                del _ASYNC_ENGINES[self.database_path]
+                _ASYNC_INITIALIZED.discard(self.database_path)
         await self.engine.dispose()
 
     async def add_category(self, name: str) -> Category:
@@ -427,8 +1403,6 @@ class AsyncDatabaseManager:
         Raises:
             ValueError: If category already exists.
         """
-        from sqlalchemy import select
-
         async with self.async_session() as session:
             # Check if category already exists
             result = await session.execute(
@@ -441,39 +1415,67 @@ class AsyncDatabaseManager:
             category = Category(name=name)
             session.add(category)
             await session.commit()
-            await session.refresh(category)
+            await self._invalidate_categories()
             return category
 
-    async def get_all_categories(self) -> list[Category]:
+    async def _invalidate_categories(self) -> None:
+        """Drop the cached categories after a committed change.
+
+        Taking the loader's lock means a load that read the pre-commit
+        snapshot finishes first, and its stale result is discarded here.
+        """
+        async with self._category_lock:
+            self._category_cache = None
+
+    async def _load_categories(
+        self, session: AsyncSession | None = None
+    ) -> list[Category]:
+        """Return the cached categories, querying them on a cold cache.
+
+        Args:
+            session: Optional session from :meth:`session_scope` to reuse.
+
+        Returns:
+            All categories ordered by name.
+        """
+        async with self._category_lock:
+            if self._category_cache is None:
+                async with self._reuse_session(session) as session:
+                    result = await session.execute(
+                        select(Category).order_by(Category.name)
+                    )
+                    self._category_cache = list(result.scalars().all())
+            return self._category_cache
+
+    async def get_all_categories(
+        self, session: AsyncSession | None = None
+    ) -> list[Category]:
         """Get all categories from the database asynchronously.
 
+        Served from an in-process cache that add/delete invalidate.
+
+        Args:
+            session: Optional session from :meth:`session_scope` to reuse.
+
         Returns:
             List of all categories.
         """
-        from sqlalchemy import select
-
-        async with self.async_session() as session:
-            result = await session.execute(
-                select(Category).order_by(Category.name)
-            )
-            return list(result.scalars().all())
+        return list(await self._load_categories(session))
 
-    async def get_category_by_name(self, name: str) -> Category | None:
+    async def get_category_by_name(
+        self, name: str, session: AsyncSession | None = None
+    ) -> Category | None:
         """Get a category by its name asynchronously.
 
         Args:
             name: Category name.
+            session: Optional session from :meth:`session_scope` to reuse.
 
         Returns:
             The Category if found, None otherwise.
         """
-        from sqlalchemy import select
-
-        async with self.async_session() as session:
-            result = await session.execute(
-                select(Category).filter(Category.name == name)
-            )
-            return result.scalar_one_or_none()
+        categories = await self._load_categories(session)
+        return next((c for c in categories if c.name == name), None)
 
     async def delete_category(self, name: str) -> bool:
         """Delete a category from the database asynchronously.
@@ -484,22 +1486,15 @@ class AsyncDatabaseManager:
         Returns:
             True if deleted, False if category not found.
         """
-        from sqlalchemy import delete, select
-
         async with self.async_session() as session:
-            # First check if category exists
             result = await session.execute(
-                select(Category).filter(Category.name == name)
+                delete(Category).where(Category.name == name)
             )
-            category = result.scalar_one_or_none()
-
-            if category:
-                # Use delete statement instead
-                stmt = delete(Category).where(Category.name == name)
-                await session.execute(stmt)
-                await session.commit()
-                return True
-            return False
+            await session.commit()
+        if result.rowcount > 0:
+            await self._invalidate_categories()
+            return True
+        return False
 
     async def update_transaction_category(
         self, transaction_id: int, category: str | None
@@ -513,15 +1508,9 @@ class AsyncDatabaseManager:
         Returns:
             True if updated, False if transaction not found.
         """
-        from sqlalchemy import select
-
         async with self.async_session() as session:
             result = await session.execute(
-                select(Transaction).filter(Transaction.id == transaction_id)
+                _category_update(transaction_id, category)
             )
-            transaction = result.scalar_one_or_none()
-            if transaction:
-                transaction.category = category
-                await session.commit()
-                return True
-            return False
+            await session.commit()
+            return result.rowcount > 0
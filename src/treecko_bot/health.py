@@ -1,13 +1,15 @@
 """Health check functionality for monitoring."""
 
+import asyncio
+import contextlib
 import json
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from threading import Thread
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
 
-from .logging_config import get_logger
+from .logging_config import dumps_json, get_logger
 
 logger = get_logger(__name__)
 
@@ -15,6 +17,23 @@ logger = get_logger(__name__)
 DEFAULT_HEALTH_PORT = 8081
 HEALTH_PATH = "/health"
 
+# How long an encoded health response is reused before the callback reruns
+HEALTH_CACHE_TTL_SECONDS = 0.5
+
+# The 404 response never changes, so it is encoded once
+NOT_FOUND_BODY = dumps_json({"error": "Not Found"})
+
+# Status line and fixed headers of each JSON response, up to Content-Length
+_RESPONSE_PREAMBLES = {
+    status_code: (
+        f"HTTP/1.0 {status_code} {reason}\r\n"
+        "Content-Type: application/json\r\n"
+        "Connection: close\r\n"
+        "Content-Length: "
+    ).encode("ascii")
+    for status_code, reason in ((200, "OK"), (404, "Not Found"))
+}
+
 # Module-level storage for callback (used by handler)
 _health_callback: Callable[[], "HealthStatus"] | None = None
 
@@ -39,6 +58,85 @@ class HealthStatus:
             },
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Encode the same document as :meth:`to_dict` without building it.
+
+        Only ``status`` is free text, so it is the only value escaped.
+
+        Returns:
+            UTF-8 encoded JSON health status.
+        """
+        database = "ok" if self.database_connected else "not_connected"
+        sheets = "configured" if self.sheets_configured else "not_configured"
+        return (
+            f'{{"status":{json.dumps(self.status)},"timestamp":{self.timestamp!r},'
+            f'"checks":{{"database":"{database}","sheets":"{sheets}"}}}}'
+        ).encode()
+
+
+# Seconds an event-loop connection may take to send its request headers
+REQUEST_READ_TIMEOUT_SECONDS = 5.0
+
+
+def _json_response(status_code: int, body: bytes) -> bytes:
+    """Build a complete HTTP response for an encoded JSON body.
+
+    Args:
+        status_code: HTTP status code (200 or 404).
+        body: UTF-8 encoded JSON response body.
+
+    Returns:
+        Status line, headers and body, ready to write in one call.
+    """
+    return b"%s%d\r\n\r\n%s" % (_RESPONSE_PREAMBLES[status_code], len(body), body)
+
+
+class HealthBodyCache:
+    """Encoded health response, reused for ``HEALTH_CACHE_TTL_SECONDS``."""
+
+    def __init__(self, health_callback: Callable[[], HealthStatus] | None = None):
+        """Initialize the cache.
+
+        Args:
+            health_callback: Callback function to get health status.
+        """
+        self.health_callback = health_callback
+        self._cached_body: bytes | None = None
+        self._cache_expires = 0.0
+        self._cache_lock = Lock()
+
+    def get(self) -> bytes:
+        """Get the encoded health response, refreshing it once the TTL expires.
+
+        Returns:
+            UTF-8 encoded JSON health status.
+        """
+        now = time.monotonic()
+        body = self._cached_body
+        if body is not None and now < self._cache_expires:
+            return body
+
+        with self._cache_lock:
+            # Another thread may have refreshed it while this one waited
+            if self._cached_body is not None and now < self._cache_expires:
+                return self._cached_body
+
+            if self.health_callback is None:
+                # No callback configured, return basic healthy status
+                status = HealthStatus(
+                    status="healthy",
+                    timestamp=time.time(),
+                    database_connected=True,
+                    sheets_configured=False,
+                )
+            else:
+                status = self.health_callback()
+
+            body = status.to_json_bytes()
+            self._cached_body = body
+            self._cache_expires = time.monotonic() + HEALTH_CACHE_TTL_SECONDS
+        return body
+
 
 class HealthCheckHandler(BaseHTTPRequestHandler):
     """HTTP request handler for health check endpoint."""
@@ -56,39 +154,31 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
 
     def _handle_health_check(self) -> None:
         """Handle health check request."""
-        # Access callback from server instance
-        callback = getattr(self.server, "health_callback", None)
-
-        if callback is None:
-            # No callback configured, return basic healthy status
-            status = HealthStatus(
-                status="healthy",
-                timestamp=time.time(),
-                database_connected=True,
-                sheets_configured=False,
-            )
-        else:
-            status = callback()
-
-        response_body = json.dumps(status.to_dict())
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(response_body)))
-        self.end_headers()
-        self.wfile.write(response_body.encode())
+        self._send_json(200, self.server.get_health_body())
 
     def _send_not_found(self) -> None:
         """Send 404 Not Found response."""
-        response_body = json.dumps({"error": "Not Found"})
-        self.send_response(404)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(response_body)))
-        self.end_headers()
-        self.wfile.write(response_body.encode())
+        self._send_json(404, NOT_FOUND_BODY)
 
+    def _send_json(self, status_code: int, body: bytes) -> None:
+        """Send an encoded JSON body with its byte length in a single write.
 
-class HealthCheckHTTPServer(HTTPServer):
-    """Custom HTTP server that stores the health callback."""
+        Args:
+            status_code: HTTP status code (200 or 404).
+            body: UTF-8 encoded JSON response body.
+        """
+        self.wfile.write(_json_response(status_code, body))
+
+
+class HealthCheckHTTPServer(ThreadingHTTPServer):
+    """Custom HTTP server that stores the health callback.
+
+    Each request is handled in its own daemon thread so concurrent probes
+    are not queued behind one another.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
 
     def __init__(
         self,
@@ -105,10 +195,23 @@ class HealthCheckHTTPServer(HTTPServer):
         """
         super().__init__(server_address, handler_class)
         self.health_callback = health_callback
+        self._body_cache = HealthBodyCache(health_callback)
+
+    def get_health_body(self) -> bytes:
+        """Get the encoded health response, reusing it for a short TTL.
+
+        Returns:
+            UTF-8 encoded JSON health status.
+        """
+        return self._body_cache.get()
 
 
 class HealthCheckServer:
-    """HTTP server for health check endpoint."""
+    """HTTP server for health check endpoint.
+
+    Runs either in a background thread (:meth:`start`/:meth:`stop`) or on the
+    caller's asyncio event loop (:meth:`start_async`/:meth:`stop_async`).
+    """
 
     def __init__(
         self,
@@ -125,6 +228,8 @@ class HealthCheckServer:
         self.health_callback = health_callback
         self._server: HealthCheckHTTPServer | None = None
         self._thread: Thread | None = None
+        self._async_server: asyncio.Server | None = None
+        self._body_cache = HealthBodyCache(health_callback)
 
     def start(self) -> None:
         """Start the health check server in a background thread."""
@@ -143,3 +248,52 @@ class HealthCheckServer:
             self._server.shutdown()
             self._server = None
             logger.info("Health check server stopped")
+
+    async def start_async(self) -> None:
+        """Start serving health checks on the running event loop."""
+        self._async_server = await asyncio.start_server(
+            self._handle_connection, "0.0.0.0", self.port
+        )
+        logger.info("Health check server started", port=self.port)
+
+    async def stop_async(self) -> None:
+        """Stop the event-loop health check server."""
+        if self._async_server:
+            self._async_server.close()
+            await self._async_server.wait_closed()
+            self._async_server = None
+            logger.info("Health check server stopped")
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer one HTTP request and close the connection.
+
+        Args:
+            reader: Stream for the incoming request.
+            writer: Stream for the response.
+        """
+        try:
+            head = await asyncio.wait_for(
+                reader.readuntil(b"\r\n\r\n"), REQUEST_READ_TIMEOUT_SECONDS
+            )
+            method, _, rest = head.partition(b" ")
+            path = rest.split(b" ", 1)[0]
+            if method == b"GET" and path == HEALTH_PATH.encode():
+                writer.write(_json_response(200, self._body_cache.get()))
+            else:
+                writer.write(_json_response(404, NOT_FOUND_BODY))
+            await writer.drain()
+        except (
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            asyncio.TimeoutError,
+            ConnectionError,
+        ):
+            # Malformed, slow or dropped requests get no response
+            pass
+        finally:
+            writer.close()
+            # A peer that already hung up makes the close handshake fail
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
@@ -4,9 +4,14 @@ import json
 import logging
 import os
 import sys
-from datetime import datetime, timezone
+import time
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without the "fast" extra
+    orjson = None
+
 # Log level environment variable
 LOG_LEVEL_ENV = "LOG_LEVEL"
 LOG_FORMAT_ENV = "LOG_FORMAT"
@@ -24,10 +29,75 @@ VALID_LOG_LEVELS = {
 LOG_FORMAT_TEXT = "text"
 LOG_FORMAT_JSON = "json"
 
+# Renders the StructuredTextFormatter line from its fields
+_format_text_line = "{asctime} - {name} - {levelname} - {message}".format
+
+# Renders one (key, value) item of structured extra data as "key=value"
+_format_key_value = "{0[0]}={0[1]}".format
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Uses ``orjson`` when it is installed (the ``fast`` extra) and the
+    standard library otherwise. Non-ASCII characters are not escaped.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        The encoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# Formatters and the console handler shared by repeated setup_logging() calls
+_FORMATTERS: dict[str, logging.Formatter] = {}
+_console_handler: logging.StreamHandler | None = None
+
 
 class StructuredJsonFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    # ISO 8601 UTC timestamps, e.g. 2024-11-15T10:30:00.123+00:00
+    converter = time.gmtime
+    default_time_format = "%Y-%m-%dT%H:%M:%S"
+    default_msec_format = "%s.%03d+00:00"
+
+    def __init__(self, datefmt: str | None = None):
+        """Initialize the JSON formatter.
+
+        Args:
+            datefmt: Optional strftime format overriding the ISO 8601 default.
+        """
+        super().__init__(datefmt=datefmt)
+        # (whole second, formatted prefix) of the last record's timestamp
+        self._second_prefix: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Format the record's creation time.
+
+        With the default format the date/time prefix only changes once per
+        second, so it is reused for records created within the same second.
+
+        Args:
+            record: The log record whose time is formatted.
+            datefmt: Optional strftime format.
+
+        Returns:
+            The formatted timestamp.
+        """
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, prefix = self._second_prefix
+        if second != cached_second:
+            prefix = time.strftime(self.default_time_format, self.converter(second))
+            self._second_prefix = (second, prefix)
+        return self.default_msec_format % (prefix, record.msecs)
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
 
@@ -38,7 +108,7 @@ class StructuredJsonFormatter(logging.Formatter):
             JSON formatted log string.
         """
         log_data: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self.formatTime(record, self.datefmt),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -49,8 +119,9 @@ class StructuredJsonFormatter(logging.Formatter):
             log_data["exception"] = self.formatException(record.exc_info)
 
         # Add extra fields if any
-        if hasattr(record, "extra_data"):
-            log_data["extra"] = record.extra_data
+        extra_data = getattr(record, "extra_data", None)
+        if extra_data:
+            log_data["extra"] = extra_data
 
         # Add source location in debug mode
         if record.levelno <= logging.DEBUG:
@@ -60,7 +131,7 @@ class StructuredJsonFormatter(logging.Formatter):
                 "function": record.funcName,
             }
 
-        return json.dumps(log_data, ensure_ascii=False)
+        return dumps_json(log_data).decode("utf-8")
 
 
 class StructuredTextFormatter(logging.Formatter):
@@ -82,11 +153,27 @@ class StructuredTextFormatter(logging.Formatter):
         Returns:
             Formatted log string.
         """
-        formatted = super().format(record)
+        # Same output as the %-style fmt above, without the style machinery
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        formatted = _format_text_line(
+            asctime=record.asctime,
+            name=record.name,
+            levelname=record.levelname,
+            message=record.message,
+        )
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            formatted = f"{formatted}\n{record.exc_text}"
+        if record.stack_info:
+            formatted = f"{formatted}\n{self.formatStack(record.stack_info)}"
 
         # Add extra fields if any
-        if hasattr(record, "extra_data") and record.extra_data:
-            extra_str = " ".join(f"{k}={v}" for k, v in record.extra_data.items())
+        extra_data = getattr(record, "extra_data", None)
+        if extra_data:
+            extra_str = " ".join(map(_format_key_value, extra_data.items()))
             formatted = f"{formatted} | {extra_str}"
 
         return formatted
@@ -139,32 +226,52 @@ class StructuredLogger(logging.Logger):
 
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log debug message with optional extra data."""
-        if self.isEnabledFor(logging.DEBUG):
+        if not self.isEnabledFor(logging.DEBUG):
+            return
+        if kwargs:
             self._log_with_extra(logging.DEBUG, msg, args, stacklevel=2, **kwargs)
+        else:
+            self._log(logging.DEBUG, msg, args, stacklevel=2)
 
     def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log info message with optional extra data."""
-        if self.isEnabledFor(logging.INFO):
+        if not self.isEnabledFor(logging.INFO):
+            return
+        if kwargs:
             self._log_with_extra(logging.INFO, msg, args, stacklevel=2, **kwargs)
+        else:
+            self._log(logging.INFO, msg, args, stacklevel=2)
 
     def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log warning message with optional extra data."""
-        if self.isEnabledFor(logging.WARNING):
+        if not self.isEnabledFor(logging.WARNING):
+            return
+        if kwargs:
             self._log_with_extra(logging.WARNING, msg, args, stacklevel=2, **kwargs)
+        else:
+            self._log(logging.WARNING, msg, args, stacklevel=2)
 
     def error(self, msg: str, *args: Any, exc_info: Any = None, **kwargs: Any) -> None:
         """Log error message with optional extra data."""
-        if self.isEnabledFor(logging.ERROR):
+        if not self.isEnabledFor(logging.ERROR):
+            return
+        if kwargs:
             self._log_with_extra(
                 logging.ERROR, msg, args, exc_info=exc_info, stacklevel=2, **kwargs
             )
+        else:
+            self._log(logging.ERROR, msg, args, exc_info=exc_info, stacklevel=2)
 
     def critical(self, msg: str, *args: Any, exc_info: Any = None, **kwargs: Any) -> None:
         """Log critical message with optional extra data."""
-        if self.isEnabledFor(logging.CRITICAL):
+        if not self.isEnabledFor(logging.CRITICAL):
+            return
+        if kwargs:
             self._log_with_extra(
                 logging.CRITICAL, msg, args, exc_info=exc_info, stacklevel=2, **kwargs
             )
+        else:
+            self._log(logging.CRITICAL, msg, args, exc_info=exc_info, stacklevel=2)
 
 
 def get_log_level() -> int:
@@ -189,6 +296,25 @@ def get_log_format() -> str:
     return format_name
 
 
+def _get_formatter(log_format: str) -> logging.Formatter:
+    """Get the shared formatter for a log format, creating it on first use.
+
+    Args:
+        log_format: Log format name ('text' or 'json').
+
+    Returns:
+        The formatter for that format.
+    """
+    formatter = _FORMATTERS.get(log_format)
+    if formatter is None:
+        if log_format == LOG_FORMAT_JSON:
+            formatter = StructuredJsonFormatter()
+        else:
+            formatter = StructuredTextFormatter()
+        _FORMATTERS[log_format] = formatter
+    return formatter
+
+
 def setup_logging() -> None:
     """Configure logging for the application.
 
@@ -196,30 +322,42 @@ def setup_logging() -> None:
     environment variables:
     - LOG_LEVEL: DEBUG, INFO, WARNING, ERROR, CRITICAL (default: INFO)
     - LOG_FORMAT: text, json (default: text)
+
+    Calling it again with unchanged settings leaves the existing handler in
+    place.
     """
+    global _console_handler
+
     # Register our custom logger class
     logging.setLoggerClass(StructuredLogger)
 
     # Get configuration from environment
     log_level = get_log_level()
     log_format = get_log_format()
+    formatter = _get_formatter(log_format)
 
-    # Create appropriate formatter
-    if log_format == LOG_FORMAT_JSON:
-        formatter = StructuredJsonFormatter()
-    else:
-        formatter = StructuredTextFormatter()
+    # Nothing to do if the handler from a previous call is still in place
+    root_logger = logging.getLogger()
+    console_handler = _console_handler
+    if (
+        console_handler is not None
+        and root_logger.handlers == [console_handler]
+        and console_handler.stream is sys.stdout
+        and console_handler.formatter is formatter
+        and console_handler.level == root_logger.level == log_level
+    ):
+        return
 
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
     # Remove existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # Add console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Add console handler, reusing the previous one while stdout is unchanged
+    if console_handler is None or console_handler.stream is not sys.stdout:
+        console_handler = _console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
@@ -242,4 +380,7 @@ def get_logger(name: str) -> StructuredLogger:
     Returns:
         StructuredLogger instance.
     """
+    # Module-level loggers are created at import time, which may happen
+    # before setup_logging() runs, so register the class here as well
+    logging.setLoggerClass(StructuredLogger)
     return logging.getLogger(name)  # type: ignore[return-value]
@@ -1,11 +1,67 @@
 """PDF parser for MercadoPago transaction receipts."""
 
-import io
 import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime
-
-import pdfplumber
+from itertools import islice
+
+import pypdfium2 as pdfium
+
+# PDFium is not thread-safe; parsing may run in worker threads, so every
+# call into the library is serialized through this lock
+_PDFIUM_LOCK = threading.Lock()
+
+# Extraction patterns, compiled once and tried in order (first match wins)
+_TRANSACTION_ID_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:Operación|Operacion|ID|Código|Codigo)[\s:]*[#]?(\d{10,})",
+        r"(?:N[úu]mero de operaci[óo]n)[\s:]*(\d+)",
+        r"(?:Comprobante|Referencia)[\s:]*(\d{8,})",
+    )
+)
+
+# Date patterns paired with the name of the parser method for their groups
+_DATE_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), parser)
+    for pattern, parser in (
+        (r"(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})", "_parse_spanish_date"),
+        (r"(\d{1,2})/(\d{1,2})/(\d{4})", "_parse_numeric_date"),
+        (r"(\d{1,2})-(\d{1,2})-(\d{4})", "_parse_numeric_date_dash"),
+        (r"(\d{4})-(\d{1,2})-(\d{1,2})", "_parse_iso_date"),
+    )
+)
+
+_AMOUNT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\$\s*([\d.,]+)",
+        r"(?:Total|Monto|Importe)[\s:]*\$?\s*([\d.,]+)",
+        r"([\d.,]+)\s*(?:pesos|ARS)",
+    )
+)
+
+_DESCRIPTION_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:Detalle|Descripción|Descripcion|Concepto)[\s:]*(.+?)(?:\n|$)",
+        r"(?:por|Para)[\s:]*(.+?)(?:\n|$)",
+    )
+)
+
+_MERCHANT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"(?:Vendedor|Comercio|Destinatario|Para|A)[\s:]*(.+?)(?:\n|$)",
+        r"(?:De|Remitente)[\s:]*(.+?)(?:\n|$)",
+    )
+)
+
+_LINE_PATTERN = re.compile(r"[^\n]+")
+
+# Any of these marks a receipt as income; everything else is an expense
+_INCOME_PATTERN = re.compile(r"recibiste|cobraste|ingreso|dep[óo]sito", re.IGNORECASE)
 
 
 @dataclass
@@ -36,12 +92,7 @@ class MercadoPagoPDFParser:
         Raises:
             ValueError: If the PDF cannot be parsed.
         """
-        with pdfplumber.open(pdf_path) as pdf:
-            text = ""
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        text = self._extract_text(pdf_path)
 
         if not text.strip():
             raise ValueError("Could not extract text from PDF")
@@ -60,18 +111,50 @@ class MercadoPagoPDFParser:
         Raises:
             ValueError: If the PDF cannot be parsed.
         """
-        with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
-            text = ""
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        text = self._extract_text(pdf_bytes)
 
         if not text.strip():
             raise ValueError("Could not extract text from PDF")
 
         return self._parse_text(text)
 
+    def _extract_text(self, source: str | bytes) -> str:
+        """Extract page text using PDFium's native text layer.
+
+        Every page is read: the transaction type, description, merchant and
+        raw text all depend on the whole receipt, not just the pages holding
+        the ID, date and amount.
+
+        Args:
+            source: Path to the PDF file or PDF content as bytes.
+
+        Returns:
+            Text of all pages, one trailing newline per non-empty page.
+
+        Raises:
+            ValueError: If the PDF cannot be opened.
+        """
+        with _PDFIUM_LOCK:
+            try:
+                pdf = pdfium.PdfDocument(source)
+            except pdfium.PdfiumError as e:
+                raise ValueError(f"Could not open PDF: {e}") from e
+
+            try:
+                parts: list[str] = []
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    # PDFium separates lines with CRLF; the extractors expect LF
+                    page_text = textpage.get_text_range().replace("\r\n", "\n")
+                    textpage.close()
+                    page.close()
+                    if page_text:
+                        parts.append(page_text)
+            finally:
+                pdf.close()
+
+        return "\n".join(parts) + "\n" if parts else ""
+
     def _parse_text(self, text: str) -> ParsedTransaction:
         """Parse the extracted text from a MercadoPago receipt.
 
@@ -106,14 +189,8 @@ class MercadoPagoPDFParser:
         Returns:
             Transaction ID if found, None otherwise.
         """
-        patterns = [
-            r"(?:Operación|Operacion|ID|Código|Codigo)[\s:]*[#]?(\d{10,})",
-            r"(?:N[úu]mero de operaci[óo]n)[\s:]*(\d+)",
-            r"(?:Comprobante|Referencia)[\s:]*(\d{8,})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _TRANSACTION_ID_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
 
@@ -128,18 +205,11 @@ class MercadoPagoPDFParser:
         Returns:
             Datetime object of the transaction date.
         """
-        date_patterns = [
-            (r"(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})", self._parse_spanish_date),
-            (r"(\d{1,2})/(\d{1,2})/(\d{4})", self._parse_numeric_date),
-            (r"(\d{1,2})-(\d{1,2})-(\d{4})", self._parse_numeric_date_dash),
-            (r"(\d{4})-(\d{1,2})-(\d{1,2})", self._parse_iso_date),
-        ]
-
-        for pattern, parser in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern, parser in _DATE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 try:
-                    return parser(match)
+                    return getattr(self, parser)(match)
                 except (ValueError, KeyError):
                     continue
 
@@ -225,14 +295,8 @@ class MercadoPagoPDFParser:
         Returns:
             Tuple of (amount, transaction_type).
         """
-        amount_patterns = [
-            r"\$\s*([\d.,]+)",
-            r"(?:Total|Monto|Importe)[\s:]*\$?\s*([\d.,]+)",
-            r"([\d.,]+)\s*(?:pesos|ARS)",
-        ]
-
-        for pattern in amount_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _AMOUNT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 amount_str = match.group(1).replace(".", "").replace(",", ".")
                 try:
@@ -253,19 +317,8 @@ class MercadoPagoPDFParser:
         Returns:
             'income' or 'expense'.
         """
-        income_keywords = ["recibiste", "cobraste", "ingreso", "depósito", "deposito"]
-        expense_keywords = ["pagaste", "enviaste", "compra", "pago", "transferencia"]
-
-        text_lower = text.lower()
-
-        for keyword in income_keywords:
-            if keyword in text_lower:
-                return "income"
-
-        for keyword in expense_keywords:
-            if keyword in text_lower:
-                return "expense"
-
+        if _INCOME_PATTERN.search(text):
+            return "income"
         return "expense"
 
     def _extract_description(self, text: str) -> str:
@@ -277,21 +330,18 @@ class MercadoPagoPDFParser:
         Returns:
             Transaction description.
         """
-        description_patterns = [
-            r"(?:Detalle|Descripción|Descripcion|Concepto)[\s:]*(.+?)(?:\n|$)",
-            r"(?:por|Para)[\s:]*(.+?)(?:\n|$)",
-        ]
-
-        for pattern in description_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _DESCRIPTION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 description = match.group(1).strip()
                 if description and len(description) > 3:
                     return description[:200]
 
-        lines = [line.strip() for line in text.split("\n") if line.strip()]
-        if len(lines) > 2:
-            return lines[1][:200]
+        # Only the first three non-blank lines matter, so stop scanning there
+        lines = (match.group().strip() for match in _LINE_PATTERN.finditer(text))
+        first_lines = list(islice(filter(None, lines), 3))
+        if len(first_lines) > 2:
+            return first_lines[1][:200]
 
         return "MercadoPago Transaction"
 
@@ -304,13 +354,8 @@ class MercadoPagoPDFParser:
         Returns:
             Merchant name if found, None otherwise.
         """
-        merchant_patterns = [
-            r"(?:Vendedor|Comercio|Destinatario|Para|A)[\s:]*(.+?)(?:\n|$)",
-            r"(?:De|Remitente)[\s:]*(.+?)(?:\n|$)",
-        ]
-
-        for pattern in merchant_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _MERCHANT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 merchant = match.group(1).strip()
                 if merchant and len(merchant) > 2:
@@ -1,10 +1,11 @@
 """Rate limiting functionality for the Telegram bot."""
 
 import logging
+import threading
 import time
-from collections import defaultdict
+from collections import deque
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
@@ -12,8 +13,11 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_REQUESTS = 10  # Maximum requests per window
 DEFAULT_WINDOW_SECONDS = 60  # Time window in seconds
 
+# Recorded requests between sweeps that drop users idle for a whole window
+GC_INTERVAL_OPERATIONS = 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class RateLimitConfig:
     """Configuration for rate limiting.
 
@@ -28,21 +32,28 @@ class RateLimitConfig:
     enabled: bool = True
 
 
-@dataclass
-class UserRequestInfo:
-    """Information about user requests for rate limiting.
+def _bind_disabled(limiter: "RateLimiter | TokenBucketRateLimiter") -> None:
+    """Replace a disabled limiter's methods with constant answers.
 
-    Attributes:
-        request_timestamps: List of timestamps when requests were made.
-    """
+    A disabled limiter never tracks requests, so binding no-ops on the
+    instance at construction removes the enabled check from every call.
 
-    request_timestamps: list[float] = field(default_factory=list)
+    Args:
+        limiter: The limiter to disable.
+    """
+    max_requests = limiter.config.max_requests
+    limiter.is_rate_limited = lambda user_id: False
+    limiter.record_request = lambda user_id: None
+    limiter.check_and_record = lambda user_id: True
+    limiter.get_remaining_requests = lambda user_id: max_requests
+    limiter.get_retry_after = lambda user_id: 0.0
 
 
 class RateLimiter:
     """Rate limiter to prevent abuse of the bot.
 
     Uses a sliding window algorithm to track request rates per user.
+    All methods are safe to call from several threads.
     """
 
     def __init__(
@@ -54,12 +65,73 @@ class RateLimiter:
 
         Args:
             config: Rate limit configuration. Uses defaults if not provided.
+                Its fields are read once here, so later changes are ignored.
             get_time: Callable to get current time (useful for testing).
-                     Defaults to time.time.
+                     Defaults to time.monotonic, so stored timestamps are
+                     monotonic seconds, not wall-clock times.
         """
         self.config = config or RateLimitConfig()
-        self._get_time = get_time or time.time
-        self._user_requests: dict[int, UserRequestInfo] = defaultdict(UserRequestInfo)
+        self._get_time = get_time or time.monotonic
+        # The config is read on every request; keep its fields one lookup away
+        self._window = float(self.config.window_seconds)
+        self._max = int(self.config.max_requests)
+        # Request timestamps per user in the current window, oldest first
+        self._user_requests: dict[int, deque[float]] = {}
+        self._ops_since_gc = 0
+        # Guards per-user state so handlers on other threads cannot race
+        self._lock = threading.Lock()
+        if not self.config.enabled:
+            _bind_disabled(self)
+
+    def _timestamps(self, user_id: int) -> deque[float]:
+        """Get a user's request timestamps, creating them on first use.
+
+        Only the recording paths call this; read-only checks look users up
+        with ``dict.get`` so unknown users are never stored.
+
+        Args:
+            user_id: The Telegram user ID.
+
+        Returns:
+            The user's timestamps, oldest first. The deque holds at most
+            ``max_requests`` timestamps, since older ones can never matter.
+        """
+        timestamps = self._user_requests.get(user_id)
+        if timestamps is None:
+            timestamps = deque(maxlen=self._max)
+            self._user_requests[user_id] = timestamps
+        return timestamps
+
+    def _prune(self, timestamps: deque[float], current_time: float) -> None:
+        """Drop timestamps that have left the sliding window.
+
+        Args:
+            timestamps: A user's request timestamps, oldest first.
+            current_time: The current time.
+        """
+        window_start = current_time - self._window
+        while timestamps and timestamps[0] <= window_start:
+            timestamps.popleft()
+
+    def _maybe_collect(self, current_time: float) -> None:
+        """Every ``GC_INTERVAL_OPERATIONS`` records, drop users with no live requests.
+
+        Args:
+            current_time: The current time.
+        """
+        self._ops_since_gc += 1
+        if self._ops_since_gc < GC_INTERVAL_OPERATIONS:
+            return
+        self._ops_since_gc = 0
+
+        window_start = current_time - self._window
+        idle = [
+            user_id
+            for user_id, timestamps in self._user_requests.items()
+            if not timestamps or timestamps[-1] <= window_start
+        ]
+        for user_id in idle:
+            del self._user_requests[user_id]
 
     def is_rate_limited(self, user_id: int) -> bool:
         """Check if a user is currently rate limited.
@@ -70,20 +142,15 @@ class RateLimiter:
         Returns:
             True if the user is rate limited, False otherwise.
         """
-        if not self.config.enabled:
+        # Users without recorded requests need no clock read or pruning
+        timestamps = self._user_requests.get(user_id)
+        if not timestamps:
             return False
+        with self._lock:
+            self._prune(timestamps, self._get_time())
 
-        current_time = self._get_time()
-        user_info = self._user_requests[user_id]
-
-        # Clean up old requests outside the window
-        window_start = current_time - self.config.window_seconds
-        user_info.request_timestamps = [
-            ts for ts in user_info.request_timestamps if ts > window_start
-        ]
-
-        # Check if user has exceeded the limit
-        return len(user_info.request_timestamps) >= self.config.max_requests
+            # Check if user has exceeded the limit
+            return len(timestamps) >= self._max
 
     def record_request(self, user_id: int) -> None:
         """Record a request from a user.
@@ -91,16 +158,17 @@ class RateLimiter:
         Args:
             user_id: The Telegram user ID making the request.
         """
-        if not self.config.enabled:
-            return
-
-        current_time = self._get_time()
-        self._user_requests[user_id].request_timestamps.append(current_time)
-        logger.debug(
-            "Recorded request for user_id=%d, request_count=%d",
-            user_id,
-            len(self._user_requests[user_id].request_timestamps),
-        )
+        with self._lock:
+            current_time = self._get_time()
+            timestamps = self._timestamps(user_id)
+            timestamps.append(current_time)
+            self._maybe_collect(current_time)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Recorded request for user_id=%d, request_count=%d",
+                user_id,
+                len(timestamps),
+            )
 
     def check_and_record(self, user_id: int) -> bool:
         """Check rate limit and record request if allowed.
@@ -115,7 +183,17 @@ class RateLimiter:
         Returns:
             True if the request is allowed, False if rate limited.
         """
-        if self.is_rate_limited(user_id):
+        # Read the clock and prune once for both the check and the record
+        with self._lock:
+            current_time = self._get_time()
+            timestamps = self._timestamps(user_id)
+            self._prune(timestamps, current_time)
+            allowed = len(timestamps) < self._max
+            if allowed:
+                timestamps.append(current_time)
+                self._maybe_collect(current_time)
+
+        if not allowed:
             logger.warning(
                 "User rate limited user_id=%d max_requests=%d window_seconds=%d",
                 user_id,
@@ -124,7 +202,12 @@ class RateLimiter:
             )
             return False
 
-        self.record_request(user_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Recorded request for user_id=%d, request_count=%d",
+                user_id,
+                len(timestamps),
+            )
         return True
 
     def get_remaining_requests(self, user_id: int) -> int:
@@ -136,19 +219,12 @@ class RateLimiter:
         Returns:
             Number of remaining requests in the current window.
         """
-        if not self.config.enabled:
-            return self.config.max_requests
-
-        current_time = self._get_time()
-        user_info = self._user_requests[user_id]
-
-        # Clean up old requests
-        window_start = current_time - self.config.window_seconds
-        valid_requests = [
-            ts for ts in user_info.request_timestamps if ts > window_start
-        ]
-
-        return max(0, self.config.max_requests - len(valid_requests))
+        timestamps = self._user_requests.get(user_id)
+        if not timestamps:
+            return self._max
+        with self._lock:
+            self._prune(timestamps, self._get_time())
+            return max(0, self._max - len(timestamps))
 
     def get_retry_after(self, user_id: int) -> float:
         """Get the time in seconds until the user can make another request.
@@ -159,27 +235,187 @@ class RateLimiter:
         Returns:
             Seconds until the rate limit resets. Returns 0 if not rate limited.
         """
-        if not self.config.enabled:
+        timestamps = self._user_requests.get(user_id)
+        if not timestamps:
             return 0.0
+        with self._lock:
+            current_time = self._get_time()
+            self._prune(timestamps, current_time)
 
-        current_time = self._get_time()
-        user_info = self._user_requests[user_id]
+            if len(timestamps) < self._max:
+                return 0.0
+
+            # Return time until the oldest request expires
+            return max(0.0, timestamps[0] + self._window - current_time)
+
+    def reset_user(self, user_id: int) -> None:
+        """Reset rate limit for a specific user.
+
+        Args:
+            user_id: The Telegram user ID to reset.
+        """
+        with self._lock:
+            removed = self._user_requests.pop(user_id, None)
+        if removed is not None:
+            logger.debug("Reset rate limit for user_id=%d", user_id)
+
+    def reset_all(self) -> None:
+        """Reset rate limits for all users."""
+        with self._lock:
+            self._user_requests.clear()
+        logger.debug("Reset all rate limits")
 
-        if not user_info.request_timestamps:
-            return 0.0
 
-        # Clean up old requests
-        window_start = current_time - self.config.window_seconds
-        valid_requests = [
-            ts for ts in user_info.request_timestamps if ts > window_start
+class TokenBucketRateLimiter:
+    """Rate limiter that refills a token bucket per user.
+
+    Allows bursts of up to ``max_requests`` and then refills one request
+    every ``window_seconds / max_requests`` seconds. Each user costs one
+    ``(tokens, last_refill)`` pair instead of up to ``max_requests``
+    timestamps. Exposes the same methods as :class:`RateLimiter` and is
+    likewise safe to call from several threads.
+    """
+
+    def __init__(
+        self,
+        config: RateLimitConfig | None = None,
+        get_time: Callable[[], float] | None = None,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            config: Rate limit configuration. Uses defaults if not provided.
+                Its fields are read once here, so later changes are ignored.
+            get_time: Callable to get current time (useful for testing).
+                     Defaults to time.monotonic, so stored timestamps are
+                     monotonic seconds, not wall-clock times.
+        """
+        self.config = config or RateLimitConfig()
+        self._get_time = get_time or time.monotonic
+        # The config is read on every request; keep its fields one lookup away
+        self._window = float(self.config.window_seconds)
+        self._max = int(self.config.max_requests)
+        self._refill_rate = self._max / self._window
+        self._buckets: dict[int, tuple[float, float]] = {}
+        self._ops_since_gc = 0
+        # Guards the read-modify-write of each bucket
+        self._lock = threading.Lock()
+        if not self.config.enabled:
+            _bind_disabled(self)
+
+    def _tokens(self, user_id: int, current_time: float) -> float:
+        """Get a user's available tokens after refilling for elapsed time.
+
+        Args:
+            user_id: The Telegram user ID.
+            current_time: The current time.
+
+        Returns:
+            Available tokens; a full bucket for users without requests.
+        """
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            return float(self._max)
+        tokens, last_refill = bucket
+        return min(float(self._max), tokens + (current_time - last_refill) * self._refill_rate)
+
+    def _maybe_collect(self, current_time: float) -> None:
+        """Every ``GC_INTERVAL_OPERATIONS`` records, drop users whose bucket is full.
+
+        A bucket untouched for a whole window has refilled completely, which
+        is the same as having no entry.
+
+        Args:
+            current_time: The current time.
+        """
+        self._ops_since_gc += 1
+        if self._ops_since_gc < GC_INTERVAL_OPERATIONS:
+            return
+        self._ops_since_gc = 0
+
+        window_start = current_time - self._window
+        idle = [
+            user_id
+            for user_id, (_, last_refill) in self._buckets.items()
+            if last_refill <= window_start
         ]
+        for user_id in idle:
+            del self._buckets[user_id]
 
-        if len(valid_requests) < self.config.max_requests:
-            return 0.0
+    def is_rate_limited(self, user_id: int) -> bool:
+        """Check if a user is currently rate limited.
+
+        Args:
+            user_id: The Telegram user ID to check.
+
+        Returns:
+            True if the user is rate limited, False otherwise.
+        """
+        return self._tokens(user_id, self._get_time()) < 1
+
+    def record_request(self, user_id: int) -> None:
+        """Record a request from a user.
+
+        Args:
+            user_id: The Telegram user ID making the request.
+        """
+        with self._lock:
+            current_time = self._get_time()
+            tokens = max(0.0, self._tokens(user_id, current_time) - 1)
+            self._buckets[user_id] = (tokens, current_time)
+            self._maybe_collect(current_time)
+
+    def check_and_record(self, user_id: int) -> bool:
+        """Check rate limit and record request if allowed.
+
+        Args:
+            user_id: The Telegram user ID making the request.
+
+        Returns:
+            True if the request is allowed, False if rate limited.
+        """
+        with self._lock:
+            current_time = self._get_time()
+            tokens = self._tokens(user_id, current_time)
+            allowed = tokens >= 1
+            if allowed:
+                self._buckets[user_id] = (tokens - 1, current_time)
+                self._maybe_collect(current_time)
+
+        if not allowed:
+            logger.warning(
+                "User rate limited user_id=%d max_requests=%d window_seconds=%d",
+                user_id,
+                self.config.max_requests,
+                self.config.window_seconds,
+            )
+            return False
+        return True
+
+    def get_remaining_requests(self, user_id: int) -> int:
+        """Get the number of requests a user can make right now.
 
-        # Return time until the oldest request expires
-        oldest_request = min(valid_requests)
-        return max(0.0, oldest_request + self.config.window_seconds - current_time)
+        Args:
+            user_id: The Telegram user ID to check.
+
+        Returns:
+            Number of whole tokens currently available.
+        """
+        return int(self._tokens(user_id, self._get_time()))
+
+    def get_retry_after(self, user_id: int) -> float:
+        """Get the time in seconds until the user can make another request.
+
+        Args:
+            user_id: The Telegram user ID to check.
+
+        Returns:
+            Seconds until one token is available. Returns 0 if not rate limited.
+        """
+        tokens = self._tokens(user_id, self._get_time())
+        if tokens >= 1:
+            return 0.0
+        return (1 - tokens) / self._refill_rate
 
     def reset_user(self, user_id: int) -> None:
         """Reset rate limit for a specific user.
@@ -187,11 +423,13 @@ class RateLimiter:
         Args:
             user_id: The Telegram user ID to reset.
         """
-        if user_id in self._user_requests:
-            del self._user_requests[user_id]
+        with self._lock:
+            removed = self._buckets.pop(user_id, None)
+        if removed is not None:
             logger.debug("Reset rate limit for user_id=%d", user_id)
 
     def reset_all(self) -> None:
         """Reset rate limits for all users."""
-        self._user_requests.clear()
+        with self._lock:
+            self._buckets.clear()
         logger.debug("Reset all rate limits")
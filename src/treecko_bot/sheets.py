@@ -1,6 +1,8 @@
 """Google Sheets integration for storing transactions."""
 
+import functools
 import logging
+import time
 from datetime import datetime
 
 import gspread
@@ -13,6 +15,66 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive",
 ]
 
+# Header row written to a newly created worksheet, in column order
+SHEET_HEADERS = (
+    "Date",
+    "Description",
+    "Amount",
+    "Type",
+    "Merchant",
+    "Category",
+    "Transaction ID",
+    "Created At",
+)
+
+# Format of the date and "Created At" cells
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@functools.lru_cache(maxsize=4)
+def _load_client(credentials_path: str) -> gspread.Client:
+    """Authorize a gspread client for a service account.
+
+    Loading the credentials parses the key file and its RSA key, so the
+    client is shared by every manager using the same credentials file.
+
+    Args:
+        credentials_path: Path to the Google service account credentials JSON file.
+
+    Returns:
+        Authenticated gspread client.
+    """
+    credentials = Credentials.from_service_account_file(credentials_path, scopes=SCOPES)
+    return gspread.authorize(credentials)
+
+
+def _header_request(worksheet_id: int) -> dict:
+    """Build a batch update request that writes the bold header row.
+
+    Args:
+        worksheet_id: The numeric ID of the worksheet to write to.
+
+    Returns:
+        An ``updateCells`` request for ``Spreadsheet.batch_update``.
+    """
+    return {
+        "updateCells": {
+            "start": {"sheetId": worksheet_id, "rowIndex": 0, "columnIndex": 0},
+            "rows": [
+                {
+                    "values": [
+                        {
+                            "userEnteredValue": {"stringValue": header},
+                            "userEnteredFormat": {"textFormat": {"bold": True}},
+                        }
+                        for header in SHEET_HEADERS
+                    ]
+                }
+            ],
+            "fields": "userEnteredValue,userEnteredFormat.textFormat.bold",
+        }
+    }
+
 
 class GoogleSheetsManager:
     """Manager for Google Sheets operations."""
@@ -28,6 +90,7 @@ class GoogleSheetsManager:
         self.sheet_id = sheet_id
         self._client = None
         self._sheet = None
+        self._worksheets: dict[str, gspread.Worksheet] = {}
 
     def _get_client(self) -> gspread.Client:
         """Get or create the gspread client.
@@ -36,10 +99,7 @@ class GoogleSheetsManager:
             Authenticated gspread client.
         """
         if self._client is None:
-            credentials = Credentials.from_service_account_file(
-                self.credentials_path, scopes=SCOPES
-            )
-            self._client = gspread.authorize(credentials)
+            self._client = _load_client(self.credentials_path)
         return self._client
 
     def _get_sheet(self) -> gspread.Spreadsheet:
@@ -56,31 +116,63 @@ class GoogleSheetsManager:
     def _get_or_create_worksheet(self, title: str = "Transactions") -> gspread.Worksheet:
         """Get or create a worksheet.
 
+        The worksheet is looked up once per title and then reused.
+
         Args:
             title: The worksheet title.
 
         Returns:
             The gspread Worksheet object.
         """
+        worksheet = self._worksheets.get(title)
+        if worksheet is not None:
+            return worksheet
+
         sheet = self._get_sheet()
         try:
             worksheet = sheet.worksheet(title)
         except gspread.WorksheetNotFound:
             worksheet = sheet.add_worksheet(title=title, rows=1000, cols=10)
-            headers = [
-                "Date",
-                "Description",
-                "Amount",
-                "Type",
-                "Merchant",
-                "Category",
-                "Transaction ID",
-                "Created At",
-            ]
-            worksheet.update("A1:H1", [headers])
-            worksheet.format("A1:H1", {"textFormat": {"bold": True}})
+            # Write and bold the header row in a single round trip
+            sheet.batch_update({"requests": [_header_request(worksheet.id)]})
+        self._worksheets[title] = worksheet
         return worksheet
 
+    def build_row(
+        self,
+        date: datetime,
+        description: str,
+        amount: float,
+        transaction_type: str,
+        merchant: str | None = None,
+        category: str | None = None,
+        transaction_id: str | None = None,
+    ) -> list:
+        """Build a worksheet row for a transaction.
+
+        Args:
+            date: Transaction date.
+            description: Transaction description.
+            amount: Transaction amount.
+            transaction_type: Type of transaction (income/expense).
+            merchant: Optional merchant name.
+            category: Optional category.
+            transaction_id: Optional transaction ID.
+
+        Returns:
+            Row values in worksheet column order.
+        """
+        return [
+            date.strftime(TIMESTAMP_FORMAT),
+            description,
+            amount,
+            transaction_type,
+            merchant or "",
+            category or "",
+            transaction_id or "",
+            time.strftime(TIMESTAMP_FORMAT),
+        ]
+
     def add_transaction(
         self,
         date: datetime,
@@ -108,22 +200,42 @@ class GoogleSheetsManager:
         try:
             worksheet = self._get_or_create_worksheet()
 
-            row = [
-                date.strftime("%Y-%m-%d %H:%M:%S"),
-                description,
-                amount,
-                transaction_type,
-                merchant or "",
-                category or "",
-                transaction_id or "",
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            ]
-
-            worksheet.append_row(row)
-            logger.info(f"Added transaction to Google Sheets: {description}")
+            row = self.build_row(
+                date=date,
+                description=description,
+                amount=amount,
+                transaction_type=transaction_type,
+                merchant=merchant,
+                category=category,
+                transaction_id=transaction_id,
+            )
+
+            worksheet.append_row(row, value_input_option="RAW")
+            logger.info("Added transaction to Google Sheets: %s", description)
+            return True
+        except Exception as e:
+            logger.error("Failed to add transaction to Google Sheets: %s", e)
+            return False
+
+    def append_rows(self, rows: list[list]) -> bool:
+        """Append several prebuilt rows to the Google Sheet in one request.
+
+        Args:
+            rows: Rows built with ``build_row``.
+
+        Returns:
+            True if successful, False otherwise.
+        """
+        if not rows:
+            return True
+
+        try:
+            worksheet = self._get_or_create_worksheet()
+            worksheet.append_rows(rows, value_input_option="RAW")
+            logger.info("Added %d transactions to Google Sheets", len(rows))
             return True
         except Exception as e:
-            logger.error(f"Failed to add transaction to Google Sheets: {e}")
+            logger.error("Failed to add %d transactions to Google Sheets: %s", len(rows), e)
             return False
 
     def is_configured(self) -> bool:
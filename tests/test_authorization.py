@@ -95,6 +95,17 @@ class TestAuthorizationConfig:
         )
         assert config.admin_user_ids == {123, 456}
 
+    def test_from_env_values_normalizes_mode(self):
+        """Test that mode parsing ignores case and surrounding whitespace."""
+        config = AuthorizationConfig.from_env_values(mode_str="  Admin_Only ")
+        assert config.mode == AuthorizationMode.ADMIN_ONLY
+
+    def test_from_env_values_unknown_mode_falls_back_to_open(self):
+        """Test that an unknown mode falls back to open mode."""
+        config = AuthorizationConfig.from_env_values(mode_str="private")
+        assert config.mode == AuthorizationMode.OPEN
+        assert config.enabled is False
+
     def test_from_env_values_handles_none(self):
         """Test creating config from None values."""
         config = AuthorizationConfig.from_env_values()
@@ -199,6 +210,46 @@ class TestUserAuthorization:
 
         assert not admin_only_auth.is_admin(100)
 
+    def test_cached_decision_invalidated_on_admin_change(self, admin_only_auth):
+        """Test that cached decisions are refreshed when admins change."""
+        assert not admin_only_auth.is_authorized(999)
+
+        admin_only_auth.add_admin(999)
+        assert admin_only_auth.is_authorized(999)
+
+        admin_only_auth.remove_admin(999)
+        assert not admin_only_auth.is_authorized(999)
+
+    def test_whitelist_mode_authorizes_new_admin(self, whitelist_auth):
+        """Test that admins added at runtime pass the whitelist check."""
+        assert not whitelist_auth.is_authorized(999)
+
+        whitelist_auth.add_admin(999)
+
+        assert whitelist_auth.is_authorized(999)
+
+    def test_whitelist_mode_removing_admin_keeps_whitelisted_access(self):
+        """Test that a user who is both admin and whitelisted keeps access."""
+        config = AuthorizationConfig(
+            mode=AuthorizationMode.WHITELIST,
+            admin_user_ids={100},
+            whitelisted_user_ids={100},
+            enabled=True,
+        )
+        auth = UserAuthorization(config)
+
+        auth.remove_admin(100)
+        assert auth.is_authorized(100)
+
+        auth.remove_from_whitelist(100)
+        assert not auth.is_authorized(100)
+
+    def test_is_restricted(self, open_auth, whitelist_auth, admin_only_auth):
+        """Test that only enabled, non-open modes are restricted."""
+        assert not open_auth.is_restricted
+        assert whitelist_auth.is_restricted
+        assert admin_only_auth.is_restricted
+
     def test_disabled_authorization_allows_all(self):
         """Test that disabled authorization allows all users."""
         config = AuthorizationConfig(
@@ -237,6 +288,12 @@ class TestUserAuthorization:
         assert "Access Denied" in message
         assert "admin" in message.lower()
 
+    def test_get_unauthorized_message_open(self, open_auth):
+        """Test unauthorized message falls back to the generic text."""
+        message = open_auth.get_unauthorized_message()
+        assert "Access Denied" in message
+        assert "not authorized" in message
+
     def test_default_authorization(self):
         """Test default authorization with no config."""
         auth = UserAuthorization()
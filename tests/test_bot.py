@@ -2,16 +2,34 @@
 
 import os
 import tempfile
+import time
+from dataclasses import replace
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from treecko_bot.authorization import AuthorizationConfig
-from treecko_bot.bot import TreeckoBot
+from treecko_bot.authorization import AuthorizationConfig, AuthorizationMode
+from treecko_bot.bot import (
+    ANALYZING_MESSAGE,
+    DOWNLOADING_MESSAGE,
+    SHEETS_MAX_ATTEMPTS,
+    TreeckoBot,
+)
 from treecko_bot.config import Config
 from treecko_bot.pdf_parser import ParsedTransaction
 from treecko_bot.rate_limiter import RateLimitConfig
+from treecko_bot.sheets import GoogleSheetsManager
+
+
+def _mock_download(content: bytes) -> AsyncMock:
+    """Create a mock File.download_to_drive that writes the given content."""
+
+    def download(custom_path=None, **kwargs):
+        with open(custom_path, "wb") as f:
+            f.write(content)
+
+    return AsyncMock(side_effect=download)
 
 
 @pytest.fixture
@@ -32,14 +50,17 @@ def config():
         auth_config=AuthorizationConfig(enabled=False),  # Disable for tests
     )
     yield cfg
-    if os.path.exists(db_path):
-        os.unlink(db_path)
+    for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        if os.path.exists(path):
+            os.unlink(path)
 
 
 @pytest.fixture
 def bot(config):
     """Create a TreeckoBot instance with test config."""
-    return TreeckoBot(config)
+    bot = TreeckoBot(config)
+    yield bot
+    bot.db.close()
 
 
 @pytest.fixture
@@ -94,6 +115,19 @@ class TestTreeckoBotCommands:
         assert "Database" in call_args[0][0]
         assert call_args[1]["parse_mode"] == "Markdown"
 
+    @pytest.mark.asyncio
+    async def test_status_command_sheets_configured(self, bot, mock_update, mock_context):
+        """Test the /status command reports Sheets as configured after a refresh."""
+        bot.sheets = MagicMock()
+        bot.sheets.is_configured.return_value = True
+        bot.refresh_sheets_status()
+
+        await bot.status(mock_update, mock_context)
+
+        call_args = mock_update.message.reply_text.call_args
+        assert "✅ Configured" in call_args[0][0]
+        assert bot._get_health_status().sheets_configured is True
+
     @pytest.mark.asyncio
     async def test_handle_text_message(self, bot, mock_update, mock_context):
         """Test handling a text message."""
@@ -106,6 +140,45 @@ class TestTreeckoBotCommands:
         assert "Hello bot" in call_args[0][0]
 
 
+class TestTreeckoBotAccessControl:
+    """Tests for TreeckoBot authorization checks."""
+
+    @pytest.fixture
+    def whitelist_bot(self, config):
+        """Create a TreeckoBot instance in whitelist mode."""
+        auth_config = AuthorizationConfig(
+            mode=AuthorizationMode.WHITELIST,
+            whitelisted_user_ids={123456789},
+            enabled=True,
+        )
+        bot = TreeckoBot(replace(config, auth_config=auth_config))
+        yield bot
+        bot.db.close()
+
+    @pytest.mark.asyncio
+    async def test_whitelisted_user_allowed(self, whitelist_bot, mock_update, mock_context):
+        """Test that a whitelisted user can use commands."""
+        await whitelist_bot.start(mock_update, mock_context)
+
+        call_args = mock_update.message.reply_text.call_args
+        assert "Welcome to Treecko Finance Bot" in call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_denied(self, whitelist_bot, mock_update, mock_context):
+        """Test that a user outside the whitelist is denied."""
+        mock_update.effective_user.id = 999
+
+        await whitelist_bot.start(mock_update, mock_context)
+
+        mock_update.message.reply_text.assert_called_once()
+        call_args = mock_update.message.reply_text.call_args
+        assert "Access Denied" in call_args[0][0]
+
+    def test_open_mode_skips_authorization(self, bot):
+        """Test that open/disabled authorization is not consulted per request."""
+        assert bot._auth_required is False
+
+
 class TestTreeckoBotDocumentHandler:
     """Tests for TreeckoBot document handling."""
 
@@ -133,6 +206,7 @@ class TestTreeckoBotDocumentHandler:
         mock_update.message.reply_text.assert_called_once()
         call_args = mock_update.message.reply_text.call_args
         assert "too large" in call_args[0][0]
+        assert "10 MB" in call_args[0][0]
 
     @pytest.mark.asyncio
     async def test_handle_invalid_pdf_content(self, bot, mock_update, mock_context):
@@ -144,7 +218,7 @@ class TestTreeckoBotDocumentHandler:
 
         # Mock file download with non-PDF content (doesn't start with %PDF)
         mock_file = AsyncMock()
-        mock_file.download_as_bytearray = AsyncMock(return_value=bytearray(b"not a pdf content"))
+        mock_file.download_to_drive = _mock_download(b"not a pdf content")
         mock_context.bot = MagicMock()
         mock_context.bot.get_file = AsyncMock(return_value=mock_file)
 
@@ -164,9 +238,7 @@ class TestTreeckoBotDocumentHandler:
 
         # Mock file download with valid PDF magic bytes
         mock_file = AsyncMock()
-        mock_file.download_as_bytearray = AsyncMock(
-            return_value=bytearray(b"%PDF-1.4 mock pdf content")
-        )
+        mock_file.download_to_drive = _mock_download(b"%PDF-1.4 mock pdf content")
         mock_context.bot = MagicMock()
         mock_context.bot.get_file = AsyncMock(return_value=mock_file)
 
@@ -180,11 +252,202 @@ class TestTreeckoBotDocumentHandler:
             raw_text="test raw text",
         )
 
-        with patch.object(bot.pdf_parser, "parse_from_bytes", return_value=mock_transaction):
+        with patch.object(bot.pdf_parser, "parse", return_value=mock_transaction) as mock_parse:
+            await bot.handle_document(mock_update, mock_context)
+
+        mock_parse.assert_called_once()
+        pdf_path = mock_parse.call_args[0][0]
+        assert not os.path.exists(pdf_path)  # temporary download is cleaned up
+        # Fast parses skip the analyzing notice: downloading, then the result
+        replies = [c[0][0] for c in mock_update.message.reply_text.call_args_list]
+        assert replies[0] == DOWNLOADING_MESSAGE
+        assert ANALYZING_MESSAGE not in replies
+        assert "Transaction Processed" in replies[-1]
+        assert bot.db.transaction_exists("TEST123")
+
+    @pytest.mark.asyncio
+    async def test_handle_pdf_document_slow_parse_sends_analyzing_notice(
+        self, bot, mock_update, mock_context
+    ):
+        """Test that a slow parse tells the user the PDF is being analyzed."""
+        mock_update.message.document = MagicMock()
+        mock_update.message.document.file_name = "test.pdf"
+        mock_update.message.document.file_id = "test_file_id"
+        mock_update.message.document.file_size = 1024
+
+        mock_file = AsyncMock()
+        mock_file.download_to_drive = _mock_download(b"%PDF-1.4 mock pdf content")
+        mock_context.bot = MagicMock()
+        mock_context.bot.get_file = AsyncMock(return_value=mock_file)
+
+        mock_transaction = ParsedTransaction(
+            transaction_id="SLOW123",
+            date=datetime(2024, 11, 15),
+            description="Test transaction",
+            amount=100.50,
+            transaction_type="expense",
+            merchant=None,
+            raw_text="test raw text",
+        )
+
+        def slow_parse(pdf_path):
+            time.sleep(0.05)
+            return mock_transaction
+
+        with (
+            patch("treecko_bot.bot.ANALYZING_NOTICE_DELAY_SECONDS", 0.01),
+            patch.object(bot.pdf_parser, "parse", side_effect=slow_parse),
+        ):
             await bot.handle_document(mock_update, mock_context)
 
-        # Should have called reply_text multiple times (downloading, analyzing, result)
-        assert mock_update.message.reply_text.call_count >= 2
+        replies = [c[0][0] for c in mock_update.message.reply_text.call_args_list]
+        assert replies[:2] == [DOWNLOADING_MESSAGE, ANALYZING_MESSAGE]
+        assert "Transaction Processed" in replies[-1]
+
+    @pytest.mark.asyncio
+    async def test_handle_pdf_document_duplicate(self, bot, mock_update, mock_context):
+        """Test that an already processed transaction is not stored twice."""
+        mock_update.message.document = MagicMock()
+        mock_update.message.document.file_name = "test.pdf"
+        mock_update.message.document.file_id = "test_file_id"
+        mock_update.message.document.file_size = 1024
+
+        mock_file = AsyncMock()
+        mock_file.download_to_drive = _mock_download(b"%PDF-1.4 mock pdf content")
+        mock_context.bot = MagicMock()
+        mock_context.bot.get_file = AsyncMock(return_value=mock_file)
+
+        bot.db.add_transaction(
+            date=datetime(2024, 11, 15),
+            description="Existing transaction",
+            amount=100.50,
+            transaction_id="DUP123",
+        )
+        mock_transaction = ParsedTransaction(
+            transaction_id="DUP123",
+            date=datetime(2024, 11, 15),
+            description="Test transaction",
+            amount=100.50,
+            transaction_type="expense",
+            merchant=None,
+            raw_text="test raw text",
+        )
+
+        with patch.object(bot.pdf_parser, "parse", return_value=mock_transaction):
+            await bot.handle_document(mock_update, mock_context)
+
+        last_call = mock_update.message.reply_text.call_args
+        assert "already been processed" in last_call[0][0]
+        assert len(bot.db.get_all_transactions()) == 1
+
+    @pytest.mark.asyncio
+    async def test_handle_pdf_document_queues_for_sheets(self, bot, mock_update, mock_context):
+        """Test that a processed PDF is queued for Google Sheets when configured."""
+        mock_update.message.document = MagicMock()
+        mock_update.message.document.file_name = "test.pdf"
+        mock_update.message.document.file_id = "test_file_id"
+        mock_update.message.document.file_size = 1024
+
+        mock_file = AsyncMock()
+        mock_file.download_to_drive = _mock_download(b"%PDF-1.4 mock pdf content")
+        mock_context.bot = MagicMock()
+        mock_context.bot.get_file = AsyncMock(return_value=mock_file)
+
+        bot.sheets = MagicMock()
+        bot.sheets.is_configured.return_value = True
+        bot.sheets.build_row.return_value = ["row"]
+        bot.sheets.append_rows.return_value = True
+        bot.refresh_sheets_status()
+
+        mock_transaction = ParsedTransaction(
+            transaction_id="SHEETS123",
+            date=datetime(2024, 11, 15),
+            description="Test transaction",
+            amount=100.50,
+            transaction_type="expense",
+            merchant=None,
+            raw_text="test raw text",
+        )
+
+        with patch.object(bot.pdf_parser, "parse", return_value=mock_transaction):
+            await bot.handle_document(mock_update, mock_context)
+
+        assert bot.sheets.build_row.call_args[1]["transaction_id"] == "SHEETS123"
+        bot.sheets.add_transaction.assert_not_called()
+        last_call = mock_update.message.reply_text.call_args
+        assert "Queued for Google Sheets" in last_call[0][0]
+        assert bot.db.transaction_exists("SHEETS123")
+
+        assert await bot.flush_sheets_queue() == 1
+        bot.sheets.append_rows.assert_called_once_with([["row"]])
+
+    @pytest.mark.asyncio
+    async def test_startup_and_shutdown_manage_health_server(self, bot):
+        """Test that the application hooks run the health server on the loop."""
+        application = MagicMock()
+
+        with patch("treecko_bot.bot.HealthCheckServer") as server_class:
+            server = server_class.return_value
+            server.start_async = AsyncMock()
+            server.stop_async = AsyncMock()
+
+            await bot._on_startup(application)
+            assert bot._health_server is server
+            server.start_async.assert_awaited_once()
+
+            await bot._on_shutdown(application)
+
+        server.stop_async.assert_awaited_once()
+        assert bot._health_server is None
+
+    @pytest.mark.asyncio
+    async def test_sheets_worker_batches_queued_rows(self, bot):
+        """Test that the Sheets worker appends queued rows in a single batch."""
+        bot.sheets = MagicMock()
+        bot.sheets.is_configured.return_value = True
+        bot.refresh_sheets_status()
+        application = MagicMock()
+
+        await bot._start_sheets_worker(application)
+        for i in range(3):
+            bot._sheets_queue.put_nowait([f"row {i}"])
+        await bot._stop_sheets_worker(application)
+
+        bot.sheets.append_rows.assert_called_once_with([["row 0"], ["row 1"], ["row 2"]])
+        assert bot._sheets_worker is None
+        assert bot._sheets_queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_sheets_flush_retries_then_logs_dropped_rows(self, bot, monkeypatch):
+        """Test that a failing Sheets batch is retried, then dropped with its IDs logged."""
+        monkeypatch.setattr("treecko_bot.bot.SHEETS_RETRY_DELAY_SECONDS", 0)
+        bot.sheets = MagicMock()
+        bot.sheets.is_configured.return_value = True
+        bot.sheets.append_rows.return_value = False
+        bot.refresh_sheets_status()
+        row = GoogleSheetsManager("credentials.json", "sheet_id").build_row(
+            datetime(2024, 11, 15), "Test", 10.0, "expense", transaction_id="TX1"
+        )
+        bot._sheets_queue.put_nowait(row)
+
+        with patch("treecko_bot.bot.logger") as mock_logger:
+            assert await bot.flush_sheets_queue() == 0
+
+        assert bot.sheets.append_rows.call_count == SHEETS_MAX_ATTEMPTS
+        assert mock_logger.error.call_args[1]["transaction_ids"] == ["TX1"]
+
+    @pytest.mark.asyncio
+    async def test_sheets_flush_succeeds_on_retry(self, bot, monkeypatch):
+        """Test that a Sheets batch failing once is written on the next attempt."""
+        monkeypatch.setattr("treecko_bot.bot.SHEETS_RETRY_DELAY_SECONDS", 0)
+        bot.sheets = MagicMock()
+        bot.sheets.is_configured.return_value = True
+        bot.sheets.append_rows.side_effect = [False, True]
+        bot.refresh_sheets_status()
+        bot._sheets_queue.put_nowait(["row"])
+
+        assert await bot.flush_sheets_queue() == 1
+        assert bot.sheets.append_rows.call_count == 2
 
     @pytest.mark.asyncio
     async def test_handle_pdf_document_error(self, bot, mock_update, mock_context):
@@ -196,16 +459,12 @@ class TestTreeckoBotDocumentHandler:
 
         # Mock file download with valid PDF magic bytes
         mock_file = AsyncMock()
-        mock_file.download_as_bytearray = AsyncMock(
-            return_value=bytearray(b"%PDF-1.4 mock pdf content")
-        )
+        mock_file.download_to_drive = _mock_download(b"%PDF-1.4 mock pdf content")
         mock_context.bot = MagicMock()
         mock_context.bot.get_file = AsyncMock(return_value=mock_file)
 
         # Mock PDF parser to raise an error
-        with patch.object(
-            bot.pdf_parser, "parse_from_bytes", side_effect=ValueError("Parse error")
-        ):
+        with patch.object(bot.pdf_parser, "parse", side_effect=ValueError("Parse error")):
             await bot.handle_document(mock_update, mock_context)
 
         # Should show error message
@@ -259,6 +518,16 @@ class TestTreeckoBotReportCommand:
         call_args = mock_update.message.reply_text.call_args
         assert "all time" in call_args[0][0]
 
+    @pytest.mark.asyncio
+    async def test_report_command_unknown_period_uses_default(self, bot, mock_update, mock_context):
+        """Test the /report command falls back to 30 days for unknown periods."""
+        mock_context.args = ["Decade"]
+
+        await bot.report(mock_update, mock_context)
+
+        call_args = mock_update.message.reply_text.call_args
+        assert "last 30 days" in call_args[0][0]
+
     @pytest.mark.asyncio
     async def test_report_command_shows_summary(self, bot, mock_update, mock_context):
         """Test the /report command shows transaction summary data."""
@@ -321,6 +590,62 @@ class TestTreeckoBotExportCommand:
         assert "Exported 1 transactions" in call_args[1]["caption"]
         assert call_args[1]["parse_mode"] == "Markdown"
 
+    @pytest.mark.asyncio
+    async def test_export_command_csv_content(self, bot, mock_update, mock_context):
+        """Test that the exported CSV contains the header and transaction rows."""
+        mock_update.message.reply_document = AsyncMock()
+
+        bot.db.add_transaction(
+            date=datetime(2024, 11, 15, 10, 30, 0),
+            description='Café, "especial"',
+            amount=100.00,
+            transaction_type="expense",
+        )
+
+        await bot.export(mock_update, mock_context)
+
+        document = mock_update.message.reply_document.call_args[1]["document"]
+        content = document.input_file_content.decode("utf-8")
+        lines = content.splitlines()
+        assert lines[0].startswith("Date,Description,Amount")
+        assert lines[1].startswith('2024-11-15 10:30:00,"Café, ""especial""",100.0,expense')
+
+
+class TestTreeckoBotSlots:
+    """Tests for TreeckoBot attribute layout."""
+
+    def test_bot_has_no_instance_dict(self, bot):
+        """Test that TreeckoBot stores its attributes in slots."""
+        assert not hasattr(bot, "__dict__")
+        with pytest.raises(AttributeError):
+            bot.unknown_attribute = True
+
+
+class TestTreeckoBotSheetsSetup:
+    """Tests for Google Sheets setup in TreeckoBot."""
+
+    def test_sheets_created_when_credentials_exist(self, config, tmp_path):
+        """Test that Sheets is set up when the credentials file was found."""
+        credentials = tmp_path / "credentials.json"
+        credentials.write_text("{}")
+        config = replace(
+            config, google_sheet_id="sheet_id", google_credentials_path=str(credentials)
+        )
+
+        bot = TreeckoBot(config)
+
+        assert bot.sheets is not None
+        bot.db.close()
+
+    def test_sheets_skipped_when_credentials_missing(self, config):
+        """Test that Sheets is not set up without a credentials file."""
+        config = replace(config, google_sheet_id="sheet_id")
+
+        bot = TreeckoBot(config)
+
+        assert bot.sheets is None
+        bot.db.close()
+
 
 class TestTreeckoBotApplication:
     """Tests for TreeckoBot application creation."""
@@ -333,3 +658,16 @@ class TestTreeckoBotApplication:
         assert app is not None
         # Application should have handlers
         assert len(app.handlers) > 0
+
+    def test_run_webhook_uses_token_hash_path(self, bot):
+        """Test that webhook mode registers a path derived from the token hash."""
+        application = MagicMock()
+        bot.config = replace(bot.config, webhook_base_url="https://example.com")
+
+        bot._run_webhook(application)
+
+        kwargs = application.run_webhook.call_args[1]
+        assert len(bot._webhook_token_hash) == 16
+        assert kwargs["url_path"] == f"/webhook/{bot._webhook_token_hash}"
+        assert kwargs["webhook_url"] == f"https://example.com/webhook/{bot._webhook_token_hash}"
+        assert bot.config.telegram_token not in kwargs["webhook_url"]
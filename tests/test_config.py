@@ -1,23 +1,52 @@
 """Tests for the configuration module."""
 
-import os
+import dataclasses
 
 import pytest
 
 from treecko_bot.authorization import AuthorizationMode
-from treecko_bot.config import Config
+from treecko_bot.config import Config, get_config
 
 # Valid test token that matches the expected format: <bot_id>:<hash>
 VALID_TEST_TOKEN = "123456789:ABCdefGHIjklMNOpqrSTUvwxYZ_0123456"
 
-
-def test_config_from_env():
+# Every environment variable read by Config.from_env
+CONFIG_ENV_VARS = (
+    "TELEGRAM_BOT_TOKEN",
+    "GOOGLE_CREDENTIALS_PATH",
+    "GOOGLE_SHEET_ID",
+    "DATABASE_PATH",
+    "WEBHOOK_BASE_URL",
+    "PORT",
+    "HEALTH_CHECK_PORT",
+    "RATE_LIMIT_ENABLED",
+    "RATE_LIMIT_MAX_REQUESTS",
+    "RATE_LIMIT_WINDOW_SECONDS",
+    "AUTH_MODE",
+    "AUTH_ADMIN_IDS",
+    "AUTH_WHITELIST_IDS",
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Start every test without any configuration variables set."""
+    for name in CONFIG_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def valid_token(clean_env, monkeypatch):
+    """Provide a valid bot token, which every configuration requires."""
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", VALID_TEST_TOKEN)
+
+
+def test_config_from_env(monkeypatch):
     """Test loading configuration from environment variables."""
-    os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-    os.environ["GOOGLE_SHEET_ID"] = "test_sheet_id"
-    os.environ["DATABASE_PATH"] = "test.db"
-    os.environ["WEBHOOK_BASE_URL"] = "https://test.example.com"
-    os.environ["PORT"] = "9000"
+    monkeypatch.setenv("GOOGLE_SHEET_ID", "test_sheet_id")
+    monkeypatch.setenv("DATABASE_PATH", "test.db")
+    monkeypatch.setenv("WEBHOOK_BASE_URL", "https://test.example.com")
+    monkeypatch.setenv("PORT", "9000")
 
     config = Config.from_env()
 
@@ -27,18 +56,10 @@ def test_config_from_env():
     assert config.webhook_base_url == "https://test.example.com"
     assert config.port == 9000
 
-    # Clean up
-    del os.environ["TELEGRAM_BOT_TOKEN"]
-    del os.environ["GOOGLE_SHEET_ID"]
-    del os.environ["DATABASE_PATH"]
-    del os.environ["WEBHOOK_BASE_URL"]
-    del os.environ["PORT"]
-
 
-def test_config_missing_token():
+def test_config_missing_token(monkeypatch):
     """Test that missing token raises ValueError."""
-    if "TELEGRAM_BOT_TOKEN" in os.environ:
-        del os.environ["TELEGRAM_BOT_TOKEN"]
+    monkeypatch.delenv("TELEGRAM_BOT_TOKEN")
 
     with pytest.raises(ValueError):
         Config.from_env()
@@ -46,13 +67,6 @@ def test_config_missing_token():
 
 def test_config_defaults():
     """Test default configuration values."""
-    os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-    # Ensure webhook-related vars are not set
-    if "WEBHOOK_BASE_URL" in os.environ:
-        del os.environ["WEBHOOK_BASE_URL"]
-    if "PORT" in os.environ:
-        del os.environ["PORT"]
-
     config = Config.from_env()
 
     assert config.google_credentials_path == "credentials.json"
@@ -60,195 +74,141 @@ def test_config_defaults():
     assert config.webhook_base_url == ""
     assert config.port == 8080
 
-    # Clean up
-    del os.environ["TELEGRAM_BOT_TOKEN"]
-
 
-def test_config_invalid_port():
+def test_config_invalid_port(monkeypatch):
     """Test that invalid PORT raises ValueError with helpful message."""
-    os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-    os.environ["PORT"] = "not_a_number"
+    monkeypatch.setenv("PORT", "not_a_number")
 
     with pytest.raises(ValueError, match="PORT must be a valid integer"):
         Config.from_env()
 
-    # Clean up
-    del os.environ["TELEGRAM_BOT_TOKEN"]
-    del os.environ["PORT"]
 
+def test_config_credentials_exists(monkeypatch, tmp_path):
+    """Test that the credentials file is checked once when loading."""
+    credentials = tmp_path / "credentials.json"
+    credentials.write_text("{}")
+    monkeypatch.setenv("GOOGLE_CREDENTIALS_PATH", str(credentials))
 
-class TestConfigValidation:
-    """Tests for configuration validation."""
+    assert Config.from_env().google_credentials_exists is True
 
-    def test_invalid_telegram_token_format(self):
-        """Test that invalid token format raises ValueError."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = "invalid_token"
+    monkeypatch.setenv("GOOGLE_CREDENTIALS_PATH", str(tmp_path / "missing.json"))
+    assert Config.from_env().google_credentials_exists is False
 
-        with pytest.raises(ValueError, match="TELEGRAM_BOT_TOKEN format is invalid"):
-            Config.from_env()
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
+def test_config_built_directly_checks_credentials(tmp_path):
+    """Test that configs built without from_env still detect the credentials file."""
+    credentials = tmp_path / "credentials.json"
+    credentials.write_text("{}")
 
-    def test_telegram_token_without_colon(self):
-        """Test that token without colon raises ValueError."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = "123456789ABCdefGHI"
+    config = Config(
+        telegram_token=VALID_TEST_TOKEN,
+        google_credentials_path=str(credentials),
+        google_sheet_id="sheet_id",
+        database_path="test.db",
+        webhook_base_url="",
+        port=8080,
+        health_check_port=8081,
+    )
 
-        with pytest.raises(ValueError, match="TELEGRAM_BOT_TOKEN format is invalid"):
-            Config.from_env()
+    assert config.google_credentials_exists is True
+    assert (
+        dataclasses.replace(
+            config, google_credentials_path=str(tmp_path / "missing.json")
+        ).google_credentials_exists
+        is False
+    )
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
 
-    def test_telegram_token_with_non_numeric_bot_id(self):
-        """Test that token with non-numeric bot ID raises ValueError."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = "abc:ABCdefGHI"
+def test_get_config_is_cached():
+    """Test that get_config loads the configuration once until cleared."""
+    get_config.cache_clear()
 
-        with pytest.raises(ValueError, match="TELEGRAM_BOT_TOKEN format is invalid"):
-            Config.from_env()
+    config = get_config()
+    assert get_config() is config
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-
-    def test_valid_webhook_url_http(self):
-        """Test that valid http URL is accepted."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["WEBHOOK_BASE_URL"] = "http://localhost:8080"
-
-        config = Config.from_env()
-        assert config.webhook_base_url == "http://localhost:8080"
+    get_config.cache_clear()
+    assert get_config() is not config
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["WEBHOOK_BASE_URL"]
+    # Don't leave a config loaded from the patched environment behind
+    get_config.cache_clear()
 
-    def test_valid_webhook_url_https(self):
-        """Test that valid https URL is accepted."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["WEBHOOK_BASE_URL"] = "https://api.example.com"
 
-        config = Config.from_env()
-        assert config.webhook_base_url == "https://api.example.com"
-
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["WEBHOOK_BASE_URL"]
+def test_config_is_immutable():
+    """Test that configuration fields cannot be reassigned."""
+    config = Config.from_env()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.port = 9999
 
-    def test_invalid_webhook_url_scheme(self):
-        """Test that invalid URL scheme raises ValueError."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["WEBHOOK_BASE_URL"] = "ftp://example.com"
 
-        with pytest.raises(ValueError, match="must use http or https scheme"):
-            Config.from_env()
-
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["WEBHOOK_BASE_URL"]
+class TestConfigValidation:
+    """Tests for configuration validation."""
 
-    def test_invalid_webhook_url_no_host(self):
-        """Test that URL without hostname raises ValueError."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["WEBHOOK_BASE_URL"] = "https://"
+    @pytest.mark.parametrize(
+        "token",
+        [
+            "invalid_token",
+            "123456789ABCdefGHI",  # no colon
+            "abc:ABCdefGHI",  # non-numeric bot ID
+            VALID_TEST_TOKEN + "\n",  # trailing newline
+        ],
+    )
+    def test_invalid_telegram_token(self, monkeypatch, token):
+        """Test that malformed tokens raise ValueError."""
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", token)
 
-        with pytest.raises(ValueError, match="must have a valid hostname"):
+        with pytest.raises(ValueError, match="TELEGRAM_BOT_TOKEN format is invalid"):
             Config.from_env()
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["WEBHOOK_BASE_URL"]
-
-    def test_webhook_url_with_trailing_slash(self):
-        """Test that URL with trailing slash raises ValueError."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["WEBHOOK_BASE_URL"] = "https://example.com/"
-
-        with pytest.raises(ValueError, match="should not end with a trailing slash"):
+    @pytest.mark.parametrize("url", ["http://localhost:8080", "https://api.example.com"])
+    def test_valid_webhook_url(self, monkeypatch, url):
+        """Test that http and https URLs are accepted."""
+        monkeypatch.setenv("WEBHOOK_BASE_URL", url)
+
+        assert Config.from_env().webhook_base_url == url
+
+    @pytest.mark.parametrize(
+        ("url", "match"),
+        [
+            ("ftp://example.com", "must use http or https scheme"),
+            ("https://", "must have a valid hostname"),
+            ("https://example.com/", "should not end with a trailing slash"),
+        ],
+    )
+    def test_invalid_webhook_url(self, monkeypatch, url, match):
+        """Test that invalid webhook URLs raise ValueError."""
+        monkeypatch.setenv("WEBHOOK_BASE_URL", url)
+
+        with pytest.raises(ValueError, match=match):
             Config.from_env()
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["WEBHOOK_BASE_URL"]
-
-    def test_port_below_minimum(self):
-        """Test that port below 1 raises ValueError."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["PORT"] = "0"
+    @pytest.mark.parametrize("port", ["0", "65536"])
+    def test_port_out_of_range(self, monkeypatch, port):
+        """Test that ports outside 1-65535 raise ValueError."""
+        monkeypatch.setenv("PORT", port)
 
         with pytest.raises(ValueError, match="PORT must be between 1 and 65535"):
             Config.from_env()
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["PORT"]
+    @pytest.mark.parametrize("port", [1, 65535])
+    def test_valid_port_boundary(self, monkeypatch, port):
+        """Test that the minimum and maximum ports are accepted."""
+        monkeypatch.setenv("PORT", str(port))
 
-    def test_port_above_maximum(self):
-        """Test that port above 65535 raises ValueError."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["PORT"] = "65536"
-
-        with pytest.raises(ValueError, match="PORT must be between 1 and 65535"):
-            Config.from_env()
+        assert Config.from_env().port == port
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["PORT"]
-
-    def test_valid_port_boundary_min(self):
-        """Test that minimum port (1) is accepted."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["PORT"] = "1"
-
-        config = Config.from_env()
-        assert config.port == 1
-
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["PORT"]
-
-    def test_valid_port_boundary_max(self):
-        """Test that maximum port (65535) is accepted."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["PORT"] = "65535"
-
-        config = Config.from_env()
-        assert config.port == 65535
-
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["PORT"]
-
-    def test_invalid_database_path_extension(self):
+    def test_invalid_database_path_extension(self, monkeypatch):
         """Test that invalid database extension raises ValueError."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["DATABASE_PATH"] = "data.txt"
+        monkeypatch.setenv("DATABASE_PATH", "data.txt")
 
         with pytest.raises(ValueError, match="DATABASE_PATH must end with one of"):
             Config.from_env()
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["DATABASE_PATH"]
-
-    def test_valid_database_path_db(self):
-        """Test that .db extension is accepted."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["DATABASE_PATH"] = "mydata.db"
-
-        config = Config.from_env()
-        assert config.database_path == "mydata.db"
-
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["DATABASE_PATH"]
-
-    def test_valid_database_path_sqlite(self):
-        """Test that .sqlite extension is accepted."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["DATABASE_PATH"] = "mydata.sqlite"
+    @pytest.mark.parametrize("path", ["mydata.db", "mydata.sqlite", "mydata.sqlite3"])
+    def test_valid_database_path(self, monkeypatch, path):
+        """Test that each supported database extension is accepted."""
+        monkeypatch.setenv("DATABASE_PATH", path)
 
-        config = Config.from_env()
-        assert config.database_path == "mydata.sqlite"
-
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["DATABASE_PATH"]
-
-    def test_valid_database_path_sqlite3(self):
-        """Test that .sqlite3 extension is accepted."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["DATABASE_PATH"] = "mydata.sqlite3"
-
-        config = Config.from_env()
-        assert config.database_path == "mydata.sqlite3"
-
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["DATABASE_PATH"]
+        assert Config.from_env().database_path == path
 
 
 class TestRateLimitConfig:
@@ -256,22 +216,17 @@ class TestRateLimitConfig:
 
     def test_rate_limit_defaults(self):
         """Test default rate limit configuration."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-
         config = Config.from_env()
 
         assert config.rate_limit_config.enabled is True
         assert config.rate_limit_config.max_requests == 10
         assert config.rate_limit_config.window_seconds == 60
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-
-    def test_rate_limit_custom_values(self):
+    def test_rate_limit_custom_values(self, monkeypatch):
         """Test custom rate limit configuration."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["RATE_LIMIT_ENABLED"] = "false"
-        os.environ["RATE_LIMIT_MAX_REQUESTS"] = "5"
-        os.environ["RATE_LIMIT_WINDOW_SECONDS"] = "30"
+        monkeypatch.setenv("RATE_LIMIT_ENABLED", "false")
+        monkeypatch.setenv("RATE_LIMIT_MAX_REQUESTS", "5")
+        monkeypatch.setenv("RATE_LIMIT_WINDOW_SECONDS", "30")
 
         config = Config.from_env()
 
@@ -279,68 +234,44 @@ class TestRateLimitConfig:
         assert config.rate_limit_config.max_requests == 5
         assert config.rate_limit_config.window_seconds == 30
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["RATE_LIMIT_ENABLED"]
-        del os.environ["RATE_LIMIT_MAX_REQUESTS"]
-        del os.environ["RATE_LIMIT_WINDOW_SECONDS"]
-
-    def test_rate_limit_invalid_values_use_defaults(self):
+    def test_rate_limit_invalid_values_use_defaults(self, monkeypatch):
         """Test that invalid rate limit values fall back to defaults."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["RATE_LIMIT_MAX_REQUESTS"] = "invalid"
-        os.environ["RATE_LIMIT_WINDOW_SECONDS"] = "-5"
+        monkeypatch.setenv("RATE_LIMIT_MAX_REQUESTS", "invalid")
+        monkeypatch.setenv("RATE_LIMIT_WINDOW_SECONDS", "-5")
 
         config = Config.from_env()
 
         assert config.rate_limit_config.max_requests == 10  # default
         assert config.rate_limit_config.window_seconds == 60  # default
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["RATE_LIMIT_MAX_REQUESTS"]
-        del os.environ["RATE_LIMIT_WINDOW_SECONDS"]
-
 
 class TestAuthorizationConfig:
     """Tests for authorization configuration loading."""
 
     def test_auth_defaults(self):
         """Test default authorization configuration."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-
         config = Config.from_env()
 
         assert config.auth_config.mode == AuthorizationMode.OPEN
         assert config.auth_config.admin_user_ids == set()
         assert config.auth_config.whitelisted_user_ids == set()
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-
-    def test_auth_whitelist_mode(self):
+    def test_auth_whitelist_mode(self, monkeypatch):
         """Test whitelist authorization configuration."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["AUTH_MODE"] = "whitelist"
-        os.environ["AUTH_WHITELIST_IDS"] = "123,456,789"
+        monkeypatch.setenv("AUTH_MODE", "whitelist")
+        monkeypatch.setenv("AUTH_WHITELIST_IDS", "123,456,789")
 
         config = Config.from_env()
 
         assert config.auth_config.mode == AuthorizationMode.WHITELIST
         assert config.auth_config.whitelisted_user_ids == {123, 456, 789}
 
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["AUTH_MODE"]
-        del os.environ["AUTH_WHITELIST_IDS"]
-
-    def test_auth_admin_only_mode(self):
+    def test_auth_admin_only_mode(self, monkeypatch):
         """Test admin_only authorization configuration."""
-        os.environ["TELEGRAM_BOT_TOKEN"] = VALID_TEST_TOKEN
-        os.environ["AUTH_MODE"] = "admin_only"
-        os.environ["AUTH_ADMIN_IDS"] = "111,222"
+        monkeypatch.setenv("AUTH_MODE", "admin_only")
+        monkeypatch.setenv("AUTH_ADMIN_IDS", "111,222")
 
         config = Config.from_env()
 
         assert config.auth_config.mode == AuthorizationMode.ADMIN_ONLY
         assert config.auth_config.admin_user_ids == {111, 222}
-
-        del os.environ["TELEGRAM_BOT_TOKEN"]
-        del os.environ["AUTH_MODE"]
-        del os.environ["AUTH_ADMIN_IDS"]
@@ -2,12 +2,26 @@
 
 import os
 import tempfile
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import event, inspect, select
+from sqlalchemy.exc import IntegrityError, InvalidRequestError, OperationalError
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
-from treecko_bot.database import AsyncDatabaseManager, DatabaseManager
+from treecko_bot.database import (
+    ASYNC_POOL_SIZE,
+    AsyncDatabaseManager,
+    Category,
+    DatabaseManager,
+    MonthlySummary,
+    Transaction,
+)
 
 
 @pytest.fixture
@@ -17,6 +31,7 @@ def db():
         db_path = f.name
     manager = DatabaseManager(db_path)
     yield manager
+    manager.close()
     os.unlink(db_path)
 
 
@@ -37,6 +52,29 @@ def test_add_transaction(db):
     assert tx.transaction_id == "TEST123"
 
 
+def test_add_transaction_does_not_reload_row(db):
+    """Test that inserting returns a usable object without a refresh SELECT."""
+    statements = []
+    event.listen(
+        db.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    tx = db.add_transaction(
+        date=datetime(2024, 11, 15),
+        description="No refresh",
+        amount=1.0,
+    )
+
+    assert tx.id is not None
+    assert tx.created_at is not None
+    assert not any(
+        s.lstrip().upper().startswith("SELECT") and "FROM transactions" in s
+        for s in statements
+    )
+
+
 def test_transaction_exists(db):
     """Test checking if a transaction exists."""
     db.add_transaction(
@@ -50,6 +88,128 @@ def test_transaction_exists(db):
     assert not db.transaction_exists("NONEXISTENT")
 
 
+def test_existing_ids(db):
+    """Test finding which transaction IDs are already stored."""
+    for tid in ("A1", "A2", "A3"):
+        db.add_transaction(
+            date=datetime(2024, 11, 15),
+            description="Test transaction",
+            amount=1.0,
+            transaction_id=tid,
+        )
+
+    with patch("treecko_bot.database.IN_CLAUSE_CHUNK_SIZE", 2):
+        found = db.existing_ids(["A1", "A3", "B1", "B2", "A1"])
+
+    assert found == {"A1", "A3"}
+    assert db.existing_ids([]) == set()
+
+
+def test_transaction_exists_uses_seen_cache(db):
+    """Test that repeated lookups of a known ID skip the database."""
+    db.add_transaction(
+        date=datetime(2024, 11, 15),
+        description="Test transaction",
+        amount=100.50,
+        transaction_id="CACHED123",
+    )
+
+    with patch.object(db, "get_read_session") as mock_session:
+        assert db.transaction_exists("CACHED123")
+        mock_session.assert_not_called()
+
+
+def test_transaction_exists_does_not_cache_misses(db):
+    """Test that a missing ID is looked up again after it is added."""
+    assert not db.transaction_exists("LATER123")
+
+    db.add_transaction(
+        date=datetime(2024, 11, 15),
+        description="Test transaction",
+        amount=100.50,
+        transaction_id="LATER123",
+    )
+
+    assert db.transaction_exists("LATER123")
+
+
+def test_seen_cache_is_bounded(db):
+    """Test that the seen-ID cache evicts the least recently used entry."""
+    with patch("treecko_bot.database.SEEN_TRANSACTION_CACHE_SIZE", 2):
+        for tid in ("A", "B", "C"):
+            db._remember_transaction_id(tid)
+
+    assert list(db._seen_ids) == ["B", "C"]
+
+
+def test_add_transactions_bulk(db):
+    """Test inserting many transactions at once."""
+    rows = [
+        {
+            "date": datetime(2024, 11, day),
+            "description": f"Bulk transaction {day}",
+            "amount": float(day),
+            "transaction_id": f"BULK{day}",
+            "transaction_type": "expense",
+        }
+        for day in range(1, 6)
+    ]
+
+    assert db.add_transactions_bulk(rows, chunk_size=2) == 5
+
+    stored = db.get_all_transactions()
+    assert len(stored) == 5
+    assert all(t.created_at is not None for t in stored)
+    assert db.transaction_exists("BULK3")
+
+
+def test_add_transactions_bulk_is_atomic(db):
+    """Test that a failing bulk insert stores none of its rows."""
+    rows = [
+        {
+            "date": datetime(2024, 11, 15),
+            "description": "Duplicate",
+            "amount": 1.0,
+            "transaction_id": "DUP1",
+        }
+    ] * 2
+
+    with pytest.raises(IntegrityError):
+        db.add_transactions_bulk(rows)
+
+    assert db.get_all_transactions() == []
+    assert not db.transaction_exists("DUP1")
+
+
+def test_add_transactions_bulk_skip_existing(db):
+    """Test that already stored and repeated IDs are skipped on import."""
+    db.add_transaction(
+        date=datetime(2024, 11, 1),
+        description="Stored",
+        amount=1.0,
+        transaction_id="OLD1",
+    )
+    rows = [
+        {
+            "date": datetime(2024, 11, 2),
+            "description": description,
+            "amount": 1.0,
+            "transaction_id": transaction_id,
+        }
+        for description, transaction_id in (
+            ("Old again", "OLD1"),
+            ("New", "NEW1"),
+            ("New again", "NEW1"),
+            ("No ID", None),
+        )
+    ]
+
+    assert db.add_transactions_bulk(rows, chunk_size=2, skip_existing=True) == 2
+
+    descriptions = sorted(t.description for t in db.get_all_transactions())
+    assert descriptions == ["New", "No ID", "Stored"]
+
+
 def test_get_transaction_by_id(db):
     """Test retrieving a transaction by ID."""
     db.add_transaction(
@@ -84,6 +244,24 @@ def test_get_all_transactions(db):
     assert len(all_tx) == 2
 
 
+def test_iter_transactions(db):
+    """Test streaming transactions in batches."""
+    for day in range(1, 4):
+        db.add_transaction(
+            date=datetime(2024, 11, day),
+            description=f"Streamed {day}",
+            amount=float(day),
+        )
+
+    streamed = list(db.iter_transactions(batch_size=2))
+
+    assert sorted(t.description for t in streamed) == [
+        "Streamed 1",
+        "Streamed 2",
+        "Streamed 3",
+    ]
+
+
 def test_get_transactions_by_date_range(db):
     """Test getting transactions within a date range."""
     db.add_transaction(
@@ -116,6 +294,62 @@ def test_get_transactions_by_date_range(db):
     assert len(all_tx) == 3
 
 
+def test_iter_transaction_rows(db):
+    """Test streaming a column projection of every transaction."""
+    db.add_transaction(
+        date=datetime(2024, 11, 1),
+        description="Projected",
+        amount=12.5,
+        transaction_id="PROJ1",
+        raw_text="large pdf text",
+    )
+
+    rows = list(db.iter_transaction_rows(Transaction.transaction_id, Transaction.amount))
+
+    assert [tuple(row) for row in rows] == [("PROJ1", 12.5)]
+
+
+def test_count_transactions(db):
+    """Test counting transactions overall and within a date range."""
+    for day in (1, 15, 30):
+        db.add_transaction(
+            date=datetime(2024, 11, day),
+            description=f"Counted {day}",
+            amount=10.0,
+        )
+
+    assert db.count_transactions() == 3
+    assert db.count_transactions(datetime(2024, 11, 10), datetime(2024, 11, 30)) == 2
+    assert db.count_transactions(end_date=datetime(2024, 10, 31)) == 0
+
+
+def test_list_transactions_brief(db):
+    """Test listing date/amount/description/category tuples in a range."""
+    db.add_transaction(
+        date=datetime(2024, 11, 1),
+        description="Early",
+        amount=100.00,
+        category="Food",
+    )
+    db.add_transaction(
+        date=datetime(2024, 11, 15),
+        description="Late",
+        amount=200.00,
+    )
+    db.add_transaction(
+        date=datetime(2024, 12, 1),
+        description="Out of range",
+        amount=300.00,
+    )
+
+    brief = db.list_transactions_brief(datetime(2024, 11, 1), datetime(2024, 11, 30))
+
+    assert [tuple(row) for row in brief] == [
+        (datetime(2024, 11, 15), 200.00, "Late", None),
+        (datetime(2024, 11, 1), 100.00, "Early", "Food"),
+    ]
+
+
 def test_get_transaction_summary(db):
     """Test getting transaction summary statistics."""
     db.add_transaction(
@@ -146,6 +380,33 @@ def test_get_transaction_summary(db):
     assert summary["expense_count"] == 2
 
 
+def test_get_transaction_summary_empty(db):
+    """Test the summary of an empty database."""
+    summary = db.get_transaction_summary()
+    assert summary == {
+        "total_income": 0.0,
+        "total_expense": 0.0,
+        "net_balance": 0.0,
+        "transaction_count": 0,
+        "income_count": 0,
+        "expense_count": 0,
+    }
+
+
+def test_get_transaction_summary_counts_untyped(db):
+    """Test that transactions without a type count but add no totals."""
+    db.add_transaction(
+        date=datetime(2024, 11, 15),
+        description="Untyped",
+        amount=42.00,
+    )
+
+    summary = db.get_transaction_summary()
+    assert summary["transaction_count"] == 1
+    assert summary["total_income"] == 0.0
+    assert summary["total_expense"] == 0.0
+
+
 def test_get_transaction_summary_with_date_filter(db):
     """Test getting transaction summary with date filter."""
     db.add_transaction(
@@ -170,6 +431,223 @@ def test_get_transaction_summary_with_date_filter(db):
     assert summary["transaction_count"] == 1
 
 
+def test_monthly_summary_maintained_on_insert(db):
+    """Test that inserts keep the monthly rollup up to date."""
+    db.add_transaction(
+        date=datetime(2024, 11, 15),
+        description="Income",
+        amount=1000.00,
+        transaction_type="income",
+    )
+    db.add_transactions_bulk(
+        [
+            {
+                "date": datetime(2024, 11, 20),
+                "description": "Expense",
+                "amount": 300.0,
+                "transaction_type": "expense",
+            },
+            {
+                "date": datetime(2024, 12, 1),
+                "description": "Expense",
+                "amount": 50.0,
+                "transaction_type": "expense",
+            },
+        ]
+    )
+
+    with db.get_read_session() as session:
+        rows = {
+            (r.year, r.month, r.transaction_type): (r.total_amount, r.count)
+            for r in session.query(MonthlySummary)
+        }
+
+    assert rows == {
+        (2024, 11, "income"): (1000.0, 1),
+        (2024, 11, "expense"): (300.0, 1),
+        (2024, 12, "expense"): (50.0, 1),
+    }
+
+
+def test_add_transaction_updates_rollup_without_rescanning_month(db):
+    """Test that a single insert upserts its rollup row instead of re-aggregating."""
+    for day in range(1, 4):
+        db.add_transaction(
+            date=datetime(2024, 11, day),
+            description="Expense",
+            amount=10.0,
+            transaction_type="expense",
+        )
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        db.add_transaction(
+            date=datetime(2024, 11, 4),
+            description="Expense",
+            amount=10.0,
+            transaction_type="expense",
+        )
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+    # Constant work per insert: no DELETE and no re-read of the month's rows
+    assert not any("DELETE" in statement for statement in statements)
+    assert not any("FROM transactions" in statement for statement in statements)
+    with db.get_read_session() as session:
+        row = session.get(MonthlySummary, (2024, 11, "expense"))
+        assert (row.total_amount, row.count) == (40.0, 4)
+
+
+def test_get_transaction_summary_whole_months_uses_rollup(db):
+    """Test that month-aligned ranges match the live aggregation."""
+    db.add_transaction(
+        date=datetime(2024, 10, 31, 23, 0),
+        description="October",
+        amount=10.0,
+        transaction_type="expense",
+    )
+    db.add_transaction(
+        date=datetime(2024, 11, 30, 23, 0),
+        description="November",
+        amount=20.0,
+        transaction_type="expense",
+    )
+
+    november = db.get_transaction_summary(
+        start_date=datetime(2024, 11, 1),
+        end_date=datetime(2024, 11, 30, 23, 59, 59, 999999),
+    )
+    assert november["total_expense"] == 20.0
+    assert november["transaction_count"] == 1
+
+    with patch("treecko_bot.database._summary_query") as mock_live:
+        assert db.get_transaction_summary()["total_expense"] == 30.0
+        mock_live.assert_not_called()
+
+
+def test_get_transaction_summary_with_max_end_date(db):
+    """Test that datetime.max is accepted as an open upper bound."""
+    db.add_transaction(
+        date=datetime(2024, 11, 15),
+        description="Expense",
+        amount=20.0,
+        transaction_type="expense",
+    )
+
+    summary = db.get_transaction_summary(start_date=datetime(2024, 11, 1), end_date=datetime.max)
+
+    assert summary["total_expense"] == 20.0
+
+
+def test_monthly_summary_uses_utc_month_for_aware_dates(db):
+    """Test that bulk and single inserts of aware dates agree with the live summary."""
+    utc_minus_3 = timezone(timedelta(hours=-3))
+    # 22:00 on 31 March at UTC-3 is 1 April in UTC, where it is stored
+    db.add_transactions_bulk(
+        [
+            {
+                "date": datetime(2024, 3, 31, 22, 0, tzinfo=utc_minus_3),
+                "description": "Late March",
+                "amount": 10.0,
+                "transaction_type": "expense",
+            }
+        ]
+    )
+    db.add_transaction(
+        date=datetime(2024, 4, 10, tzinfo=utc_minus_3),
+        description="April",
+        amount=5.0,
+        transaction_type="expense",
+    )
+    april = {
+        "start_date": datetime(2024, 4, 1),
+        "end_date": datetime(2024, 4, 30, 23, 59, 59, 999999),
+    }
+
+    from_rollup = db.get_transaction_summary(**april)
+    with patch("treecko_bot.database._rollup_range", return_value=None):
+        live = db.get_transaction_summary(**april)
+
+    assert from_rollup == live
+    assert from_rollup["transaction_count"] == 2
+
+
+def test_monthly_summary_rebuilt_when_rows_in_wrong_month(tmp_path):
+    """Test that a rollup with the right total but wrong months is rebuilt."""
+    db_path = tmp_path / "misfiled.db"
+    manager = DatabaseManager(str(db_path))
+    manager.add_transaction(
+        date=datetime(2024, 4, 1, 1, 0),
+        description="April",
+        amount=10.0,
+        transaction_type="expense",
+    )
+    with manager.engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE monthly_summary SET month = 3")
+    manager.close()
+
+    manager = DatabaseManager(str(db_path))
+    summary = manager.get_transaction_summary(
+        start_date=datetime(2024, 4, 1),
+        end_date=datetime(2024, 4, 30, 23, 59, 59, 999999),
+    )
+    manager.close()
+
+    assert summary["transaction_count"] == 1
+
+
+def test_monthly_summary_backfilled_for_existing_database(tmp_path):
+    """Test that an empty rollup is rebuilt from existing transactions."""
+    db_path = tmp_path / "old.db"
+    manager = DatabaseManager(str(db_path))
+    manager.add_transaction(
+        date=datetime(2024, 9, 5),
+        description="Old",
+        amount=5.0,
+        transaction_type="income",
+    )
+    with manager.engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM monthly_summary")
+    manager.close()
+
+    manager = DatabaseManager(str(db_path))
+    summary = manager.get_transaction_summary()
+    manager.close()
+
+    assert summary["total_income"] == 5.0
+
+
+def test_monthly_summary_rebuilt_when_out_of_sync(tmp_path):
+    """Test that a rollup missing some transactions is rebuilt on open."""
+    db_path = tmp_path / "drifted.db"
+    manager = DatabaseManager(str(db_path))
+    for day in (5, 6):
+        manager.add_transaction(
+            date=datetime(2024, 9, day),
+            description="Income",
+            amount=5.0,
+            transaction_type="income",
+        )
+    # Simulate a row written without maintaining the rollup
+    with manager.engine.begin() as conn:
+        conn.exec_driver_sql(
+            "UPDATE monthly_summary SET total_amount = 5.0, count = 1"
+        )
+    manager.close()
+
+    manager = DatabaseManager(str(db_path))
+    summary = manager.get_transaction_summary()
+    manager.close()
+
+    assert summary["total_income"] == 10.0
+    assert summary["transaction_count"] == 2
+
+
 def test_add_category(db):
     """Test adding a category to the database."""
     category = db.add_category("Food")
@@ -199,6 +677,51 @@ def test_get_all_categories(db):
     assert categories[2].name == "Transport"
 
 
+def test_categories_cached_until_changed(db):
+    """Test that category reads are cached and refreshed after changes."""
+    db.add_category("Food")
+    assert [c.name for c in db.get_all_categories()] == ["Food"]
+
+    with patch.object(db, "get_read_session") as mock_session:
+        assert db.get_category_by_name("Food") is not None
+        assert [c.name for c in db.get_all_categories()] == ["Food"]
+        mock_session.assert_not_called()
+
+    db.add_category("Bills")
+    assert [c.name for c in db.get_all_categories()] == ["Bills", "Food"]
+
+    db.delete_category("Food")
+    assert db.get_category_by_name("Food") is None
+
+
+def test_category_invalidation_waits_for_inflight_load(db):
+    """Test that a load racing a write cannot leave a stale cache behind."""
+    loading = threading.Event()
+    release = threading.Event()
+    stale_session = MagicMock()
+    stale_session.__enter__.return_value = stale_session
+    stale_session.query.return_value.order_by.return_value.all.return_value = []
+
+    def slow_read_session():
+        # Snapshot taken before the write commits, returned after it
+        loading.set()
+        release.wait(5)
+        return stale_session
+
+    with patch.object(db, "get_read_session", side_effect=slow_read_session):
+        loader = threading.Thread(target=db.get_all_categories)
+        loader.start()
+        loading.wait(5)
+        writer = threading.Thread(target=db.add_category, args=("Food",))
+        writer.start()
+        time.sleep(0.1)
+        release.set()
+        loader.join(5)
+        writer.join(5)
+
+    assert [c.name for c in db.get_all_categories()] == ["Food"]
+
+
 def test_get_category_by_name(db):
     """Test retrieving a category by name."""
     db.add_category("Food")
@@ -252,12 +775,178 @@ def test_update_transaction_category(db):
     assert found_tx.category == "Food"
 
 
+def test_category_relationships_require_eager_loading(db):
+    """Test that category links raise on lazy access and load eagerly."""
+    tx = db.add_transaction(
+        date=datetime(2024, 11, 15),
+        description="Lunch",
+        amount=25.00,
+        category="Food",
+    )
+    db.add_category("Food")
+
+    with db.get_read_session() as session:
+        lazy_tx = session.get(Transaction, tx.id)
+        with pytest.raises(InvalidRequestError):
+            _ = lazy_tx.category_obj
+
+        eager_tx = session.scalars(
+            select(Transaction).options(selectinload(Transaction.category_obj))
+        ).one()
+        assert eager_tx.category_obj.name == "Food"
+
+        category = session.scalars(
+            select(Category).options(selectinload(Category.transactions))
+        ).one()
+        assert [t.description for t in category.transactions] == ["Lunch"]
+
+
 def test_update_nonexistent_transaction_category(db):
     """Test updating category of non-existent transaction."""
     success = db.update_transaction_category(99999, "Food")
     assert success is False
 
 
+def test_managers_share_engines_per_path(db):
+    """Test that managers on the same database reuse its engines."""
+    other = DatabaseManager(db.database_path)
+
+    assert other.engine is db.engine
+    assert other.read_engine is db.read_engine
+
+
+def test_schema_created_once_per_path(db):
+    """Test that further managers on a database skip the schema DDL."""
+    with patch("treecko_bot.database._create_schema") as mock_create_schema:
+        DatabaseManager(db.database_path)
+        DatabaseManager(db.database_path)
+
+    mock_create_schema.assert_not_called()
+
+
+def test_close_releases_shared_engines(tmp_path):
+    """Test that a closed database gets fresh engines when reopened."""
+    db_path = str(tmp_path / "reopen.db")
+    manager = DatabaseManager(db_path)
+    manager.close()
+
+    reopened = DatabaseManager(db_path)
+    assert reopened.engine is not manager.engine
+    reopened.close()
+
+
+def test_connections_use_wal_and_pragmas(db):
+    """Test that pooled connections are opened with the tuned PRAGMAs."""
+    with db.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+        assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -20000
+
+    with db.read_engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+
+
+def test_indexes_created(db):
+    """Test that the transactions table has its lookup indexes."""
+    index_names = {
+        index["name"] for index in inspect(db.engine).get_indexes("transactions")
+    }
+
+    assert {"ix_transactions_date", "ix_tx_type_date"} <= index_names
+
+
+def test_missing_indexes_added_to_existing_database(tmp_path):
+    """Test that indexes are added to a database created without them."""
+    db_path = tmp_path / "old.db"
+    manager = DatabaseManager(str(db_path))
+    with manager.engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_tx_type_date")
+    manager.close()
+
+    manager = DatabaseManager(str(db_path))
+    index_names = {
+        index["name"]
+        for index in inspect(manager.engine).get_indexes("transactions")
+    }
+    manager.close()
+
+    assert "ix_tx_type_date" in index_names
+
+
+def test_dates_stored_as_epoch_seconds(db):
+    """Test that transaction dates are stored as integers and round-trip."""
+    tx = db.add_transaction(
+        date=datetime(2024, 11, 15, 10, 30),
+        description="Epoch",
+        amount=1.0,
+        transaction_id="EPOCH1",
+    )
+
+    with db.engine.connect() as conn:
+        stored = conn.exec_driver_sql(
+            "SELECT typeof(date), date FROM transactions WHERE id = ?", (tx.id,)
+        ).one()
+
+    assert stored == ("integer", 1731666600)
+    assert db.get_transaction_by_id("EPOCH1").date == datetime(2024, 11, 15, 10, 30)
+
+
+def test_legacy_text_dates_converted(tmp_path):
+    """Test that ISO-8601 text dates from older databases are migrated."""
+    db_path = str(tmp_path / "legacy.db")
+    manager = DatabaseManager(db_path)
+    with manager.engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO transactions (date, description, amount) "
+            "VALUES ('2024-11-15 10:30:00.000000', 'Legacy', 5.0)"
+        )
+    manager.close()
+
+    manager = DatabaseManager(db_path)
+    found = manager.get_transactions_by_date_range(
+        datetime(2024, 11, 15), datetime(2024, 11, 16)
+    )
+    manager.close()
+
+    assert [t.date for t in found] == [datetime(2024, 11, 15, 10, 30)]
+
+
+def test_read_pool_is_read_only(db):
+    """Test that the read pool cannot modify the database."""
+    with db.read_engine.connect() as conn, pytest.raises(OperationalError):
+        conn.exec_driver_sql("DELETE FROM transactions")
+
+
+def test_reads_see_committed_writes(db):
+    """Test that reads through the read pool observe earlier writes."""
+    assert not db.transaction_exists("WAL123")
+
+    db.add_transaction(
+        date=datetime(2024, 11, 15),
+        description="Test transaction",
+        amount=10.0,
+        transaction_id="WAL123",
+    )
+
+    assert db.transaction_exists("WAL123")
+
+
+def test_read_pool_opens_path_with_uri_characters(tmp_path):
+    """Test that the read pool opens a path containing a space and a '#'."""
+    manager = DatabaseManager(str(tmp_path / "my data#1.db"))
+    manager.add_transaction(
+        date=datetime(2024, 11, 15),
+        description="Test transaction",
+        amount=10.0,
+        transaction_id="URI123",
+    )
+
+    assert manager.transaction_exists("URI123")
+    assert manager.count_transactions() == 1
+    manager.close()
+
+
 class TestAsyncDatabaseManager:
     """Tests for the async database manager."""
 
@@ -289,6 +978,75 @@ class TestAsyncDatabaseManager:
         assert tx.amount == 150.75
         assert tx.transaction_id == "ASYNC123"
 
+    @pytest.mark.asyncio
+    async def test_managers_share_engine_per_path(self, async_db):
+        """Test that async managers on the same database reuse its engine."""
+        other = AsyncDatabaseManager(async_db.database_path)
+        await other.initialize()
+
+        assert other.engine is async_db.engine
+
+    @pytest.mark.asyncio
+    async def test_engine_pools_connections(self, async_db):
+        """Test that the async engine keeps a pool of open connections."""
+        assert isinstance(async_db.engine.pool, AsyncAdaptedQueuePool)
+        assert async_db.engine.pool.size() == ASYNC_POOL_SIZE
+
+    @pytest.mark.asyncio
+    async def test_connections_use_wal_and_pragmas(self, async_db):
+        """Test that async connections are opened with the tuned PRAGMAs."""
+        async with async_db.engine.connect() as conn:
+            journal_mode = await conn.exec_driver_sql("PRAGMA journal_mode")
+            assert journal_mode.scalar() == "wal"
+            synchronous = await conn.exec_driver_sql("PRAGMA synchronous")
+            assert synchronous.scalar() == 1
+            mmap_size = await conn.exec_driver_sql("PRAGMA mmap_size")
+            assert mmap_size.scalar() == 256 * 1024 * 1024
+
+    @pytest.mark.asyncio
+    async def test_add_transactions_bulk(self, async_db):
+        """Test inserting many transactions at once asynchronously."""
+        rows = [
+            {
+                "date": datetime(2024, 11, day),
+                "description": f"Async bulk transaction {day}",
+                "amount": float(day),
+                "transaction_id": f"ASYNCBULK{day}",
+            }
+            for day in range(1, 4)
+        ]
+
+        assert await async_db.add_transactions_bulk(rows, chunk_size=2) == 3
+        assert len(await async_db.get_all_transactions()) == 3
+        assert await async_db.transaction_exists("ASYNCBULK2")
+
+    @pytest.mark.asyncio
+    async def test_add_transactions_bulk_skip_existing(self, async_db):
+        """Test that already stored IDs are skipped on async import."""
+        await async_db.add_transaction(
+            date=datetime(2024, 11, 1),
+            description="Stored",
+            amount=1.0,
+            transaction_id="ASYNCOLD1",
+        )
+        rows = [
+            {
+                "date": datetime(2024, 11, 2),
+                "description": description,
+                "amount": 1.0,
+                "transaction_id": transaction_id,
+            }
+            for description, transaction_id in (
+                ("Dup", "ASYNCOLD1"),
+                ("New", "ASYNCNEW1"),
+            )
+        ]
+
+        inserted = await async_db.add_transactions_bulk(rows, skip_existing=True)
+
+        assert inserted == 1
+        assert len(await async_db.get_all_transactions()) == 2
+
     @pytest.mark.asyncio
     async def test_transaction_exists(self, async_db):
         """Test checking if a transaction exists asynchronously."""
@@ -302,6 +1060,37 @@ class TestAsyncDatabaseManager:
         assert await async_db.transaction_exists("ASYNCUNIQUE123")
         assert not await async_db.transaction_exists("NONEXISTENT")
 
+    @pytest.mark.asyncio
+    async def test_existing_ids(self, async_db):
+        """Test finding which transaction IDs are stored asynchronously."""
+        await async_db.add_transaction(
+            date=datetime(2024, 11, 15),
+            description="Async Test transaction",
+            amount=1.0,
+            transaction_id="ASYNCA1",
+        )
+
+        found = await async_db.existing_ids(["ASYNCA1", "ASYNCB1"])
+
+        assert found == {"ASYNCA1"}
+
+    @pytest.mark.asyncio
+    async def test_get_transaction_summary(self, async_db):
+        """Test getting transaction summary statistics asynchronously."""
+        for amount, transaction_type in ((1000.0, "income"), (300.0, "expense")):
+            await async_db.add_transaction(
+                date=datetime(2024, 11, 15),
+                description="Async summary",
+                amount=amount,
+                transaction_type=transaction_type,
+            )
+
+        summary = await async_db.get_transaction_summary(
+            start_date=datetime(2024, 11, 1), end_date=datetime(2024, 11, 30)
+        )
+        assert summary["net_balance"] == 700.0
+        assert summary["transaction_count"] == 2
+
     @pytest.mark.asyncio
     async def test_get_transaction_by_id(self, async_db):
         """Test retrieving a transaction by ID asynchronously."""
@@ -336,6 +1125,72 @@ class TestAsyncDatabaseManager:
         all_tx = await async_db.get_all_transactions()
         assert len(all_tx) == 2
 
+    @pytest.mark.asyncio
+    async def test_iter_transactions(self, async_db):
+        """Test streaming transactions in batches asynchronously."""
+        for day in range(1, 4):
+            await async_db.add_transaction(
+                date=datetime(2024, 11, day),
+                description=f"Async streamed {day}",
+                amount=float(day),
+            )
+
+        streamed = [t async for t in async_db.iter_transactions(batch_size=2)]
+
+        assert len(streamed) == 3
+
+    @pytest.mark.asyncio
+    async def test_count_transactions(self, async_db):
+        """Test counting transactions asynchronously."""
+        await async_db.add_transaction(
+            date=datetime(2024, 11, 15),
+            description="Async counted",
+            amount=5.0,
+        )
+
+        assert await async_db.count_transactions() == 1
+        assert await async_db.count_transactions(start_date=datetime(2024, 12, 1)) == 0
+
+    @pytest.mark.asyncio
+    async def test_list_transactions_brief(self, async_db):
+        """Test listing brief transaction tuples asynchronously."""
+        await async_db.add_transaction(
+            date=datetime(2024, 11, 15),
+            description="Async brief",
+            amount=42.0,
+            category="Bills",
+        )
+
+        brief = await async_db.list_transactions_brief(
+            datetime(2024, 11, 1), datetime(2024, 11, 30)
+        )
+
+        assert [tuple(row) for row in brief] == [
+            (datetime(2024, 11, 15), 42.0, "Async brief", "Bills")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_session_scope_shared_across_reads(self, async_db):
+        """Test that reads inside session_scope reuse the caller's session."""
+        await async_db.add_transaction(
+            date=datetime(2024, 11, 15),
+            description="Scoped",
+            amount=10.0,
+            transaction_id="SCOPED1",
+        )
+
+        async with async_db.session_scope() as session:
+            with patch.object(async_db, "async_session") as mock_session:
+                assert len(await async_db.get_all_transactions(session=session)) == 1
+                assert await async_db.transaction_exists("SCOPED1", session=session)
+                assert await async_db.existing_ids(["SCOPED1"], session=session) == {
+                    "SCOPED1"
+                }
+                summary = await async_db.get_transaction_summary(session=session)
+                assert summary["transaction_count"] == 1
+                assert await async_db.get_all_categories(session=session) == []
+                mock_session.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_initialize_is_idempotent(self, async_db):
         """Test that initialize can be called multiple times safely."""
@@ -380,6 +1235,19 @@ class TestAsyncDatabaseManager:
         assert categories[1].name == "Food"
         assert categories[2].name == "Transport"
 
+    @pytest.mark.asyncio
+    async def test_categories_cached_until_changed(self, async_db):
+        """Test that async category reads are cached and refreshed after changes."""
+        await async_db.add_category("Food")
+        assert [c.name for c in await async_db.get_all_categories()] == ["Food"]
+
+        with patch.object(async_db, "async_session") as mock_session:
+            assert await async_db.get_category_by_name("Food") is not None
+            mock_session.assert_not_called()
+
+        await async_db.delete_category("Food")
+        assert await async_db.get_all_categories() == []
+
     @pytest.mark.asyncio
     async def test_get_category_by_name(self, async_db):
         """Test retrieving a category by name asynchronously."""
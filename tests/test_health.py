@@ -1,14 +1,21 @@
 """Tests for the health check module."""
 
+import asyncio
 import json
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from treecko_bot.health import (
+    HEALTH_CACHE_TTL_SECONDS,
     HEALTH_PATH,
+    NOT_FOUND_BODY,
+    HealthCheckHandler,
+    HealthCheckHTTPServer,
     HealthCheckServer,
     HealthStatus,
 )
@@ -58,6 +65,94 @@ class TestHealthStatus:
         assert result["checks"]["database"] == "not_connected"
 
 
+class TestHealthStatusJson:
+    """Tests for HealthStatus.to_json_bytes."""
+
+    @pytest.mark.parametrize(
+        ("status", "database_connected", "sheets_configured"),
+        [
+            ("healthy", True, True),
+            ("degraded", False, False),
+            ('quoted "status"', True, False),
+        ],
+    )
+    def test_matches_to_dict(self, status, database_connected, sheets_configured):
+        """Test that the encoded document equals the dict representation."""
+        health = HealthStatus(
+            status=status,
+            timestamp=1731666600.123456,
+            database_connected=database_connected,
+            sheets_configured=sheets_configured,
+        )
+
+        assert json.loads(health.to_json_bytes()) == health.to_dict()
+
+
+class TestHealthCheckHandler:
+    """Tests for HealthCheckHandler responses."""
+
+    def test_not_found_written_in_one_call(self):
+        """Test that the status line, headers and body go out in one write."""
+        handler = HealthCheckHandler.__new__(HealthCheckHandler)
+        handler.wfile = MagicMock()
+
+        handler._send_not_found()
+
+        handler.wfile.write.assert_called_once_with(
+            b"HTTP/1.0 404 Not Found\r\n"
+            b"Content-Type: application/json\r\n"
+            b"Connection: close\r\n"
+            + f"Content-Length: {len(NOT_FOUND_BODY)}\r\n\r\n".encode()
+            + NOT_FOUND_BODY
+        )
+
+
+class TestHealthCheckHTTPServer:
+    """Tests for HealthCheckHTTPServer response caching."""
+
+    @pytest.fixture
+    def calls(self):
+        """Collect the timestamps of health callback invocations."""
+        return []
+
+    @pytest.fixture
+    def http_server(self, calls):
+        """Create an unstarted server whose callback records each call."""
+        def callback():
+            calls.append(time.time())
+            return HealthStatus(
+                status="healthy",
+                timestamp=calls[-1],
+                database_connected=True,
+                sheets_configured=False,
+            )
+
+        server = HealthCheckHTTPServer(
+            ("127.0.0.1", 0), HealthCheckHandler, health_callback=callback
+        )
+        yield server
+        server.server_close()
+
+    def test_body_reused_within_ttl(self, http_server, calls):
+        """Test that the encoded body is reused until the TTL expires."""
+        first = http_server.get_health_body()
+        second = http_server.get_health_body()
+
+        assert second is first
+        assert len(calls) == 1
+        assert json.loads(first)["status"] == "healthy"
+
+    def test_body_refreshed_after_ttl(self, http_server, calls):
+        """Test that the callback runs again once the TTL has passed."""
+        http_server.get_health_body()
+        later = time.monotonic() + HEALTH_CACHE_TTL_SECONDS + 1
+
+        with patch("treecko_bot.health.time.monotonic", return_value=later):
+            http_server.get_health_body()
+
+        assert len(calls) == 2
+
+
 class TestHealthCheckServer:
     """Tests for HealthCheckServer."""
 
@@ -123,6 +218,57 @@ class TestHealthCheckServer:
         finally:
             server.stop()
 
+    def test_server_content_length_matches_body(self, health_callback):
+        """Test that Content-Length is the byte length of each response body."""
+        server = HealthCheckServer(port=19881, health_callback=health_callback)
+        server.start()
+        time.sleep(0.1)
+
+        try:
+            url = f"http://localhost:19881{HEALTH_PATH}"
+            with urllib.request.urlopen(url, timeout=2) as response:
+                body = response.read()
+                assert int(response.headers["Content-Length"]) == len(body)
+
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen("http://localhost:19881/unknown", timeout=2)
+            body = exc_info.value.read()
+            assert body == NOT_FOUND_BODY
+            assert int(exc_info.value.headers["Content-Length"]) == len(body)
+        finally:
+            server.stop()
+
+    def test_server_handles_concurrent_requests(self):
+        """Test that a slow health check does not block other requests."""
+        def slow_callback():
+            time.sleep(0.3)
+            return HealthStatus(
+                status="healthy",
+                timestamp=time.time(),
+                database_connected=True,
+                sheets_configured=False,
+            )
+
+        server = HealthCheckServer(port=19882, health_callback=slow_callback)
+        server.start()
+        time.sleep(0.1)
+
+        def fetch(_):
+            url = f"http://localhost:19882{HEALTH_PATH}"
+            with urllib.request.urlopen(url, timeout=2) as response:
+                return response.status
+
+        try:
+            started = time.monotonic()
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                statuses = list(executor.map(fetch, range(3)))
+            elapsed = time.monotonic() - started
+
+            assert statuses == [200, 200, 200]
+            assert elapsed < 0.8
+        finally:
+            server.stop()
+
     def test_server_without_callback(self):
         """Test server works without a callback (uses defaults)."""
         server = HealthCheckServer(port=19879, health_callback=None)
@@ -160,3 +306,63 @@ class TestHealthCheckServer:
                 assert data["checks"]["database"] == "not_connected"
         finally:
             server.stop()
+
+
+class TestHealthCheckServerAsync:
+    """Tests for HealthCheckServer on the asyncio event loop."""
+
+    @staticmethod
+    async def fetch(port: int, path: str) -> bytes:
+        """Send a GET request and return the raw response."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        return response
+
+    @pytest.mark.asyncio
+    async def test_health_endpoint(self):
+        """Test that the health endpoint is served from the event loop."""
+        server = HealthCheckServer(port=19883)
+        await server.start_async()
+
+        try:
+            response = await self.fetch(19883, HEALTH_PATH)
+        finally:
+            await server.stop_async()
+
+        head, _, body = response.partition(b"\r\n\r\n")
+        assert head.startswith(b"HTTP/1.0 200 OK")
+        assert f"Content-Length: {len(body)}".encode() in head
+        assert json.loads(body)["status"] == "healthy"
+
+    @pytest.mark.asyncio
+    async def test_unknown_path_returns_404(self):
+        """Test that other paths get the pre-encoded 404 response."""
+        server = HealthCheckServer(port=19884)
+        await server.start_async()
+
+        try:
+            response = await self.fetch(19884, "/unknown")
+        finally:
+            await server.stop_async()
+
+        assert response.startswith(b"HTTP/1.0 404 Not Found")
+        assert response.endswith(NOT_FOUND_BODY)
+
+    @pytest.mark.asyncio
+    async def test_connection_closed_and_awaited(self):
+        """Test that each connection's transport is closed before the handler returns."""
+        server = HealthCheckServer()
+        reader = MagicMock()
+        reader.readuntil = AsyncMock(return_value=b"GET /unknown HTTP/1.1\r\n\r\n")
+        writer = MagicMock()
+        writer.drain = AsyncMock()
+        writer.wait_closed = AsyncMock(side_effect=ConnectionResetError)
+
+        await server._handle_connection(reader, writer)
+
+        writer.close.assert_called_once()
+        writer.wait_closed.assert_awaited_once()
@@ -3,6 +3,8 @@
 import json
 import logging
 import os
+import sys
+from unittest.mock import patch
 
 import pytest
 
@@ -12,7 +14,9 @@ from treecko_bot.logging_config import (
     LOG_FORMAT_TEXT,
     LOG_LEVEL_ENV,
     StructuredJsonFormatter,
+    StructuredLogger,
     StructuredTextFormatter,
+    dumps_json,
     get_log_format,
     get_log_level,
     get_logger,
@@ -106,6 +110,25 @@ class TestGetLogFormat:
             del os.environ[LOG_FORMAT_ENV]
 
 
+class TestDumpsJson:
+    """Tests for dumps_json function."""
+
+    def test_returns_utf8_bytes(self):
+        """Test that output is UTF-8 encoded JSON without ASCII escapes."""
+        output = dumps_json({"message": "Café", "count": 2})
+
+        assert isinstance(output, bytes)
+        assert "Café".encode() in output
+        assert json.loads(output) == {"message": "Café", "count": 2}
+
+    def test_falls_back_to_stdlib_json(self):
+        """Test serialization when orjson is not installed."""
+        with patch("treecko_bot.logging_config.orjson", None):
+            output = dumps_json({"message": "Café"})
+
+        assert output == '{"message": "Café"}'.encode()
+
+
 class TestStructuredJsonFormatter:
     """Tests for StructuredJsonFormatter."""
 
@@ -137,6 +160,26 @@ class TestStructuredJsonFormatter:
         assert data["logger"] == "test.logger"
         assert data["message"] == "Test message"
 
+    def test_format_timestamp_from_record(self, formatter, log_record):
+        """Test that the timestamp is the record's creation time in UTC."""
+        # 2024-11-15 10:30:00.250 UTC
+        log_record.created, log_record.msecs = 1731666600.25, 250.0
+
+        data = json.loads(formatter.format(log_record))
+        assert data["timestamp"] == "2024-11-15T10:30:00.250+00:00"
+
+        log_record.created, log_record.msecs = 1731666601.0, 0.0
+        data = json.loads(formatter.format(log_record))
+        assert data["timestamp"] == "2024-11-15T10:30:01.000+00:00"
+
+    def test_format_timestamp_with_datefmt(self, log_record):
+        """Test that a custom datefmt goes through the stdlib formatTime."""
+        formatter = StructuredJsonFormatter(datefmt="%Y/%m/%d")
+        log_record.created = 1731666600.25
+
+        data = json.loads(formatter.format(log_record))
+        assert data["timestamp"] == "2024/11/15"
+
     def test_format_with_extra_data(self, formatter):
         """Test formatting with extra data."""
         record = logging.LogRecord(
@@ -203,6 +246,31 @@ class TestStructuredTextFormatter:
         assert "INFO" in output
         assert "Test message" in output
 
+    def test_format_matches_stdlib_layout(self, formatter):
+        """Test that output matches the equivalent %-style stdlib formatter."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        record = logging.LogRecord(
+            name="test.logger",
+            level=logging.ERROR,
+            pathname="test.py",
+            lineno=10,
+            msg="Failed %s",
+            args=("upload",),
+            exc_info=exc_info,
+        )
+        stdlib = logging.Formatter(
+            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+
+        output = formatter.format(record)
+
+        assert output == stdlib.format(record)
+        assert output.endswith("ValueError: boom")
+
     def test_format_with_extra_data(self, formatter):
         """Test formatting with extra data."""
         record = logging.LogRecord(
@@ -268,6 +336,35 @@ class TestSetupLogging:
         handler = root.handlers[0]
         assert isinstance(handler.formatter, StructuredTextFormatter)
 
+    def test_setup_logging_is_idempotent(self):
+        """Test that repeated calls keep a single, reused console handler."""
+        if LOG_FORMAT_ENV in os.environ:
+            del os.environ[LOG_FORMAT_ENV]
+
+        setup_logging()
+        root = logging.getLogger()
+        handler = root.handlers[0]
+
+        setup_logging()
+
+        assert root.handlers == [handler]
+
+    def test_setup_logging_switches_format(self):
+        """Test that a changed LOG_FORMAT reconfigures the existing handler."""
+        if LOG_FORMAT_ENV in os.environ:
+            del os.environ[LOG_FORMAT_ENV]
+        setup_logging()
+
+        os.environ[LOG_FORMAT_ENV] = "json"
+        try:
+            setup_logging()
+        finally:
+            del os.environ[LOG_FORMAT_ENV]
+
+        root = logging.getLogger()
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0].formatter, StructuredJsonFormatter)
+
 
 class TestGetLogger:
     """Tests for get_logger function."""
@@ -283,3 +380,43 @@ class TestGetLogger:
         logger1 = get_logger("test.same")
         logger2 = get_logger("test.same")
         assert logger1 is logger2
+
+    def test_get_logger_returns_structured_logger(self):
+        """Test that loggers support structured kwargs without setup_logging()."""
+        logger = get_logger("test.structured_before_setup")
+        assert isinstance(logger, StructuredLogger)
+        logger.warning("Structured message", user_id=123)
+
+
+class TestStructuredLogger:
+    """Tests for StructuredLogger."""
+
+    @pytest.fixture
+    def captured(self):
+        """Capture records emitted by a structured logger."""
+        records: list[logging.LogRecord] = []
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger = get_logger("test.structured_capture")
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+        yield logger, records
+        logger.removeHandler(handler)
+
+    def test_plain_message_skips_extra_data(self, captured):
+        """Test that messages without kwargs carry no extra_data."""
+        logger, records = captured
+
+        logger.info("Plain message")
+
+        assert not hasattr(records[0], "extra_data")
+        assert records[0].funcName == "test_plain_message_skips_extra_data"
+
+    def test_kwargs_become_extra_data(self, captured):
+        """Test that keyword arguments are attached as extra_data."""
+        logger, records = captured
+
+        logger.error("Failed", user_id=7)
+
+        assert records[0].extra_data == {"user_id": 7}
+        assert records[0].funcName == "test_kwargs_become_extra_data"
@@ -1,10 +1,52 @@
 """Tests for the PDF parser module."""
 
-
 import pytest
 
 from treecko_bot.pdf_parser import MercadoPagoPDFParser
 
+RECEIPT_LINES = [
+    "Comprobante de pago",
+    "Pagaste $ 1.500,50",
+    "15 de noviembre de 2024",
+    "Operacion: 12345678901234",
+    "Vendedor: Mi Tienda Favorita",
+    "Detalle: Compra en tienda online",
+]
+
+
+def build_pdf(pages: list[list[str]]) -> bytes:
+    """Build a minimal PDF with one Helvetica text line per entry."""
+    page_count = len(pages)
+    font_ref = 3 + 2 * page_count
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        "<< /Type /Pages /Kids [{}] /Count {} >>".format(
+            " ".join(f"{3 + 2 * i} 0 R" for i in range(page_count)), page_count
+        ),
+    ]
+    for i, lines in enumerate(pages):
+        content = "BT /F1 12 Tf 50 750 Td 14 TL\n"
+        content += "".join(f"({line}) Tj T*\n" for line in lines) + "ET"
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Contents {4 + 2 * i} 0 R /Resources << /Font << /F1 {font_ref} 0 R >> >> >>"
+        )
+        objects.append(f"<< /Length {len(content)} >>\nstream\n{content}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    output = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    output += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n"
+    ).encode()
+    return output
+
 
 @pytest.fixture
 def parser():
@@ -12,6 +54,12 @@ def parser():
     return MercadoPagoPDFParser()
 
 
+@pytest.fixture
+def receipt_pdf():
+    """Create a single-page MercadoPago-like receipt PDF."""
+    return build_pdf([RECEIPT_LINES])
+
+
 def test_parse_spanish_date(parser):
     """Test parsing Spanish format dates."""
     text = "15 de noviembre de 2024"
@@ -58,6 +106,18 @@ def test_determine_income_type(parser):
     assert tx.transaction_type == "income"
 
 
+def test_determine_income_type_accented_uppercase(parser):
+    """Test that income keywords match regardless of case and accents."""
+    for text in ("DEPÓSITO $100.00", "Deposito $100.00"):
+        assert parser._parse_text(text).transaction_type == "income"
+
+
+def test_income_keyword_wins_over_earlier_expense_keyword(parser):
+    """Test that an income keyword anywhere marks the receipt as income."""
+    text = "Transferencia\nRecibiste $100.00"
+    assert parser._parse_text(text).transaction_type == "income"
+
+
 def test_extract_description(parser):
     """Test extracting description from text."""
     text = "Detalle: Compra en tienda online"
@@ -65,9 +125,72 @@ def test_extract_description(parser):
     assert "Compra en tienda online" in tx.description
 
 
+def test_extract_description_falls_back_to_second_line(parser):
+    """Test that the second non-blank line is used without a description label."""
+    text = "MercadoPago\n\n  Transferencia recibida  \nOtra linea\nMas texto"
+    tx = parser._parse_text(text)
+    assert tx.description == "Transferencia recibida"
+
+
 def test_extract_merchant(parser):
     """Test extracting merchant from text."""
     text = "Vendedor: Mi Tienda Favorita"
     tx = parser._parse_text(text)
     assert tx.merchant is not None
     assert "Mi Tienda" in tx.merchant
+
+
+def test_parse_from_bytes(parser, receipt_pdf):
+    """Test parsing a PDF receipt from bytes."""
+    tx = parser.parse_from_bytes(receipt_pdf)
+    assert tx.transaction_id == "12345678901234"
+    assert tx.amount == 1500.50
+    assert tx.transaction_type == "expense"
+    assert tx.date.year == 2024
+    assert tx.date.month == 11
+    assert tx.date.day == 15
+    assert tx.description == "Compra en tienda online"
+    assert "\r" not in tx.raw_text
+
+
+def test_parse_from_path(parser, receipt_pdf, tmp_path):
+    """Test parsing a PDF receipt from a file path."""
+    pdf_path = tmp_path / "receipt.pdf"
+    pdf_path.write_bytes(receipt_pdf)
+
+    tx = parser.parse(str(pdf_path))
+    assert tx.transaction_id == "12345678901234"
+
+
+def test_parse_from_bytes_invalid_pdf(parser):
+    """Test that unreadable PDF content raises ValueError."""
+    with pytest.raises(ValueError):
+        parser.parse_from_bytes(b"%PDF-1.4 not really a pdf")
+
+
+def test_parse_from_bytes_without_text(parser):
+    """Test that a PDF without any text raises ValueError."""
+    with pytest.raises(ValueError, match="Could not extract text"):
+        parser.parse_from_bytes(build_pdf([[]]))
+
+
+def test_parse_reads_pages_after_required_fields(parser):
+    """Test that later pages still inform the type and raw text."""
+    pdf = build_pdf([RECEIPT_LINES[:4], ["Recibiste el dinero", "Terminos y condiciones"]])
+
+    tx = parser.parse_from_bytes(pdf)
+
+    assert tx.transaction_id == "12345678901234"
+    assert tx.transaction_type == "income"
+    assert "Terminos" in tx.raw_text
+
+
+def test_parse_fields_split_across_pages(parser):
+    """Test that fields split across pages are still extracted."""
+    pdf = build_pdf([RECEIPT_LINES[:3], RECEIPT_LINES[3:]])
+
+    tx = parser.parse_from_bytes(pdf)
+
+    assert tx.transaction_id == "12345678901234"
+    assert tx.amount == 1500.50
+    assert tx.date.year == 2024
@@ -1,8 +1,13 @@
 """Tests for the rate limiter module."""
 
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
 import pytest
 
-from treecko_bot.rate_limiter import RateLimitConfig, RateLimiter
+from treecko_bot.rate_limiter import RateLimitConfig, RateLimiter, TokenBucketRateLimiter
 
 
 class TestRateLimitConfig:
@@ -24,6 +29,10 @@ class TestRateLimitConfig:
         assert config.window_seconds == 30
         assert config.enabled is False
 
+    def test_uses_slots(self):
+        """Test that configs carry no per-instance __dict__."""
+        assert not hasattr(RateLimitConfig(), "__dict__")
+
 
 class TestRateLimiter:
     """Tests for RateLimiter."""
@@ -191,6 +200,24 @@ class TestRateLimiter:
         assert rate_limiter.get_remaining_requests(user_id) == 1
         assert rate_limiter.get_retry_after(user_id) == 0.0
 
+    def test_disabled_rate_limiter_keeps_no_state(self):
+        """Test that a disabled limiter neither reads the clock nor stores users."""
+        get_time = MagicMock(return_value=0.0)
+        rate_limiter = RateLimiter(config=RateLimitConfig(enabled=False), get_time=get_time)
+
+        rate_limiter.record_request(123)
+        rate_limiter.check_and_record(123)
+
+        assert rate_limiter._user_requests == {}
+        get_time.assert_not_called()
+
+    def test_record_logged_at_debug(self, rate_limiter, caplog):
+        """Test that recorded requests are still logged when DEBUG is enabled."""
+        with caplog.at_level(logging.DEBUG, logger="treecko_bot.rate_limiter"):
+            rate_limiter.check_and_record(123)
+
+        assert "request_count=1" in caplog.text
+
     def test_sliding_window(self, rate_limiter, mock_time):
         """Test that old requests are cleared in sliding window."""
         get_time, advance = mock_time
@@ -215,3 +242,171 @@ class TestRateLimiter:
         # First 2 requests should have expired
         assert not rate_limiter.is_rate_limited(user_id)
         assert rate_limiter.get_remaining_requests(user_id) == 2  # 1 request still in window
+
+    def test_timestamps_bounded_by_max_requests(self, rate_limiter, mock_time):
+        """Test that a user never holds more than max_requests timestamps."""
+        _, advance = mock_time
+        user_id = 123
+
+        for _ in range(10):
+            rate_limiter.record_request(user_id)
+            advance(1)
+
+        timestamps = rate_limiter._user_requests[user_id]
+        assert list(timestamps) == [7.0, 8.0, 9.0]
+        assert rate_limiter.get_retry_after(user_id) == pytest.approx(57.0)
+
+    def test_check_and_record_reads_clock_once(self):
+        """Test that check_and_record reads the time once per call."""
+        get_time = MagicMock(return_value=100.0)
+        limiter = RateLimiter(
+            config=RateLimitConfig(max_requests=1, window_seconds=60), get_time=get_time
+        )
+
+        assert limiter.check_and_record(123)
+        assert not limiter.check_and_record(123)
+        assert get_time.call_count == 2
+
+    def test_reads_do_not_create_state(self, rate_limiter):
+        """Test that checking unknown users stores nothing."""
+        assert not rate_limiter.is_rate_limited(456)
+        assert rate_limiter.get_remaining_requests(456) == 3
+        assert rate_limiter.get_retry_after(456) == 0.0
+        assert rate_limiter._user_requests == {}
+
+    def test_idle_users_collected(self, rate_limiter, mock_time, monkeypatch):
+        """Test that periodic sweeps drop users idle for a whole window."""
+        monkeypatch.setattr("treecko_bot.rate_limiter.GC_INTERVAL_OPERATIONS", 3)
+        _, advance = mock_time
+
+        rate_limiter.record_request(1)
+        rate_limiter.record_request(2)
+        advance(61)
+        rate_limiter.record_request(3)  # Third record triggers the sweep
+
+        assert set(rate_limiter._user_requests) == {3}
+
+    def test_default_clock_is_monotonic(self):
+        """Test that the window is measured with a monotonic clock by default."""
+        limiter = RateLimiter()
+
+        assert limiter._get_time is time.monotonic
+
+    def test_users_without_requests_skip_clock(self):
+        """Test that checks for users without requests do not read the time."""
+        get_time = MagicMock(return_value=0.0)
+        limiter = RateLimiter(config=RateLimitConfig(max_requests=3), get_time=get_time)
+
+        assert not limiter.is_rate_limited(123)
+        assert limiter.get_remaining_requests(123) == 3
+        assert limiter.get_retry_after(123) == 0.0
+        get_time.assert_not_called()
+
+    def test_concurrent_check_and_record(self):
+        """Test that concurrent callers never exceed the limit."""
+        limiter = RateLimiter(
+            config=RateLimitConfig(max_requests=50, window_seconds=60), get_time=lambda: 0.0
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: limiter.check_and_record(123), range(400)))
+
+        assert sum(results) == 50
+
+
+class TestTokenBucketRateLimiter:
+    """Tests for TokenBucketRateLimiter."""
+
+    @pytest.fixture
+    def mock_time(self):
+        """Create a mock time function."""
+        current_time = [0.0]
+
+        def get_time():
+            return current_time[0]
+
+        def advance(seconds):
+            current_time[0] += seconds
+
+        return get_time, advance
+
+    @pytest.fixture
+    def rate_limiter(self, mock_time):
+        """Create a token bucket limiter refilling one token every 20 seconds."""
+        get_time, _ = mock_time
+        config = RateLimitConfig(max_requests=3, window_seconds=60)
+        return TokenBucketRateLimiter(config=config, get_time=get_time)
+
+    def test_burst_up_to_max_requests(self, rate_limiter):
+        """Test that a full bucket allows max_requests requests, then blocks."""
+        for _ in range(3):
+            assert rate_limiter.check_and_record(123)
+
+        assert not rate_limiter.check_and_record(123)
+        assert rate_limiter.is_rate_limited(123)
+        assert rate_limiter.get_remaining_requests(123) == 0
+
+    def test_tokens_refill_over_time(self, rate_limiter, mock_time):
+        """Test that tokens refill at max_requests per window."""
+        _, advance = mock_time
+        for _ in range(3):
+            rate_limiter.check_and_record(123)
+
+        assert rate_limiter.get_retry_after(123) == pytest.approx(20.0)
+
+        advance(20)
+        assert rate_limiter.get_retry_after(123) == 0.0
+        assert rate_limiter.check_and_record(123)
+        assert not rate_limiter.check_and_record(123)
+
+        advance(600)
+        assert rate_limiter.get_remaining_requests(123) == 3
+
+    def test_reads_do_not_create_state(self, rate_limiter):
+        """Test that checking unknown users stores nothing."""
+        assert not rate_limiter.is_rate_limited(456)
+        assert rate_limiter.get_retry_after(456) == 0.0
+        assert rate_limiter.get_remaining_requests(456) == 3
+        assert rate_limiter._buckets == {}
+
+    def test_reset_user(self, rate_limiter):
+        """Test that resetting a user refills their bucket."""
+        for _ in range(3):
+            rate_limiter.record_request(123)
+        assert rate_limiter.is_rate_limited(123)
+
+        rate_limiter.reset_user(123)
+
+        assert not rate_limiter.is_rate_limited(123)
+
+    def test_disabled(self):
+        """Test that a disabled limiter allows everything."""
+        limiter = TokenBucketRateLimiter(
+            config=RateLimitConfig(max_requests=1, enabled=False)
+        )
+
+        for _ in range(5):
+            assert limiter.check_and_record(123)
+        assert limiter.get_retry_after(123) == 0.0
+
+    def test_idle_buckets_collected(self, rate_limiter, mock_time, monkeypatch):
+        """Test that periodic sweeps drop buckets that have fully refilled."""
+        monkeypatch.setattr("treecko_bot.rate_limiter.GC_INTERVAL_OPERATIONS", 2)
+        _, advance = mock_time
+
+        rate_limiter.check_and_record(1)
+        advance(60)
+        rate_limiter.check_and_record(2)
+
+        assert set(rate_limiter._buckets) == {2}
+
+    def test_concurrent_check_and_record(self):
+        """Test that concurrent callers never exceed the limit."""
+        limiter = TokenBucketRateLimiter(
+            config=RateLimitConfig(max_requests=50, window_seconds=60), get_time=lambda: 0.0
+        )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: limiter.check_and_record(123), range(400)))
+
+        assert sum(results) == 50
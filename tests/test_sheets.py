@@ -6,7 +6,12 @@ from unittest.mock import MagicMock, patch
 import gspread
 import pytest
 
-from treecko_bot.sheets import GoogleSheetsManager
+from treecko_bot.sheets import (
+    SHEET_HEADERS,
+    TIMESTAMP_FORMAT,
+    GoogleSheetsManager,
+    _load_client,
+)
 
 
 @pytest.fixture
@@ -18,6 +23,14 @@ def sheets_manager():
     )
 
 
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Keep authorized clients from leaking between tests."""
+    _load_client.cache_clear()
+    yield
+    _load_client.cache_clear()
+
 class TestGoogleSheetsManagerConfiguration:
     """Tests for GoogleSheetsManager configuration."""
 
@@ -81,6 +94,8 @@ class TestGoogleSheetsManagerAddTransaction:
         assert row_data[4] == "Test Merchant"  # merchant
         assert row_data[5] == "Shopping"  # category
         assert row_data[6] == "TX123"  # transaction_id
+        created_at = datetime.strptime(row_data[7], TIMESTAMP_FORMAT)
+        assert abs((datetime.now() - created_at).total_seconds()) < 5  # created_at
 
     def test_add_transaction_with_optional_fields_empty(self, sheets_manager):
         """Test adding a transaction with optional fields empty."""
@@ -120,6 +135,52 @@ class TestGoogleSheetsManagerAddTransaction:
         assert result is False
 
 
+class TestGoogleSheetsManagerAppendRows:
+    """Tests for GoogleSheetsManager.append_rows method."""
+
+    def test_append_rows_appends_in_one_call(self, sheets_manager):
+        """Test that multiple rows are appended with a single API call."""
+        mock_worksheet = MagicMock()
+        rows = [
+            sheets_manager.build_row(
+                date=datetime(2024, 11, 15, 10, 30, 0),
+                description=f"Transaction {i}",
+                amount=10.0 * i,
+                transaction_type="expense",
+            )
+            for i in range(3)
+        ]
+
+        with patch.object(
+            sheets_manager, "_get_or_create_worksheet", return_value=mock_worksheet
+        ):
+            result = sheets_manager.append_rows(rows)
+
+        assert result is True
+        mock_worksheet.append_rows.assert_called_once_with(
+            rows, value_input_option="RAW"
+        )
+        mock_worksheet.append_row.assert_not_called()
+
+    def test_append_rows_empty_is_noop(self, sheets_manager):
+        """Test that an empty batch does not touch the worksheet."""
+        with patch.object(sheets_manager, "_get_or_create_worksheet") as mock_get:
+            assert sheets_manager.append_rows([]) is True
+
+        mock_get.assert_not_called()
+
+    def test_append_rows_failure(self, sheets_manager):
+        """Test handling failure when appending rows."""
+        with patch.object(
+            sheets_manager,
+            "_get_or_create_worksheet",
+            side_effect=Exception("Connection error"),
+        ):
+            result = sheets_manager.append_rows([["row"]])
+
+        assert result is False
+
+
 class TestGoogleSheetsManagerClientAndSheet:
     """Tests for GoogleSheetsManager client and sheet methods."""
 
@@ -141,6 +202,18 @@ class TestGoogleSheetsManagerClientAndSheet:
         assert client1 is client2
         mock_creds.assert_called_once()  # Should only be called once due to caching
 
+    def test_get_client_shared_between_managers(self):
+        """Test that managers with the same credentials share one client."""
+        with patch(
+            "treecko_bot.sheets.Credentials.from_service_account_file"
+        ) as mock_creds:
+            with patch("treecko_bot.sheets.gspread.authorize", return_value=MagicMock()):
+                first = GoogleSheetsManager("test_credentials.json", "sheet_a")._get_client()
+                second = GoogleSheetsManager("test_credentials.json", "sheet_b")._get_client()
+
+        assert first is second
+        mock_creds.assert_called_once()
+
     def test_get_sheet_opens_by_key(self, sheets_manager):
         """Test that _get_sheet opens the spreadsheet by key."""
         mock_client = MagicMock()
@@ -165,6 +238,17 @@ class TestGoogleSheetsManagerClientAndSheet:
         assert worksheet is mock_worksheet
         mock_sheet.worksheet.assert_called_once_with("Transactions")
 
+    def test_get_or_create_worksheet_cached(self, sheets_manager):
+        """Test that a worksheet is looked up once and then reused."""
+        mock_sheet = MagicMock()
+
+        with patch.object(sheets_manager, "_get_sheet", return_value=mock_sheet):
+            first = sheets_manager._get_or_create_worksheet("Transactions")
+            second = sheets_manager._get_or_create_worksheet("Transactions")
+
+        assert second is first
+        mock_sheet.worksheet.assert_called_once_with("Transactions")
+
     def test_get_or_create_worksheet_creates_new(self, sheets_manager):
         """Test creating a new worksheet when it doesn't exist."""
         mock_sheet = MagicMock()
@@ -177,5 +261,14 @@ class TestGoogleSheetsManagerClientAndSheet:
 
         assert worksheet is mock_new_worksheet
         mock_sheet.add_worksheet.assert_called_once()
-        mock_new_worksheet.update.assert_called_once()  # Headers should be added
-        mock_new_worksheet.format.assert_called_once()  # Headers should be formatted
+        # Headers are written and bolded in a single batch update
+        mock_sheet.batch_update.assert_called_once()
+        request = mock_sheet.batch_update.call_args[0][0]["requests"][0]["updateCells"]
+        assert request["start"]["sheetId"] == mock_new_worksheet.id
+        cells = request["rows"][0]["values"]
+        assert [cell["userEnteredValue"]["stringValue"] for cell in cells] == list(
+            SHEET_HEADERS
+        )
+        assert all(cell["userEnteredFormat"]["textFormat"]["bold"] for cell in cells)
+        mock_new_worksheet.update.assert_not_called()
+        mock_new_worksheet.format.assert_not_called()